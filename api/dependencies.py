@@ -0,0 +1,27 @@
+"""Shared FastAPI dependencies."""
+
+from typing import AsyncIterator
+
+from fastapi import Request
+
+from src.data_sources.aggregator import DataAggregator
+
+
+async def get_aggregator(request: Request) -> AsyncIterator[DataAggregator]:
+    """
+    Yield the app-wide DataAggregator created in the lifespan handler.
+
+    Its HTTP clients and in-memory caches (e.g. Redfin market data) then
+    outlive a single request. Outside the lifespan (e.g. a TestClient not
+    used as a context manager) a throwaway aggregator is created and closed.
+    """
+    shared = getattr(request.app.state, "aggregator", None)
+    if shared is not None:
+        yield shared
+        return
+
+    aggregator = DataAggregator()
+    try:
+        yield aggregator
+    finally:
+        await aggregator.close()
@@ -1,9 +1,24 @@
 """Job handlers for background tasks."""
 
 import asyncio
+from datetime import datetime
 from typing import Optional
 from src.db.sqlite_repository import SQLiteRepository
-from src.db.models import JobDB
+from src.db.models import JobDB, MarketDB, SavedPropertyDB
+from src.data_sources.aggregator import DataAggregator
+from src.data_sources.fema_flood import FEMAFloodClient
+from src.data_sources.geocoder import get_geocoder
+from src.data_sources.walkscore import WalkScoreClient
+from src.models.financials import LoanTerms
+from src.models.market import MarketMetrics
+from api.services.property_analysis import (
+    FLOOD_ZONE_TTL,
+    WALK_SCORE_TTL,
+    deal_snapshot,
+    location_field_fresh,
+    rebuild_and_analyze,
+    skip_step,
+)
 
 
 def get_fresh_repository() -> SQLiteRepository:
@@ -11,6 +26,27 @@ def get_fresh_repository() -> SQLiteRepository:
     return SQLiteRepository()
 
 
+async def _drain_job_progress(queue: asyncio.Queue, repo: SQLiteRepository, job_id: str) -> None:
+    """
+    Write progress events from an agent to the job row until a None arrives.
+
+    Events that pile up while a write is in flight are coalesced, so a burst
+    of updates costs one commit carrying the latest one.
+    """
+    while True:
+        events = [await queue.get()]
+        while not queue.empty():
+            events.append(queue.get_nowait())
+
+        done = None in events
+        latest = [event for event in events if event is not None]
+        if latest:
+            _, percent, message = latest[-1]
+            repo.update_job_status(job_id, status="running", message=message, progress=percent)
+        if done:
+            return
+
+
 class JobHandlers:
     """Handlers for different job types."""
 
@@ -22,9 +58,6 @@ class JobHandlers:
         Payload:
             market_id: str - The market ID to enrich
         """
-        from src.data_sources.aggregator import DataAggregator
-        from src.models.market import MarketMetrics
-        from src.db.models import MarketDB
 
         market_id = job.payload.get("market_id")
         if not market_id:
@@ -81,7 +114,7 @@ class JobHandlers:
                     repo.session.refresh(market_db)
 
                     # Update database
-                    market_db.market_data = market_model.model_dump(mode="json")
+                    market_db.market_data = market_model.model_dump()
                     market_db.overall_score = metrics.overall_score
                     market_db.cash_flow_score = metrics.cash_flow_score
                     market_db.growth_score = metrics.growth_score
@@ -125,16 +158,6 @@ class JobHandlers:
             down_payment_pct: float - Down payment percentage (default 0.25)
             interest_rate: float - Interest rate (default 0.07)
         """
-        from src.data_sources.walkscore import WalkScoreClient
-        from src.data_sources.fema_flood import FEMAFloodClient
-        from src.data_sources.geocoder import get_geocoder
-        from src.data_sources.aggregator import DataAggregator
-        from src.models.property import Property, PropertyType, PropertyStatus
-        from src.models.deal import Deal, DealPipeline
-        from src.models.financials import Financials, LoanTerms
-        from src.models.market import MarketMetrics
-        from src.db.models import SavedPropertyDB
-        from datetime import datetime
 
         property_id = job.payload.get("property_id")
         if not property_id:
@@ -163,61 +186,70 @@ class JobHandlers:
                 progress=5,
             )
 
-            # Step 1: Geocode if needed
+            # Steps 1-3: Geocode (if needed), rent estimate, and market data.
+            # These are independent of each other, so run them concurrently.
+            repo.update_job_status(
+                job.id,
+                status="running",
+                message="Geocoding and fetching rent estimate and market data...",
+                progress=10,
+            )
             latitude = prop.latitude
             longitude = prop.longitude
+            needs_geocode = latitude is None or longitude is None
 
-            if not latitude or not longitude:
-                repo.update_job_status(
-                    job.id, status="running", message="Geocoding address...", progress=10
+            geo_task = (
+                get_geocoder().geocode(
+                    address=prop.address, city=prop.city, state=prop.state
                 )
-                geocoder = get_geocoder()
-                try:
-                    geo_result = await geocoder.geocode(
-                        address=prop.address, city=prop.city, state=prop.state
-                    )
-                    if geo_result:
-                        latitude = geo_result.latitude
-                        longitude = geo_result.longitude
-                        prop.latitude = latitude
-                        prop.longitude = longitude
-                except Exception as e:
-                    print(f"[Job] Geocoding failed: {e}")
-                    enrichment_errors.append(f"Geocoding: {e}")
-
-            # Step 2: Get rent estimate (doesn't require coordinates)
-            repo.update_job_status(
-                job.id, status="running", message="Getting rent estimate...", progress=20
+                if needs_geocode
+                else skip_step()
             )
             estimated_rent = prop.estimated_rent
-            if not estimated_rent:
-                try:
-                    rent_result = await aggregator.rentcast.get_rent_estimate(
-                        address=prop.address,
-                        city=prop.city,
-                        state=prop.state,
-                        zip_code=prop.zip_code,
-                        bedrooms=prop.bedrooms or 3,
-                        bathrooms=prop.bathrooms or 2.0,
-                        sqft=prop.sqft,
-                    )
-                    if rent_result:
-                        estimated_rent = rent_result.rent_estimate
-                        prop.estimated_rent = estimated_rent
-                        print(f"[Job] Got rent estimate: ${estimated_rent}/mo")
-                except Exception as e:
-                    print(f"[Job] Rent estimate failed: {e}")
-                    enrichment_errors.append(f"Rent estimate: {e}")
-
-            # Step 3: Get market data
-            repo.update_job_status(
-                job.id, status="running", message="Fetching market data...", progress=35
+            rent_task = (
+                aggregator.rentcast.get_rent_estimate(
+                    address=prop.address,
+                    city=prop.city,
+                    state=prop.state,
+                    zip_code=prop.zip_code,
+                    bedrooms=prop.bedrooms or 3,
+                    bathrooms=prop.bathrooms or 2.0,
+                    sqft=prop.sqft,
+                )
+                if not estimated_rent
+                else skip_step()
             )
+            geo_result, rent_result, market_data = await asyncio.gather(
+                geo_task,
+                rent_task,
+                aggregator.get_market_data(prop.city, prop.state),
+                return_exceptions=True,
+            )
+
+            if isinstance(geo_result, Exception):
+                print(f"[Job] Geocoding failed: {geo_result}")
+                enrichment_errors.append(f"Geocoding: {geo_result}")
+            elif geo_result:
+                latitude = geo_result.latitude
+                longitude = geo_result.longitude
+                prop.latitude = latitude
+                prop.longitude = longitude
+
+            if isinstance(rent_result, Exception):
+                print(f"[Job] Rent estimate failed: {rent_result}")
+                enrichment_errors.append(f"Rent estimate: {rent_result}")
+            elif rent_result:
+                estimated_rent = rent_result.rent_estimate
+                prop.estimated_rent = estimated_rent
+                print(f"[Job] Got rent estimate: ${estimated_rent}/mo")
+
             market = None
             market_detail = None
-            try:
-                market_data = await aggregator.get_market_data(prop.city, prop.state)
-                if market_data:
+            if isinstance(market_data, Exception):
+                print(f"[Job] Market data failed: {market_data}")
+                enrichment_errors.append(f"Market data: {market_data}")
+            elif market_data:
+                try:
                     market = market_data.to_market()
                     if market:
                         metrics = MarketMetrics.from_market(market)
@@ -231,153 +263,101 @@ class JobHandlers:
                             "growth_score": metrics.growth_score,
                         }
                         print(f"[Job] Got market data: {market.name} (score: {metrics.overall_score})")
-            except Exception as e:
-                print(f"[Job] Market data failed: {e}")
-                enrichment_errors.append(f"Market data: {e}")
+                except Exception as e:
+                    print(f"[Job] Market data failed: {e}")
+                    enrichment_errors.append(f"Market data: {e}")
 
             # Step 4: Run deal analysis
             repo.update_job_status(
                 job.id, status="running", message="Analyzing financials...", progress=50
             )
 
-            # Map property type
-            type_mapping = {
-                "single_family_home": PropertyType.SFH,
-                "single_family": PropertyType.SFH,
-                "condo": PropertyType.CONDO,
-                "townhouse": PropertyType.TOWNHOUSE,
-                "duplex": PropertyType.DUPLEX,
-                "triplex": PropertyType.TRIPLEX,
-                "fourplex": PropertyType.FOURPLEX,
-                "multi_family": PropertyType.MULTI_FAMILY,
-            }
-            prop_type = type_mapping.get(
-                (prop.property_type or "single_family").lower().replace("-", "_").replace(" ", "_"),
-                PropertyType.SFH
-            )
-
-            # Create Property model
-            property_model = Property(
-                id=prop.id,
-                address=prop.address,
-                city=prop.city,
-                state=prop.state,
-                zip_code=prop.zip_code,
+            deal, _ = rebuild_and_analyze(
+                prop,
+                market=market,
+                estimated_rent=estimated_rent,
                 latitude=latitude,
                 longitude=longitude,
-                list_price=prop.list_price,
-                property_type=prop_type,
-                bedrooms=prop.bedrooms or 3,
-                bathrooms=prop.bathrooms or 2.0,
-                sqft=prop.sqft,
-                status=PropertyStatus.ACTIVE,
-                source=prop.source,
-                source_url=prop.source_url,
-                estimated_rent=estimated_rent,
-            )
-
-            # Create Deal and run analysis
-            deal = Deal(
-                id=f"deal_{prop.id}",
-                property=property_model,
-                market=market,
-                pipeline_status=DealPipeline.NEW,
-                first_seen=datetime.now(),
-            )
-
-            deal.financials = Financials(
-                property_id=property_model.id,
-                purchase_price=prop.list_price,
-                estimated_rent=estimated_rent or 0,
                 loan=LoanTerms(
                     down_payment_pct=down_payment_pct,
                     interest_rate=interest_rate,
                 ),
             )
-
-            deal.analyze()
-
-            # Update property with analysis results
-            prop.overall_score = deal.score.overall_score if deal.score else None
-            prop.financial_score = deal.score.financial_score if deal.score else None
-            prop.market_score = deal.score.market_score if deal.score else None
-            prop.risk_score = deal.score.risk_score if deal.score else None
-            prop.liquidity_score = deal.score.liquidity_score if deal.score else None
-
-            if deal.financials:
-                prop.cash_flow = deal.financials.monthly_cash_flow
-
-            if deal.financial_metrics:
-                prop.cash_on_cash = deal.financial_metrics.cash_on_cash_return
-                prop.cap_rate = deal.financial_metrics.cap_rate
-
-            # Store full analysis data
-            prop.analysis_data = {
-                "property": property_model.model_dump(mode="json"),
-                "financials": deal.financials.model_dump(mode="json") if deal.financials else None,
-                "financial_metrics": deal.financial_metrics.model_dump(mode="json") if deal.financial_metrics else None,
-                "score": deal.score.model_dump(mode="json") if deal.score else None,
-                "pros": deal.pros,
-                "cons": deal.cons,
-                "market": market_detail,
-            }
-            prop.last_analyzed = datetime.utcnow()
+            now = datetime.utcnow()
+            prop.last_analyzed = now
 
             print(f"[Job] Analysis complete: score={prop.overall_score}, CoC={prop.cash_on_cash}")
 
-            # Step 5: Get location data (Walk Score, Flood Zone)
-            location_data = prop.location_data or {}
+            # Step 5: Get location data (Walk Score, Flood Zone), skipping
+            # providers whose stored fields are still within their TTL
+            location_data = dict(prop.location_data or {})
+            fetch_walkscore = not location_field_fresh(location_data, "walk_score", WALK_SCORE_TTL, now)
+            fetch_flood = not location_field_fresh(location_data, "flood_zone", FLOOD_ZONE_TTL, now)
 
-            if latitude and longitude:
-                # Walk Score
+            if latitude is not None and longitude is not None and (fetch_walkscore or fetch_flood):
+                # Walk Score and Flood Zone are independent - fetch concurrently
                 repo.update_job_status(
-                    job.id, status="running", message="Fetching Walk Score...", progress=65
+                    job.id, status="running", message="Fetching Walk Score and flood zone...", progress=65
                 )
+                walkscore = WalkScoreClient()
+                fema = FEMAFloodClient()
                 try:
-                    walkscore = WalkScoreClient()
-                    score_data = await walkscore.get_scores(
-                        address=prop.address,
-                        latitude=latitude,
-                        longitude=longitude,
+                    score_data, flood_data = await asyncio.gather(
+                        walkscore.get_scores(
+                            address=prop.full_address,
+                            latitude=latitude,
+                            longitude=longitude,
+                        ) if fetch_walkscore else skip_step(),
+                        fema.get_flood_zone(
+                            latitude=latitude, longitude=longitude
+                        ) if fetch_flood else skip_step(),
+                        return_exceptions=True,
                     )
-                    if score_data:
-                        location_data["walk_score"] = score_data.walk_score
-                        location_data["walk_description"] = score_data.walk_description
-                        location_data["transit_score"] = score_data.transit_score
-                        location_data["transit_description"] = score_data.transit_description
-                        location_data["bike_score"] = score_data.bike_score
-                        location_data["bike_description"] = score_data.bike_description
-                        print(f"[Job] Walk Score: {score_data.walk_score}")
+                finally:
                     await walkscore.close()
-                except Exception as e:
-                    print(f"[Job] Walk Score failed: {e}")
-                    enrichment_errors.append(f"Walk Score: {e}")
-
-                # Flood Zone
-                repo.update_job_status(
-                    job.id, status="running", message="Checking flood zone...", progress=80
-                )
-                try:
-                    fema = FEMAFloodClient()
-                    flood_data = await fema.get_flood_zone(latitude=latitude, longitude=longitude)
-                    if flood_data:
-                        location_data["flood_zone"] = {
-                            "zone": flood_data.flood_zone,
-                            "zone_subtype": flood_data.zone_subtype,
-                            "risk_level": flood_data.risk_level,
-                            "description": flood_data.description,
-                            "requires_insurance": flood_data.requires_insurance,
-                            "annual_chance": flood_data.annual_chance,
-                        }
-                        print(f"[Job] Flood zone: {flood_data.flood_zone} ({flood_data.risk_level})")
                     await fema.close()
-                except Exception as e:
-                    print(f"[Job] Flood zone failed: {e}")
-                    enrichment_errors.append(f"Flood zone: {e}")
+
+                if isinstance(score_data, Exception):
+                    print(f"[Job] Walk Score failed: {score_data}")
+                    enrichment_errors.append(f"Walk Score: {score_data}")
+                elif score_data:
+                    location_data.update({
+                        "walk_score": score_data.walk_score,
+                        "walk_description": score_data.walk_description,
+                        "transit_score": score_data.transit_score,
+                        "transit_description": score_data.transit_description,
+                        "bike_score": score_data.bike_score,
+                        "bike_description": score_data.bike_description,
+                        "walk_score_fetched_at": now.isoformat(),
+                    })
+                    print(f"[Job] Walk Score: {score_data.walk_score}")
+
+                if isinstance(flood_data, Exception):
+                    print(f"[Job] Flood zone failed: {flood_data}")
+                    enrichment_errors.append(f"Flood zone: {flood_data}")
+                elif flood_data:
+                    location_data["flood_zone"] = {
+                        "zone": flood_data.flood_zone,
+                        "zone_subtype": flood_data.zone_subtype,
+                        "risk_level": flood_data.risk_level,
+                        "description": flood_data.description,
+                        "requires_insurance": flood_data.requires_insurance,
+                        "annual_chance": flood_data.annual_chance,
+                    }
+                    location_data["flood_zone_fetched_at"] = now.isoformat()
+                    print(f"[Job] Flood zone: {flood_data.flood_zone} ({flood_data.risk_level})")
+
+            # Store the analysis snapshot, dumped in a single pass and assigned
+            # once so the JSON column is serialized only on commit
+            analysis_data = deal_snapshot(deal)
+            analysis_data["market"] = market_detail
+            if enrichment_errors:
+                analysis_data["enrichment_errors"] = enrichment_errors
+            prop.analysis_data = analysis_data
 
             # Update location data
             prop.location_data = location_data
-            prop.location_data_fetched = datetime.utcnow()
+            prop.location_data_fetched = now
 
             # Update pipeline status
             prop.pipeline_status = "analyzed"
@@ -419,8 +399,6 @@ class JobHandlers:
             property_id: str - The property ID to research
         """
         from src.agents.due_diligence import DueDiligenceAgent
-        from src.db.models import SavedPropertyDB
-        from datetime import datetime
 
         property_id = job.payload.get("property_id")
         if not property_id:
@@ -453,32 +431,29 @@ class JobHandlers:
             prop.due_diligence_report = initial_report
             repo.session.commit()
 
-            # Run the due diligence agent
-            repo.update_job_status(
-                job.id,
-                status="running",
-                message="AI is researching property history...",
-                progress=20,
-            )
-
-            agent = DueDiligenceAgent()
-            result = await agent.run(
-                property_address=prop.address,
-                city=prop.city,
-                state=prop.state,
-                zip_code=prop.zip_code or "",
-                property_id=property_id,
-                list_price=prop.list_price,
-                property_type=prop.property_type,
-                year_built=prop.year_built,
-            )
-
-            repo.update_job_status(
-                job.id,
-                status="running",
-                message="Compiling research findings...",
-                progress=90,
-            )
+            # Run the due diligence agent; its progress is written as it
+            # arrives by a separate task
+            progress = asyncio.Queue()
+            writer = asyncio.create_task(_drain_job_progress(progress, repo, job.id))
+            agent = DueDiligenceAgent(progress=progress)
+            try:
+                result = await agent.run(
+                    property_address=prop.address,
+                    city=prop.city,
+                    state=prop.state,
+                    zip_code=prop.zip_code or "",
+                    property_id=property_id,
+                    list_price=prop.list_price,
+                    property_type=prop.property_type,
+                    year_built=prop.year_built,
+                )
+            finally:
+                progress.put_nowait(None)
+                await agent.aclose()
+                # A failed progress write must not hide the research outcome
+                (writer_result,) = await asyncio.gather(writer, return_exceptions=True)
+                if isinstance(writer_result, Exception):
+                    print(f"[Job] Progress updates failed for {prop.address}: {writer_result}")
 
             # Store the report in the database
             # Refresh the property in case it was modified
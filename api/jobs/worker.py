@@ -3,7 +3,9 @@
 import asyncio
 import signal
 import sys
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 # Load environment variables from .env file
@@ -11,9 +13,33 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.db.sqlite_repository import get_repository
-from src.db.models import JobDB
+from src.db.models import JobDB, get_database_path
 from api.jobs.handlers import execute_job
 
+# Idle workers back off up to this many seconds between queue checks
+MAX_POLL_INTERVAL = 30.0
+
+# The worker runs in its own process, so the API signals new jobs by
+# touching this file; an idle worker checks its mtime every
+# WAKE_CHECK_INTERVAL seconds while backing off on queue queries
+JOB_WAKE_FILE = Path(get_database_path()).parent / "jobs.wake"
+WAKE_CHECK_INTERVAL = 0.5
+
+
+def _wake_file_mtime() -> int:
+    try:
+        return JOB_WAKE_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def notify_job_enqueued() -> None:
+    """Tell idle workers (in any process) to check the queue now."""
+    try:
+        JOB_WAKE_FILE.touch()
+    except OSError as e:
+        print(f"Warning: Could not signal job worker: {e}")
+
 
 class JobWorker:
     """
@@ -32,6 +58,21 @@ class JobWorker:
         self.stuck_timeout_minutes = stuck_timeout_minutes
         self.running = False
         self._current_job: Optional[JobDB] = None
+        self._wake_mtime = 0
+
+    async def _wait_for_wakeup(self, timeout: float) -> bool:
+        """Sleep up to `timeout` seconds. Returns True early if a job was enqueued."""
+        deadline = time.monotonic() + timeout
+        while self.running:
+            mtime = _wake_file_mtime()
+            if mtime != self._wake_mtime:
+                self._wake_mtime = mtime
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(WAKE_CHECK_INTERVAL, remaining))
+        return False
 
     def _cleanup_stuck_jobs(self):
         """Check for and fail any jobs that have been running too long."""
@@ -43,6 +84,7 @@ class JobWorker:
     async def run(self):
         """Main worker loop."""
         self.running = True
+        self._wake_mtime = _wake_file_mtime()
         print(f"[Worker] Starting job worker (poll interval: {self.poll_interval}s)")
 
         # Handle graceful shutdown
@@ -53,27 +95,37 @@ class JobWorker:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
+        interval = self.poll_interval
         while self.running:
+            found = False
             try:
                 # Check for stuck jobs before processing new ones
                 self._cleanup_stuck_jobs()
-                await self.process_next_job()
+                found = await self.process_next_job()
             except Exception as e:
                 print(f"[Worker] Error in main loop: {e}")
 
-            if self.running:
-                await asyncio.sleep(self.poll_interval)
+            if found:
+                # Drain the queue without sleeping between jobs
+                interval = self.poll_interval
+                continue
+
+            # Back off while idle; an enqueue from the API wakes us early
+            if await self._wait_for_wakeup(interval):
+                interval = self.poll_interval
+            else:
+                interval = min(interval * 1.5, MAX_POLL_INTERVAL)
 
         print("[Worker] Worker stopped")
 
-    async def process_next_job(self):
-        """Pick up and process the next pending job."""
+    async def process_next_job(self) -> bool:
+        """Pick up and process the next pending job. Returns False if the queue was empty."""
         repo = get_repository()
 
         # Get next pending job
         job = repo.get_pending_job()
         if not job:
-            return
+            return False
 
         self._current_job = job
         print(f"[Worker] Processing job {job.id[:8]}... ({job.job_type})")
@@ -127,6 +179,8 @@ class JobWorker:
         finally:
             self._current_job = None
 
+        return True
+
     async def run_once(self):
         """Process all pending jobs once, then exit."""
         print("[Worker] Running single pass...")
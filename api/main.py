@@ -7,11 +7,16 @@ from typing import Optional
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI, HTTPException, Query
+import httpx
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from api.routes import markets, deals, analysis, import_property, properties, saved, jobs, financing, contacts, financing_desk, pipeline, comps, neighborhood, risk
 from api.models import HealthResponse
+from api.responses import ORJSONResponse
+from src.data_sources.aggregator import DataAggregator
 from src.db import init_database, get_repository
 
 
@@ -28,9 +33,20 @@ async def lifespan(app: FastAPI):
         print(f"Database initialized: {stats['total_markets']} markets, {stats['total_saved_properties']} saved properties")
     except Exception as e:
         print(f"Database initialization warning: {e}")
+    # Shared connection pool for outbound API calls, so TLS sessions to
+    # Walk Score, RapidAPI and FEMA are reused across requests
+    app.state.http = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+    # One aggregator for all requests (see api.dependencies.get_aggregator),
+    # so its clients' connection pools and caches are reused
+    app.state.aggregator = DataAggregator()
     yield
     # Shutdown
     print("Shutting down API...")
+    await app.state.aggregator.close()
+    await app.state.http.aclose()
 
 
 app = FastAPI(
@@ -38,8 +54,21 @@ app = FastAPI(
     description="API for sourcing, analyzing, and ranking real estate investment opportunities",
     version="1.0.0",
     lifespan=lifespan,
+    # No global ORJSONResponse: routes with a response_model are serialized
+    # straight to bytes by Pydantic, which a custom default class disables.
+    # Routes returning large plain payloads can return api.responses.ORJSONResponse.
 )
 
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """Render HTTP error bodies with orjson (same shape as FastAPI's default)."""
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
+
 # CORS configuration - allow all origins for API access
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,39 @@
+"""Custom response classes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    FastAPI's own ORJSONResponse is deprecated in newer releases, so this
+    keeps the same behavior without the deprecation warning. Unknown types
+    fall back to str().
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+class PydanticResponse(Response):
+    """
+    JSON response rendered straight from a Pydantic model.
+
+    Returning this from a route bypasses FastAPI's response_model validation,
+    so use it for models built from already-typed data (e.g. DB rows via
+    model_construct). Keep response_model on the route for the OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode()
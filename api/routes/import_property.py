@@ -1,9 +1,11 @@
 """API endpoints for property import and data enrichment."""
 
+import hashlib
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field, HttpUrl
 
+from api.dependencies import get_aggregator
 from api.models import DealDetail, FinancialDetail, PropertyDetail
 from api.routes.deals import (
     _property_to_detail,
@@ -96,7 +98,7 @@ class MacroDataResponse(BaseModel):
 
 
 @router.post("/url", response_model=ImportUrlResponse)
-async def import_from_url(request: ImportUrlRequest):
+async def import_from_url(request: ImportUrlRequest, aggregator: DataAggregator = Depends(get_aggregator)):
     """
     Import a property from a Zillow, Redfin, or Realtor.com URL.
 
@@ -105,7 +107,6 @@ async def import_from_url(request: ImportUrlRequest):
     """
     import asyncio
 
-    aggregator = DataAggregator()
     warnings = []
 
     try:
@@ -142,7 +143,7 @@ async def import_from_url(request: ImportUrlRequest):
         if deal.financials:
             deal.financials.loan.down_payment_pct = request.down_payment_pct
             deal.financials.loan.interest_rate = request.interest_rate
-            deal.analyze()
+            deal.analyze(force=True)
 
         # Check for warnings
         if not deal.property.estimated_rent:
@@ -200,12 +201,10 @@ async def import_from_url(request: ImportUrlRequest):
             status_code=500,
             detail=f"Import failed: {str(e)}"
         )
-    finally:
-        await aggregator.close()
 
 
 @router.post("/parsed", response_model=ImportUrlResponse)
-async def import_parsed_property(request: ImportParsedRequest):
+async def import_parsed_property(request: ImportParsedRequest, aggregator: DataAggregator = Depends(get_aggregator)):
     """
     Analyze a pre-parsed property.
 
@@ -219,7 +218,6 @@ async def import_parsed_property(request: ImportParsedRequest):
     from src.agents.deal_analyzer import DealAnalyzerAgent
     from src.data_sources.geocoder import get_geocoder
 
-    aggregator = DataAggregator()
     warnings = []
 
     try:
@@ -259,7 +257,8 @@ async def import_parsed_property(request: ImportParsedRequest):
             warnings.append(f"Geocoding failed: {str(e)}")
 
         # Create property object from parsed data
-        prop_id = f"{request.source}_{hash(request.source_url or request.address) % 1000000:06d}"
+        key = (request.source_url or request.address).encode()
+        prop_id = f"{request.source}_{hashlib.blake2b(key, digest_size=8).hexdigest()}"
         property = Property(
             id=prop_id,
             address=request.address,
@@ -379,72 +378,58 @@ async def import_parsed_property(request: ImportParsedRequest):
             status_code=500,
             detail=f"Analysis failed: {str(e)}"
         )
-    finally:
-        await aggregator.close()
 
 
 @router.post("/rent-estimate", response_model=RentEstimateResponse)
-async def get_rent_estimate(request: RentEstimateRequest):
+async def get_rent_estimate(request: RentEstimateRequest, aggregator: DataAggregator = Depends(get_aggregator)):
     """
     Get rent estimate for a property.
 
     Uses RentCast API if available, falls back to HUD Fair Market Rents.
     """
-    aggregator = DataAggregator()
-
-    try:
-        estimate = await aggregator.rentcast.get_rent_estimate(
-            address=request.address,
-            city=request.city,
-            state=request.state,
-            zip_code=request.zip_code,
-            bedrooms=request.bedrooms,
-            bathrooms=request.bathrooms,
-            sqft=request.sqft,
-        )
-
-        if not estimate:
-            raise HTTPException(
-                status_code=404,
-                detail="Could not estimate rent for this property"
-            )
-
-        return RentEstimateResponse(
-            estimate=estimate.rent_estimate,
-            low=estimate.rent_low,
-            high=estimate.rent_high,
-            source="rentcast" if aggregator.rentcast.has_api_key else "hud_fmr",
-            comp_count=estimate.comp_count,
+    estimate = await aggregator.rentcast.get_rent_estimate(
+        address=request.address,
+        city=request.city,
+        state=request.state,
+        zip_code=request.zip_code,
+        bedrooms=request.bedrooms,
+        bathrooms=request.bathrooms,
+        sqft=request.sqft,
+    )
+
+    if not estimate:
+        raise HTTPException(
+            status_code=404,
+            detail="Could not estimate rent for this property"
         )
 
-    finally:
-        await aggregator.close()
+    return RentEstimateResponse(
+        estimate=estimate.rent_estimate,
+        low=estimate.rent_low,
+        high=estimate.rent_high,
+        source="rentcast" if aggregator.rentcast.has_api_key else "hud_fmr",
+        comp_count=estimate.comp_count,
+    )
 
 
 @router.get("/macro", response_model=MacroDataResponse)
-async def get_macro_data():
+async def get_macro_data(aggregator: DataAggregator = Depends(get_aggregator)):
     """
     Get current macro economic indicators.
 
     Includes mortgage rates, unemployment, and treasury yields.
     """
-    aggregator = DataAggregator()
+    data = await aggregator.get_current_rates()
 
-    try:
-        data = await aggregator.get_current_rates()
-
-        return MacroDataResponse(
-            mortgage_30yr=data.get("mortgage_30yr"),
-            mortgage_15yr=data.get("mortgage_15yr"),
-            mortgage_5yr_arm=data.get("mortgage_5yr_arm"),
-            unemployment=data.get("unemployment"),
-            fed_funds_rate=data.get("fed_funds_rate"),
-            treasury_10yr=data.get("treasury_10yr"),
-            updated=data.get("updated", ""),
-        )
-
-    finally:
-        await aggregator.close()
+    return MacroDataResponse(
+        mortgage_30yr=data.get("mortgage_30yr"),
+        mortgage_15yr=data.get("mortgage_15yr"),
+        mortgage_5yr_arm=data.get("mortgage_5yr_arm"),
+        unemployment=data.get("unemployment"),
+        fed_funds_rate=data.get("fed_funds_rate"),
+        treasury_10yr=data.get("treasury_10yr"),
+        updated=data.get("updated", ""),
+    )
 
 
 class IncomeDataResponse(BaseModel):
@@ -551,59 +536,53 @@ async def get_income_affordability(
 
 
 @router.get("/market-data/{city}/{state}")
-async def get_enriched_market_data(city: str, state: str):
+async def get_enriched_market_data(city: str, state: str, aggregator: DataAggregator = Depends(get_aggregator)):
     """
     Get enriched market data from all sources.
 
     Combines Redfin, FRED, and HUD data.
     """
-    aggregator = DataAggregator()
-
-    try:
-        data = await aggregator.get_market_data(city, state)
+    data = await aggregator.get_market_data(city, state)
 
-        if not data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No market data found for {city}, {state}"
-            )
-
-        return {
-            "market_id": data.market_id,
-            "name": data.name,
-            "state": data.state,
-            "pricing": {
-                "median_sale_price": data.median_sale_price,
-                "median_list_price": data.median_list_price,
-                "price_per_sqft": data.price_per_sqft,
-                "price_change_yoy": data.price_change_yoy,
-            },
-            "inventory": {
-                "homes_sold": data.homes_sold,
-                "inventory": data.inventory,
-                "months_of_supply": data.months_of_supply,
-                "days_on_market": data.days_on_market,
-            },
-            "rates": {
-                "mortgage_30yr": data.mortgage_rate_30yr,
-                "mortgage_15yr": data.mortgage_rate_15yr,
-                "unemployment": data.unemployment_rate,
-            },
-            "rents": {
-                "fmr_1br": data.fmr_1br,
-                "fmr_2br": data.fmr_2br,
-                "fmr_3br": data.fmr_3br,
-            },
-            "metrics": {
-                "rent_to_price_ratio": data.rent_to_price_ratio,
-                "cap_rate_estimate": data.cap_rate_estimate,
-            },
-            "data_sources": data.data_sources,
-            "last_updated": data.last_updated.isoformat() if data.last_updated else None,
-        }
+    if not data:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No market data found for {city}, {state}"
+        )
 
-    finally:
-        await aggregator.close()
+    return {
+        "market_id": data.market_id,
+        "name": data.name,
+        "state": data.state,
+        "pricing": {
+            "median_sale_price": data.median_sale_price,
+            "median_list_price": data.median_list_price,
+            "price_per_sqft": data.price_per_sqft,
+            "price_change_yoy": data.price_change_yoy,
+        },
+        "inventory": {
+            "homes_sold": data.homes_sold,
+            "inventory": data.inventory,
+            "months_of_supply": data.months_of_supply,
+            "days_on_market": data.days_on_market,
+        },
+        "rates": {
+            "mortgage_30yr": data.mortgage_rate_30yr,
+            "mortgage_15yr": data.mortgage_rate_15yr,
+            "unemployment": data.unemployment_rate,
+        },
+        "rents": {
+            "fmr_1br": data.fmr_1br,
+            "fmr_2br": data.fmr_2br,
+            "fmr_3br": data.fmr_3br,
+        },
+        "metrics": {
+            "rent_to_price_ratio": data.rent_to_price_ratio,
+            "cap_rate_estimate": data.cap_rate_estimate,
+        },
+        "data_sources": data.data_sources,
+        "last_updated": data.last_updated.isoformat() if data.last_updated else None,
+    }
 
 
 class WalkScoreResponse(BaseModel):
@@ -7,6 +7,7 @@ from datetime import datetime
 
 from src.db.sqlite_repository import get_repository
 from src.db.models import MarketDB
+from api.jobs.worker import notify_job_enqueued
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
@@ -148,6 +149,7 @@ async def create_job(request: JobCreate):
         payload=request.payload,
         priority=request.priority,
     )
+    notify_job_enqueued()
 
     return job_to_response(job)
 
@@ -198,6 +200,9 @@ async def enqueue_market_jobs(request: EnqueueMarketsRequest):
         )
         job_ids.append(job.id)
 
+    if job_ids:
+        notify_job_enqueued()
+
     return EnqueueMarketsResponse(
         jobs_created=len(job_ids),
         job_ids=job_ids,
@@ -298,6 +303,7 @@ async def enqueue_property_job(request: EnqueuePropertyRequest):
         },
         priority=1,  # Higher priority than market jobs
     )
+    notify_job_enqueued()
 
     return EnqueuePropertyResponse(
         property_id=property_id,
@@ -366,6 +372,7 @@ async def enqueue_due_diligence(property_id: str):
         payload={"property_id": property_id},
         priority=2,  # High priority - user explicitly requested this
     )
+    notify_job_enqueued()
 
     return DueDiligenceJobResponse(
         property_id=property_id,
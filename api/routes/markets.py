@@ -40,10 +40,10 @@ async def list_markets(
 
     # Sort by requested field
     sort_keys = {
-        "overall": lambda x: x["overall_score"],
-        "cash_flow": lambda x: x["cash_flow_score"],
-        "growth": lambda x: x["growth_score"],
-        "affordability": lambda x: x["metrics"].affordability_score,
+        "overall": lambda x: x.overall_score,
+        "cash_flow": lambda x: x.cash_flow_score,
+        "growth": lambda x: x.growth_score,
+        "affordability": lambda x: x.metrics.affordability_score,
     }
 
     if sort_by in sort_keys:
@@ -52,8 +52,8 @@ async def list_markets(
     # Convert to response models
     markets = []
     for i, m in enumerate(markets_data[:limit]):
-        market = m["market"]
-        metrics = m["metrics"]
+        market = m.market
+        metrics = m.metrics
 
         markets.append(MarketSummary(
             id=market.id,
@@ -1,13 +1,70 @@
 """API routes for saved properties and database operations."""
 
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+import hashlib
+import logging
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from typing import Optional, List
-from datetime import datetime
-
+from datetime import datetime, timedelta
+
+from api.dependencies import get_aggregator
+from api.jobs.worker import notify_job_enqueued
+from api.responses import ORJSONResponse, PydanticResponse
+from api.services.property_analysis import (
+    FLOOD_ZONE_TTL,
+    WALK_SCORE_TTL,
+    deal_snapshot,
+    location_field_fresh,
+    rebuild_and_analyze,
+    skip_step,
+)
 from src.db import get_repository, SQLiteRepository
+from src.db.models import MarketDB, SavedPropertyDB
+from src.data_sources.aggregator import DataAggregator
+from src.data_sources.fema_flood import FEMAFloodClient
+from src.data_sources.geocoder import get_geocoder
+from src.data_sources.hud_fmr import EMBEDDED_FMR_DATA
+from src.data_sources.metros import search_metros as local_search
+from src.data_sources.us_real_estate import USRealEstateClient
+from src.data_sources.walkscore import WalkScoreClient
+from src.models.financials import Financials, LoanTerms
+from src.models.market import Market, MarketMetrics
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+# Location data younger than this is served as-is by refresh-location
+LOCATION_DATA_FRESH_FOR = timedelta(hours=24)
+
+# Max concurrent market fetches in refresh-all
+REFRESH_ALL_CONCURRENCY = 8
+
+# Rendered /markets responses are reused for this many seconds. Route
+# mutations clear the cache; worker-side enrichment shows up within the TTL.
+MARKETS_CACHE_TTL_SECONDS = 60.0
+_markets_cache: dict[tuple, tuple[float, bytes]] = {}
+
+
+def _invalidate_markets_cache() -> None:
+    """Drop cached market list responses after a market changes."""
+    _markets_cache.clear()
+
+
+def _cached_markets_response(key: tuple, load) -> Response:
+    """Serve a market list from the cache, rendering it via `load` on a miss."""
+    now = time.monotonic()
+    cached = _markets_cache.get(key)
+    if cached and now - cached[0] < MARKETS_CACHE_TTL_SECONDS:
+        return Response(content=cached[1], media_type="application/json")
+
+    response = ORJSONResponse([market_response_dict(m) for m in load()])
+    _markets_cache[key] = (now, response.body)
+    return response
 
 
 # ==================== Response Models ====================
@@ -99,6 +156,14 @@ class SavedPropertyResponse(BaseModel):
     updated_at: datetime
 
 
+# Defaults for optional SavedPropertyResponse fields, used by list views
+_PROPERTY_RESPONSE_DEFAULTS = {
+    name: field.default
+    for name, field in SavedPropertyResponse.model_fields.items()
+    if not field.is_required()
+}
+
+
 class AddMarketRequest(BaseModel):
     name: str
     state: str
@@ -185,52 +250,119 @@ class MetroSuggestion(BaseModel):
 # ==================== Helper Functions ====================
 
 def build_property_response(p) -> SavedPropertyResponse:
-    """Build SavedPropertyResponse from a SavedPropertyDB model."""
-    return SavedPropertyResponse(
+    """
+    Build SavedPropertyResponse from a SavedPropertyDB model.
+
+    Column values are already typed, so the model is constructed without
+    validation. Attributes are read through the ORM (not __dict__) because
+    routes call this right after a commit, which expires loaded values.
+    """
+    return SavedPropertyResponse.model_construct(
         id=p.id,
         address=p.address,
         city=p.city,
         state=p.state,
         zip_code=p.zip_code,
-        latitude=getattr(p, 'latitude', None),
-        longitude=getattr(p, 'longitude', None),
+        latitude=p.latitude,
+        longitude=p.longitude,
         list_price=p.list_price,
         estimated_rent=p.estimated_rent,
         bedrooms=p.bedrooms,
         bathrooms=p.bathrooms,
         sqft=p.sqft,
         property_type=p.property_type,
-        year_built=getattr(p, 'year_built', None),
-        days_on_market=getattr(p, 'days_on_market', None),
-        description=getattr(p, 'description', None),
+        year_built=p.year_built,
+        days_on_market=p.days_on_market,
+        description=p.description,
         source=p.source,
         source_url=p.source_url,
-        photos=getattr(p, 'photos', None),
+        photos=p.photos,
         overall_score=p.overall_score,
-        financial_score=getattr(p, 'financial_score', None),
-        market_score=getattr(p, 'market_score', None),
-        risk_score=getattr(p, 'risk_score', None),
-        liquidity_score=getattr(p, 'liquidity_score', None),
+        financial_score=p.financial_score,
+        market_score=p.market_score,
+        risk_score=p.risk_score,
+        liquidity_score=p.liquidity_score,
         cash_flow=p.cash_flow,
         cash_on_cash=p.cash_on_cash,
         cap_rate=p.cap_rate,
-        location_data=getattr(p, 'location_data', None),
-        custom_scenarios=getattr(p, 'custom_scenarios', None),
-        analysis_data=getattr(p, 'analysis_data', None),
+        location_data=p.location_data,
+        custom_scenarios=p.custom_scenarios,
+        analysis_data=p.analysis_data,
         pipeline_status=p.pipeline_status or "analyzed",
         is_favorite=p.is_favorite or False,
         notes=p.notes,
-        tags=getattr(p, 'tags', None),
-        last_analyzed=getattr(p, 'last_analyzed', None),
-        location_data_fetched=getattr(p, 'location_data_fetched', None),
+        tags=p.tags,
+        last_analyzed=p.last_analyzed,
+        location_data_fetched=p.location_data_fetched,
         created_at=p.created_at,
         updated_at=p.updated_at,
     )
 
 
+def _property_etag(p) -> Optional[str]:
+    """Weak ETag for a saved property; updated_at changes on every write to the row."""
+    return f'W/"{p.updated_at.timestamp()}"' if p.updated_at else None
+
+
+def _etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """Whether the client's If-None-Match already names this ETag."""
+    header = request.headers.get("if-none-match")
+    if not etag or not header:
+        return False
+    return header.strip() == "*" or etag in (tag.strip() for tag in header.split(","))
+
+
+def property_response(p) -> Response:
+    """Serialize a saved property, tagged with its ETag."""
+    etag = _property_etag(p)
+    return PydanticResponse(build_property_response(p), headers={"ETag": etag} if etag else None)
+
+
+def saved_property_list_item(p) -> dict:
+    """
+    Build a list-view SavedPropertyResponse dict from a SavedPropertyDB model.
+
+    List endpoints return these via ORJSONResponse, skipping per-row model
+    validation; fields not shown in list views are left at their defaults.
+    Values are read from the instance __dict__, which the list query has just
+    populated, skipping the ORM attribute descriptors. Don't use this on rows
+    expired by a commit (see build_property_response).
+    """
+    d = p.__dict__
+    return {
+        **_PROPERTY_RESPONSE_DEFAULTS,
+        "id": d["id"],
+        "address": d["address"],
+        "city": d["city"],
+        "state": d["state"],
+        "zip_code": d.get("zip_code"),
+        "list_price": d.get("list_price"),
+        "estimated_rent": d.get("estimated_rent"),
+        "bedrooms": d.get("bedrooms"),
+        "bathrooms": d.get("bathrooms"),
+        "sqft": d.get("sqft"),
+        "property_type": d.get("property_type"),
+        "source": d.get("source"),
+        "source_url": d.get("source_url"),
+        "overall_score": d.get("overall_score"),
+        "cash_flow": d.get("cash_flow"),
+        "cash_on_cash": d.get("cash_on_cash"),
+        "cap_rate": d.get("cap_rate"),
+        "pipeline_status": d.get("pipeline_status") or "analyzed",
+        "is_favorite": d.get("is_favorite") or False,
+        "notes": d.get("notes"),
+        "created_at": d.get("created_at"),
+        "updated_at": d.get("updated_at"),
+    }
+
+
 def build_market_response(m) -> MarketResponse:
     """Build MarketResponse from a MarketDB model, computing scores on-demand from market_data."""
-    from src.models.market import Market, MarketMetrics, MarketTrend
+    return MarketResponse.model_construct(**market_response_dict(m))
+
+
+def market_response_dict(m) -> dict:
+    """Build MarketResponse fields from a MarketDB model, computing scores on-demand from market_data."""
 
     # Extract market data from stored JSON if available
     market_data = m.market_data or {}
@@ -283,32 +415,32 @@ def build_market_response(m) -> MarketResponse:
             growth_score = metrics.growth_score
         except Exception as e:
             # Fall back to stored scores if computation fails
-            print(f"Score computation failed for {m.name}: {e}")
+            logger.warning("Score computation failed for %s: %s", m.name, e)
             overall_score = m.overall_score or 0
             cash_flow_score = m.cash_flow_score or 0
             growth_score = m.growth_score or 0
 
-    return MarketResponse(
-        id=m.id,
-        name=m.name,
-        state=m.state,
-        metro=m.metro,
-        is_favorite=m.is_favorite,
-        is_supported=m.is_supported,
-        api_support=m.api_support,
-        overall_score=overall_score,
-        cash_flow_score=cash_flow_score,
-        growth_score=growth_score,
+    return {
+        "id": m.id,
+        "name": m.name,
+        "state": m.state,
+        "metro": m.metro,
+        "is_favorite": bool(m.is_favorite),
+        "is_supported": True if m.is_supported is None else bool(m.is_supported),
+        "api_support": m.api_support,
+        "overall_score": float(overall_score),
+        "cash_flow_score": float(cash_flow_score),
+        "growth_score": float(growth_score),
         # Market data fields
-        median_home_price=market_data.get("median_home_price"),
-        median_rent=market_data.get("median_rent"),
-        rent_to_price_ratio=market_data.get("avg_rent_to_price"),
-        price_change_1yr=market_data.get("price_change_1yr"),
-        job_growth_1yr=market_data.get("job_growth_yoy") or market_data.get("job_growth_1yr"),
-        unemployment_rate=market_data.get("metro_unemployment_rate") or market_data.get("unemployment_rate"),
-        days_on_market=market_data.get("days_on_market_avg"),
-        months_of_inventory=market_data.get("months_of_inventory"),
-    )
+        "median_home_price": market_data.get("median_home_price"),
+        "median_rent": market_data.get("median_rent"),
+        "rent_to_price_ratio": market_data.get("avg_rent_to_price"),
+        "price_change_1yr": market_data.get("price_change_1yr"),
+        "job_growth_1yr": market_data.get("job_growth_yoy") or market_data.get("job_growth_1yr"),
+        "unemployment_rate": market_data.get("metro_unemployment_rate") or market_data.get("unemployment_rate"),
+        "days_on_market": market_data.get("days_on_market_avg"),
+        "months_of_inventory": market_data.get("months_of_inventory"),
+    }
 
 
 # ==================== Market Routes ====================
@@ -320,8 +452,6 @@ async def search_metros(
     limit: int = Query(10, ge=1, le=50),
 ):
     """Search for metros using local data for instant autocomplete."""
-    from src.data_sources.metros import search_metros as local_search
-    from src.data_sources.hud_fmr import EMBEDDED_FMR_DATA
 
     # Use local metro data - instant, no API call
     matches = local_search(q, limit=limit)
@@ -334,18 +464,18 @@ async def search_metros(
 
         # Get rent estimate if available
         fmr_data = EMBEDDED_FMR_DATA.get(m.id)
-        median_rent = fmr_data.fmr_2br if fmr_data else None
+        median_rent = float(fmr_data.fmr_2br) if fmr_data else None
 
-        results.append(MetroSuggestion(
-            name=m.city,
-            state=m.state,
-            metro=m.metro_name,
-            median_price=None,  # Would need live data
-            median_rent=median_rent,
-            has_full_support=has_support,
-        ))
+        results.append({
+            "name": m.city,
+            "state": m.state,
+            "metro": m.metro_name,
+            "median_price": None,  # Would need live data
+            "median_rent": median_rent,
+            "has_full_support": bool(has_support),
+        })
 
-    return results
+    return ORJSONResponse(results)
 
 @router.get("/markets", response_model=List[MarketResponse])
 async def get_markets(
@@ -353,25 +483,19 @@ async def get_markets(
 ):
     """Get all markets sorted by favorites first, then by score."""
     repo = get_repository()
-
-    if favorites_only:
-        markets = repo.get_favorite_markets()
-    else:
-        markets = repo.get_all_markets_sorted()
-
-    return [build_market_response(m) for m in markets]
+    load = repo.get_favorite_markets if favorites_only else repo.get_all_markets_sorted
+    return _cached_markets_response(("all", favorites_only), load)
 
 
 @router.get("/markets/favorites", response_model=List[MarketResponse])
 async def get_favorite_markets():
     """Get user's favorite (researched) markets."""
     repo = get_repository()
-    markets = repo.get_favorite_markets()
-    return [build_market_response(m) for m in markets]
+    return _cached_markets_response(("favorites",), repo.get_favorite_markets)
 
 
 @router.post("/markets", response_model=MarketResponse)
-async def add_market(request: AddMarketRequest):
+async def add_market(request: AddMarketRequest, aggregator: DataAggregator = Depends(get_aggregator)):
     """
     Add a new market and fully enrich it with data from all sources.
 
@@ -383,10 +507,6 @@ async def add_market(request: AddMarketRequest):
 
     The enrichment may take 10-30 seconds as it fetches from multiple APIs.
     """
-    import asyncio
-    from src.data_sources.aggregator import DataAggregator
-    from src.models.market import MarketMetrics
-    from src.db.models import MarketDB
 
     repo = get_repository()
     market = repo.add_market(
@@ -397,7 +517,6 @@ async def add_market(request: AddMarketRequest):
     )
 
     # Fully enrich market data from all external sources
-    aggregator = DataAggregator()
     enrichment_errors = []
 
     try:
@@ -412,7 +531,7 @@ async def add_market(request: AddMarketRequest):
                 timeout=60.0
             )
         except asyncio.TimeoutError:
-            print(f"Timeout fetching market data for {request.name}, {request.state}")
+            logger.warning("Timeout fetching market data for %s, %s", request.name, request.state)
             enriched_data = None
             enrichment_errors.append("Timeout fetching market data")
 
@@ -442,20 +561,19 @@ async def add_market(request: AddMarketRequest):
                 # Log enrichment results
                 sources = enriched_data.data_sources
                 errors = enriched_data.enrichment_errors
-                print(f"Market {request.name}, {request.state} enriched from: {sources}")
+                logger.info("Market %s, %s enriched from: %s", request.name, request.state, sources)
                 if errors:
-                    print(f"  Enrichment errors: {errors}")
+                    logger.warning("Enrichment errors for %s, %s: %s", request.name, request.state, errors)
 
                 # Update return values
                 market = market_db
 
     except Exception as e:
-        print(f"Error enriching market data: {e}")
+        logger.exception("Error enriching market data")
         enrichment_errors.append(str(e))
-    finally:
-        await aggregator.close()
 
-    return build_market_response(market)
+    _invalidate_markets_cache()
+    return PydanticResponse(build_market_response(market))
 
 
 @router.post("/markets/{market_id}/favorite", response_model=MarketResponse)
@@ -467,140 +585,148 @@ async def toggle_market_favorite(market_id: str):
     if not market:
         raise HTTPException(status_code=404, detail="Market not found")
 
-    return build_market_response(market)
+    _invalidate_markets_cache()
+    return PydanticResponse(build_market_response(market))
 
 
 @router.post("/markets/{market_id}/refresh", response_model=MarketResponse)
-async def refresh_market_data(market_id: str):
+async def refresh_market_data(market_id: str, aggregator: DataAggregator = Depends(get_aggregator)):
     """
     Refresh market data from all sources.
 
     Re-fetches data from Redfin, BLS, Census, HUD, FRED and recalculates scores.
     Use this to get updated market conditions and scores.
     """
-    import asyncio
-    from src.data_sources.aggregator import DataAggregator
-    from src.models.market import MarketMetrics
 
     repo = get_repository()
 
     # Find market in database
-    from src.db.models import MarketDB
     market_db = repo.session.query(MarketDB).filter_by(id=market_id).first()
 
     if not market_db:
         raise HTTPException(status_code=404, detail="Market not found")
 
-    aggregator = DataAggregator()
+    # Fetch fresh data from all sources
     try:
-        # Fetch fresh data from all sources
-        try:
-            enriched_data = await asyncio.wait_for(
-                aggregator.get_market_data(
-                    city=market_db.name,
-                    state=market_db.state,
-                    metro=market_db.metro,
-                ),
-                timeout=60.0
-            )
-        except asyncio.TimeoutError:
-            raise HTTPException(
-                status_code=504,
-                detail="Timeout fetching market data. Please try again."
-            )
-
-        if enriched_data:
-            # Convert to Market model for scoring
-            market_model = enriched_data.to_market()
-            metrics = MarketMetrics.from_market(market_model)
+        enriched_data = await asyncio.wait_for(
+            aggregator.get_market_data(
+                city=market_db.name,
+                state=market_db.state,
+                metro=market_db.metro,
+            ),
+            timeout=60.0
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail="Timeout fetching market data. Please try again."
+        )
 
-            # Update database with fresh data
-            market_db.market_data = enriched_data.to_dict()
-            if enriched_data.metro:
-                market_db.metro = enriched_data.metro
-            market_db.overall_score = metrics.overall_score
-            market_db.cash_flow_score = metrics.cash_flow_score
-            market_db.growth_score = metrics.growth_score
-            market_db.updated_at = datetime.utcnow()
-            repo.session.commit()
-
-            # Log refresh results
-            print(f"Market {market_db.name} refreshed from: {enriched_data.data_sources}")
-            if enriched_data.enrichment_errors:
-                print(f"  Errors: {enriched_data.enrichment_errors}")
+    if enriched_data:
+        # Convert to Market model for scoring
+        market_model = enriched_data.to_market()
+        metrics = MarketMetrics.from_market(market_model)
+
+        # Update database with fresh data
+        market_db.market_data = enriched_data.to_dict()
+        if enriched_data.metro:
+            market_db.metro = enriched_data.metro
+        market_db.overall_score = metrics.overall_score
+        market_db.cash_flow_score = metrics.cash_flow_score
+        market_db.growth_score = metrics.growth_score
+        market_db.updated_at = datetime.utcnow()
+        repo.session.commit()
 
-    finally:
-        await aggregator.close()
+        # Log refresh results
+        logger.info("Market %s refreshed from: %s", market_db.name, enriched_data.data_sources)
+        if enriched_data.enrichment_errors:
+            logger.warning("Refresh errors for %s: %s", market_db.name, enriched_data.enrichment_errors)
 
-    return build_market_response(market_db)
+    _invalidate_markets_cache()
+    return PydanticResponse(build_market_response(market_db))
 
 
 @router.post("/markets/refresh-all")
-async def refresh_all_markets():
+async def refresh_all_markets(aggregator: DataAggregator = Depends(get_aggregator)):
     """
     Refresh data for all favorite markets.
 
-    Fetches fresh data from all sources for each favorited market.
-    This may take several minutes for many markets.
+    Fetches fresh data from all sources for each favorited market,
+    several markets at a time.
     """
-    from src.data_sources.aggregator import DataAggregator
-    from src.models.market import MarketMetrics
-    from src.db.models import MarketDB
 
     repo = get_repository()
     markets = repo.get_favorite_markets()
 
-    aggregator = DataAggregator()
     updated = 0
     errors = []
     results = []
 
-    try:
-        for market_db in markets:
-            try:
-                enriched_data = await aggregator.get_market_data(
-                    city=market_db.name,
-                    state=market_db.state,
-                    metro=market_db.metro,
-                )
-                if enriched_data:
-                    market_model = enriched_data.to_market()
-                    metrics = MarketMetrics.from_market(market_model)
-
-                    market_db.market_data = enriched_data.to_dict()
-                    if enriched_data.metro:
-                        market_db.metro = enriched_data.metro
-                    market_db.overall_score = metrics.overall_score
-                    market_db.cash_flow_score = metrics.cash_flow_score
-                    market_db.growth_score = metrics.growth_score
-                    market_db.updated_at = datetime.utcnow()
-                    updated += 1
-
-                    results.append({
-                        "market": f"{market_db.name}, {market_db.state}",
-                        "sources": enriched_data.data_sources,
-                        "errors": enriched_data.enrichment_errors or None,
-                    })
-            except Exception as e:
-                errors.append(f"{market_db.name}: {str(e)}")
+    # Fetch all markets concurrently, bounded so we don't hammer the sources
+    semaphore = asyncio.Semaphore(REFRESH_ALL_CONCURRENCY)
+
+    async def fetch(market_db):
+        async with semaphore:
+            return await aggregator.get_market_data(
+                city=market_db.name,
+                state=market_db.state,
+                metro=market_db.metro,
+            )
+
+    fetched = await asyncio.gather(
+        *(fetch(m) for m in markets), return_exceptions=True
+    )
 
+    # Collect plain row updates and write them in one bulk UPDATE,
+    # bypassing per-object change tracking
+    now = datetime.utcnow()
+    mappings = []
+    for market_db, enriched_data in zip(markets, fetched):
+        try:
+            if isinstance(enriched_data, Exception):
+                raise enriched_data
+            if enriched_data:
+                market_model = enriched_data.to_market()
+                metrics = MarketMetrics.from_market(market_model)
+
+                mapping = {
+                    "id": market_db.id,
+                    "market_data": enriched_data.to_dict(),
+                    "overall_score": metrics.overall_score,
+                    "cash_flow_score": metrics.cash_flow_score,
+                    "growth_score": metrics.growth_score,
+                    "updated_at": now,
+                }
+                if enriched_data.metro:
+                    mapping["metro"] = enriched_data.metro
+                mappings.append(mapping)
+                updated += 1
+
+                results.append({
+                    "market": f"{market_db.name}, {market_db.state}",
+                    "sources": enriched_data.data_sources,
+                    "errors": enriched_data.enrichment_errors or None,
+                })
+        except Exception as e:
+            errors.append(f"{market_db.name}: {str(e)}")
+
+    if mappings:
+        repo.session.bulk_update_mappings(MarketDB, mappings)
         repo.session.commit()
-    finally:
-        await aggregator.close()
 
-    return {
+    _invalidate_markets_cache()
+    return ORJSONResponse({
         "success": True,
         "updated": updated,
         "total": len(markets),
         "results": results,
         "errors": errors if errors else None,
-    }
+    })
 
 
 @router.delete("/markets/{market_id}")
 async def delete_market(market_id: str):
     """Delete a market from the database."""
-    from src.db.models import MarketDB
 
     repo = get_repository()
     market_db = repo.session.query(MarketDB).filter_by(id=market_id).first()
@@ -610,8 +736,9 @@ async def delete_market(market_id: str):
 
     repo.session.delete(market_db)
     repo.session.commit()
+    _invalidate_markets_cache()
 
-    return {"success": True, "message": f"Market {market_id} deleted"}
+    return ORJSONResponse({"success": True, "message": f"Market {market_id} deleted"})
 
 
 # ==================== Saved Property Routes ====================
@@ -630,35 +757,10 @@ async def get_saved_properties(
         is_favorite=True if favorites_only else None,
         limit=limit,
         offset=offset,
+        list_view=True,
     )
 
-    return [
-        SavedPropertyResponse(
-            id=p.id,
-            address=p.address,
-            city=p.city,
-            state=p.state,
-            zip_code=p.zip_code,
-            list_price=p.list_price,
-            estimated_rent=p.estimated_rent,
-            bedrooms=p.bedrooms,
-            bathrooms=p.bathrooms,
-            sqft=p.sqft,
-            property_type=p.property_type,
-            source=p.source,
-            source_url=p.source_url,
-            overall_score=p.overall_score,
-            cash_flow=p.cash_flow,
-            cash_on_cash=p.cash_on_cash,
-            cap_rate=p.cap_rate,
-            pipeline_status=p.pipeline_status or "analyzed",
-            is_favorite=p.is_favorite or False,
-            notes=p.notes,
-            created_at=p.created_at,
-            updated_at=p.updated_at,
-        )
-        for p in properties
-    ]
+    return ORJSONResponse([saved_property_list_item(p) for p in properties])
 
 
 @router.post("/properties", response_model=SavedPropertyResponse)
@@ -669,89 +771,84 @@ async def save_property(request: SavePropertyRequest):
     This endpoint creates an enriched property with full analysis data,
     location insights, and all score dimensions for long-term tracking.
     """
-    from src.db.models import SavedPropertyDB
 
     repo = get_repository()
 
-    # Generate a unique ID for the property
-    property_id = f"{request.source or 'manual'}_{hash(request.source_url or request.address) % 1000000:06d}"
-
-    # Check if property already exists
-    existing = repo.get_saved_property(property_id)
-    if existing:
-        # Update existing property with new data
-        existing.list_price = request.list_price
-        existing.estimated_rent = request.estimated_rent
-        existing.latitude = request.latitude
-        existing.longitude = request.longitude
-        existing.year_built = request.year_built
-        existing.days_on_market = request.days_on_market
-        if request.description:
-            existing.description = request.description
-        if request.photos:
-            existing.photos = request.photos
-        existing.overall_score = request.overall_score
-        existing.financial_score = request.financial_score
-        existing.market_score = request.market_score
-        existing.risk_score = request.risk_score
-        existing.liquidity_score = request.liquidity_score
-        existing.cash_flow = request.cash_flow
-        existing.cash_on_cash = request.cash_on_cash
-        existing.cap_rate = request.cap_rate
-        if request.analysis_data:
-            existing.analysis_data = request.analysis_data
-        if request.location_data:
-            existing.location_data = request.location_data
-            existing.location_data_fetched = datetime.utcnow()
-        existing.last_analyzed = datetime.utcnow()
-        existing.updated_at = datetime.utcnow()
-        repo.session.commit()
-        prop = existing
-    else:
-        # Create new enriched property
-        prop = SavedPropertyDB(
-            id=property_id,
-            address=request.address,
-            city=request.city,
-            state=request.state,
-            zip_code=request.zip_code,
-            latitude=request.latitude,
-            longitude=request.longitude,
-            list_price=request.list_price,
-            estimated_rent=request.estimated_rent,
-            bedrooms=request.bedrooms,
-            bathrooms=request.bathrooms,
-            sqft=request.sqft,
-            property_type=request.property_type,
-            year_built=request.year_built,
-            days_on_market=request.days_on_market,
-            description=request.description,
-            source=request.source,
-            source_url=request.source_url,
-            photos=request.photos,
-            overall_score=request.overall_score,
-            financial_score=request.financial_score,
-            market_score=request.market_score,
-            risk_score=request.risk_score,
-            liquidity_score=request.liquidity_score,
-            cash_flow=request.cash_flow,
-            cash_on_cash=request.cash_on_cash,
-            cap_rate=request.cap_rate,
-            analysis_data=request.analysis_data,
-            location_data=request.location_data,
-            location_data_fetched=datetime.utcnow() if request.location_data else None,
-            last_analyzed=datetime.utcnow(),
-            pipeline_status="analyzed",
-            is_favorite=False,
-        )
-        repo.session.add(prop)
-        repo.session.commit()
+    # Deterministic ID so re-saving the same listing updates the existing row
+    # (hash() is salted per process)
+    key = (request.source_url or request.address).encode()
+    property_id = f"{request.source or 'manual'}_{hashlib.blake2b(key, digest_size=8).hexdigest()}"
+
+    now = datetime.utcnow()
+
+    # Fields refreshed on every save (new or existing property)
+    updates = {
+        "list_price": request.list_price,
+        "estimated_rent": request.estimated_rent,
+        "latitude": request.latitude,
+        "longitude": request.longitude,
+        "year_built": request.year_built,
+        "days_on_market": request.days_on_market,
+        "overall_score": request.overall_score,
+        "financial_score": request.financial_score,
+        "market_score": request.market_score,
+        "risk_score": request.risk_score,
+        "liquidity_score": request.liquidity_score,
+        "cash_flow": request.cash_flow,
+        "cash_on_cash": request.cash_on_cash,
+        "cap_rate": request.cap_rate,
+        "last_analyzed": now,
+        "updated_at": now,
+    }
+    # Only overwrite these on an existing property when new data was sent
+    if request.description:
+        updates["description"] = request.description
+    if request.photos:
+        updates["photos"] = request.photos
+    if request.analysis_data:
+        updates["analysis_data"] = request.analysis_data
+    if request.location_data:
+        updates["location_data"] = request.location_data
+        updates["location_data_fetched"] = now
+
+    # Insert or update in a single statement
+    values = {
+        "id": property_id,
+        "address": request.address,
+        "city": request.city,
+        "state": request.state,
+        "zip_code": request.zip_code,
+        "bedrooms": request.bedrooms,
+        "bathrooms": request.bathrooms,
+        "sqft": request.sqft,
+        "property_type": request.property_type,
+        "description": request.description,
+        "source": request.source,
+        "source_url": request.source_url,
+        "photos": request.photos,
+        "analysis_data": request.analysis_data,
+        "location_data": request.location_data,
+        "location_data_fetched": None,
+        "pipeline_status": "analyzed",
+        "is_favorite": False,
+        "created_at": now,
+        **updates,
+    }
+    stmt = (
+        sqlite_insert(SavedPropertyDB)
+        .values(**values)
+        .on_conflict_do_update(index_elements=[SavedPropertyDB.id], set_=updates)
+    )
+    repo.session.execute(stmt)
+    repo.session.commit()
+
+    prop = repo.get_saved_property(property_id)
 
-    return build_property_response(prop)
+    return property_response(prop)
 
 
 @router.get("/properties/{property_id}", response_model=SavedPropertyResponse)
-async def get_saved_property(property_id: str):
+async def get_saved_property(property_id: str, request: Request):
     """Get a saved property by ID (Enriched tier with full data)."""
     repo = get_repository()
     prop = repo.get_saved_property(property_id)
@@ -759,11 +856,16 @@ async def get_saved_property(property_id: str):
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
 
-    return build_property_response(prop)
+    # Pollers send back the last ETag; skip serialization if the row is unchanged
+    etag = _property_etag(prop)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return PydanticResponse(build_property_response(prop), headers={"ETag": etag} if etag else None)
 
 
 @router.get("/properties/{property_id}/analysis")
-async def get_property_analysis(property_id: str):
+async def get_property_analysis(property_id: str, request: Request):
     """Get full analysis data for a saved property."""
     repo = get_repository()
     prop = repo.get_saved_property(property_id)
@@ -774,7 +876,12 @@ async def get_property_analysis(property_id: str):
     if not prop.analysis_data:
         raise HTTPException(status_code=404, detail="No analysis data available")
 
-    return prop.analysis_data
+    etag = _property_etag(prop)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    # Already plain JSON data, so skip jsonable_encoder's walk of the dict
+    return ORJSONResponse(prop.analysis_data, headers={"ETag": etag} if etag else None)
 
 
 @router.patch("/properties/{property_id}", response_model=SavedPropertyResponse)
@@ -782,23 +889,16 @@ async def update_property(property_id: str, request: UpdatePropertyRequest):
     """Update a saved property's status, favorite, or add a note."""
     repo = get_repository()
 
-    prop = repo.get_saved_property(property_id)
+    prop = repo.update_saved_property(
+        property_id,
+        pipeline_status=request.pipeline_status,
+        is_favorite=request.is_favorite,
+        note=request.note,
+    )
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
 
-    if request.pipeline_status is not None:
-        repo.update_property_status(property_id, request.pipeline_status)
-
-    if request.is_favorite is not None:
-        if prop.is_favorite != request.is_favorite:
-            repo.toggle_property_favorite(property_id)
-
-    if request.note:
-        repo.add_property_note(property_id, request.note)
-
-    # Fetch updated property
-    prop = repo.get_saved_property(property_id)
-    return build_property_response(prop)
+    return property_response(prop)
 
 
 @router.post("/properties/{property_id}/favorite", response_model=SavedPropertyResponse)
@@ -810,7 +910,7 @@ async def toggle_property_favorite(property_id: str):
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
 
-    return build_property_response(prop)
+    return property_response(prop)
 
 
 @router.delete("/properties/{property_id}")
@@ -822,36 +922,46 @@ async def delete_property(property_id: str):
     if not success:
         raise HTTPException(status_code=404, detail="Property not found")
 
-    return {"success": True, "message": "Property deleted"}
+    return ORJSONResponse({"success": True, "message": "Property deleted"})
 
 
 # ==================== Re-analyze & Location Data ====================
 
 @router.post("/properties/{property_id}/refresh-location", response_model=SavedPropertyResponse)
-async def refresh_property_location_data(property_id: str):
+async def refresh_property_location_data(
+    property_id: str,
+    request: Request,
+    force: bool = Query(False, description="Refetch even if location data is fresh"),
+):
     """
     Refresh location data (Walk Score, Noise, Schools, Flood Zone) for a saved property.
 
     This fetches fresh data from external APIs and updates the cached location_data.
     If the property doesn't have coordinates, it will try to geocode the address first.
+    Location data fetched within the last 24 hours is returned as-is unless `force` is set.
     """
-    import asyncio
-    from src.data_sources.walkscore import WalkScoreClient
-    from src.data_sources.us_real_estate import USRealEstateClient
-    from src.data_sources.fema_flood import FEMAFloodClient
-    from src.data_sources.geocoder import get_geocoder
-
     repo = get_repository()
     prop = repo.get_saved_property(property_id)
 
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
 
+    # One timestamp for the freshness checks and everything written below
+    now = datetime.utcnow()
+
+    if (
+        not force
+        and prop.location_data
+        and prop.location_data_fetched
+        and now - prop.location_data_fetched < LOCATION_DATA_FRESH_FOR
+    ):
+        return property_response(prop)
+
     # Get coordinates - geocode if missing
-    latitude = getattr(prop, 'latitude', None)
-    longitude = getattr(prop, 'longitude', None)
+    latitude = prop.latitude
+    longitude = prop.longitude
 
-    if not latitude or not longitude:
+    if latitude is None or longitude is None:
         # Try to geocode the address
         try:
             geocoder = get_geocoder()
@@ -864,10 +974,9 @@ async def refresh_property_location_data(property_id: str):
             if geo_result:
                 latitude = geo_result.latitude
                 longitude = geo_result.longitude
-                # Persist the coordinates
+                # Persisted by the single commit after location data is fetched
                 prop.latitude = latitude
                 prop.longitude = longitude
-                repo.session.commit()
             else:
                 raise HTTPException(
                     status_code=400,
@@ -881,35 +990,45 @@ async def refresh_property_location_data(property_id: str):
                 detail=f"Failed to geocode address: {str(e)}"
             )
 
-    # Fetch all location data in parallel
-    walkscore_client = WalkScoreClient()
-    us_real_estate_client = USRealEstateClient()
-    fema_client = FEMAFloodClient()
+    # Fetch all location data in parallel over the app's shared connection
+    # pool (clients fall back to their own when it isn't set up)
+    http = getattr(request.app.state, "http", None)
+    walkscore_client = WalkScoreClient(client=http)
+    us_real_estate_client = USRealEstateClient(client=http)
+    fema_client = FEMAFloodClient(client=http)
 
     try:
-        full_address = f"{prop.address}, {prop.city}, {prop.state} {prop.zip_code or ''}"
-
-        walkscore_task = walkscore_client.get_scores(full_address, latitude, longitude)
+        # Start from the stored data and skip providers whose fields are still
+        # within their TTL (unless forced)
+        location_data = {} if force else dict(prop.location_data or {})
+        fetch_walkscore = not location_field_fresh(location_data, "walk_score", WALK_SCORE_TTL, now)
+        fetch_flood = not location_field_fresh(location_data, "flood_zone", FLOOD_ZONE_TTL, now)
+
+        walkscore_task = (
+            walkscore_client.get_scores(prop.full_address, latitude, longitude)
+            if fetch_walkscore
+            else skip_step()
+        )
         location_insights_task = us_real_estate_client.get_location_insights(
             latitude, longitude, prop.zip_code
         )
-        flood_task = fema_client.get_flood_zone(latitude, longitude)
+        flood_task = fema_client.get_flood_zone(latitude, longitude) if fetch_flood else skip_step()
 
         walkscore, location_insights, flood = await asyncio.gather(
             walkscore_task, location_insights_task, flood_task,
             return_exceptions=True
         )
 
-        # Build location data object
-        location_data = {}
-
         if walkscore and not isinstance(walkscore, Exception):
-            location_data["walk_score"] = walkscore.walk_score
-            location_data["walk_description"] = walkscore.walk_description
-            location_data["transit_score"] = walkscore.transit_score
-            location_data["transit_description"] = walkscore.transit_description
-            location_data["bike_score"] = walkscore.bike_score
-            location_data["bike_description"] = walkscore.bike_description
+            location_data.update({
+                "walk_score": walkscore.walk_score,
+                "walk_description": walkscore.walk_description,
+                "transit_score": walkscore.transit_score,
+                "transit_description": walkscore.transit_description,
+                "bike_score": walkscore.bike_score,
+                "bike_description": walkscore.bike_description,
+                "walk_score_fetched_at": now.isoformat(),
+            })
 
         if location_insights and not isinstance(location_insights, Exception):
             if location_insights.get("noise"):
@@ -925,32 +1044,31 @@ async def refresh_property_location_data(property_id: str):
                 "requires_insurance": flood.requires_insurance,
                 "annual_chance": flood.annual_chance,
             }
+            location_data["flood_zone_fetched_at"] = now.isoformat()
 
         # Update property
         prop.location_data = location_data
-        prop.location_data_fetched = datetime.utcnow()
-        prop.updated_at = datetime.utcnow()
-        repo.session.commit()
+        prop.location_data_fetched = now
+        prop.updated_at = now
 
     finally:
+        # One commit for coordinates and location data; runs even if a
+        # fetch above raised so geocoded coordinates are still persisted
+        repo.session.commit()
         await walkscore_client.close()
         await us_real_estate_client.close()
         await fema_client.close()
 
-    return build_property_response(prop)
+    return property_response(prop)
 
 
 @router.post("/properties/{property_id}/reanalyze", response_model=SavedPropertyResponse)
-async def reanalyze_property(property_id: str):
+async def reanalyze_property(property_id: str, aggregator: DataAggregator = Depends(get_aggregator)):
     """
     Re-analyze a saved property with fresh market data and rates.
 
     This recalculates financials and scores using current market conditions.
     """
-    from src.data_sources.aggregator import DataAggregator
-    from src.models.property import Property, PropertyType, PropertyStatus
-    from src.models.deal import Deal, DealPipeline
-    from src.models.financials import Financials, LoanTerms
 
     repo = get_repository()
     prop = repo.get_saved_property(property_id)
@@ -958,45 +1076,9 @@ async def reanalyze_property(property_id: str):
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
 
-    aggregator = DataAggregator()
-
-    try:
-        # Rebuild property object
-        type_mapping = {
-            "single_family_home": PropertyType.SFH,
-            "single_family": PropertyType.SFH,
-            "condo": PropertyType.CONDO,
-            "townhouse": PropertyType.TOWNHOUSE,
-            "duplex": PropertyType.DUPLEX,
-            "triplex": PropertyType.TRIPLEX,
-            "fourplex": PropertyType.FOURPLEX,
-            "multi_family": PropertyType.MULTI_FAMILY,
-        }
-        prop_type = type_mapping.get(
-            (prop.property_type or "").lower().replace("-", "_").replace(" ", "_"),
-            PropertyType.SFH
-        )
-
-        property_obj = Property(
-            id=prop.id,
-            address=prop.address,
-            city=prop.city,
-            state=prop.state,
-            zip_code=prop.zip_code,
-            list_price=prop.list_price or 0,
-            property_type=prop_type,
-            bedrooms=prop.bedrooms or 3,
-            bathrooms=prop.bathrooms or 2.0,
-            sqft=prop.sqft,
-            latitude=getattr(prop, 'latitude', None),
-            longitude=getattr(prop, 'longitude', None),
-            status=PropertyStatus.ACTIVE,
-            source=prop.source,
-            source_url=prop.source_url,
-        )
-
-        # Fetch fresh rent estimate
-        rent_estimate = await aggregator.rentcast.get_rent_estimate(
+    # Fetch fresh rent estimate and market data concurrently
+    rent_estimate, market_data = await asyncio.gather(
+        aggregator.rentcast.get_rent_estimate(
             address=prop.address,
             city=prop.city,
             state=prop.state,
@@ -1004,60 +1086,31 @@ async def reanalyze_property(property_id: str):
             bedrooms=prop.bedrooms or 3,
             bathrooms=prop.bathrooms or 2.0,
             sqft=prop.sqft,
-        )
-
-        if rent_estimate:
-            property_obj.estimated_rent = rent_estimate.rent_estimate
-
-        # Get fresh market data
-        market_data = await aggregator.get_market_data(prop.city, prop.state)
-        market = market_data.to_market() if market_data else None
-
-        # Create deal and run analysis
-        deal = Deal(
-            id=f"reanalyzed_{prop.id}",
-            property=property_obj,
-            market=market,
-            pipeline_status=DealPipeline.ANALYZED,
-            first_seen=prop.created_at,
-        )
-
-        # Use existing loan terms if in analysis_data, otherwise defaults
-        existing_analysis = prop.analysis_data or {}
-        existing_financials = existing_analysis.get("financials", {})
-        existing_loan = existing_financials.get("loan", {})
-
-        deal.financials = Financials(
-            property_id=property_obj.id,
-            purchase_price=prop.list_price or 0,
-            estimated_rent=property_obj.estimated_rent or 0,
-            loan=LoanTerms(
-                down_payment_pct=existing_loan.get("down_payment_pct", 0.25),
-                interest_rate=existing_loan.get("interest_rate", 0.07),
-            ),
-        )
-
-        deal.analyze()
-
-        # Update the property with new analysis data
-        prop.estimated_rent = property_obj.estimated_rent
-        prop.overall_score = deal.score.overall_score if deal.score else None
-        prop.financial_score = deal.score.financial_score if deal.score else None
-        prop.market_score = deal.score.market_score if deal.score else None
-        prop.risk_score = deal.score.risk_score if deal.score else None
-        prop.liquidity_score = deal.score.liquidity_score if deal.score else None
-        prop.cash_flow = deal.financials.monthly_cash_flow if deal.financials else None
-        prop.cash_on_cash = deal.financial_metrics.cash_on_cash_return if deal.financial_metrics else None
-        prop.cap_rate = deal.financial_metrics.cap_rate if deal.financial_metrics else None
-        prop.analysis_data = deal.model_dump(mode='json')
-        prop.last_analyzed = datetime.utcnow()
-        prop.updated_at = datetime.utcnow()
-        repo.session.commit()
+        ),
+        aggregator.get_market_data(prop.city, prop.state),
+        return_exceptions=True,
+    )
+    if isinstance(rent_estimate, Exception):
+        rent_estimate = None
+    if isinstance(market_data, Exception):
+        market_data = None
+
+    deal, property_obj = rebuild_and_analyze(
+        prop,
+        market=market_data.to_market() if market_data else None,
+        estimated_rent=rent_estimate.rent_estimate if rent_estimate else None,
+        deal_id_prefix="reanalyzed",
+    )
 
-    finally:
-        await aggregator.close()
+    # Update the property with new analysis data
+    prop.estimated_rent = property_obj.estimated_rent
+    prop.analysis_data = deal_snapshot(deal)
+    now = datetime.utcnow()
+    prop.last_analyzed = now
+    prop.updated_at = now
+    repo.session.commit()
 
-    return build_property_response(prop)
+    return property_response(prop)
 
 
 class ReenrichResponse(BaseModel):
@@ -1091,7 +1144,7 @@ async def reenrich_property(property_id: str):
     existing_loan = existing_financials.get("loan", {})
 
     # Enqueue the enrichment job
-    job = repo.create_job(
+    job = repo.enqueue_job(
         job_type="enrich_property",
         payload={
             "property_id": property_id,
@@ -1100,6 +1153,7 @@ async def reenrich_property(property_id: str):
         },
         priority=2,  # Higher priority for user-initiated re-enrich
     )
+    notify_job_enqueued()
 
     return ReenrichResponse(
         job_id=job.id,
@@ -1125,7 +1179,6 @@ async def add_custom_scenario(property_id: str, request: CustomScenarioRequest):
     Use this for "What Should I Offer" calculations - saving different
     offer prices and financing terms to compare.
     """
-    from src.models.financials import Financials, LoanTerms
 
     repo = get_repository()
     prop = repo.get_saved_property(property_id)
@@ -1158,6 +1211,8 @@ async def add_custom_scenario(property_id: str, request: CustomScenarioRequest):
         else 0
     )
 
+    now = datetime.utcnow()
+
     # Build scenario object
     scenario = {
         "name": request.name or f"Scenario at {request.offer_price:,.0f}",
@@ -1169,17 +1224,17 @@ async def add_custom_scenario(property_id: str, request: CustomScenarioRequest):
         "cash_on_cash": cash_on_cash,
         "cap_rate": cap_rate,
         "total_cash_needed": financials.total_cash_needed,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": now.isoformat(),
     }
 
     # Add to scenarios list
-    scenarios = getattr(prop, 'custom_scenarios', None) or []
+    scenarios = prop.custom_scenarios or []
     scenarios.append(scenario)
     prop.custom_scenarios = scenarios
-    prop.updated_at = datetime.utcnow()
+    prop.updated_at = now
     repo.session.commit()
 
-    return build_property_response(prop)
+    return property_response(prop)
 
 
 # ==================== Stats & Cache Routes ====================
@@ -1197,7 +1252,7 @@ async def cleanup_cache():
     """Clean up expired cache entries."""
     repo = get_repository()
     deleted = repo.cache.cleanup_expired()
-    return {"success": True, "deleted_entries": deleted}
+    return ORJSONResponse({"success": True, "deleted_entries": deleted})
 
 
 @router.delete("/cache")
@@ -1207,4 +1262,4 @@ async def clear_cache(
     """Clear cache entries."""
     repo = get_repository()
     deleted = repo.cache.invalidate(provider=provider)
-    return {"success": True, "deleted_entries": deleted}
+    return ORJSONResponse({"success": True, "deleted_entries": deleted})
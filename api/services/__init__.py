@@ -0,0 +1 @@
+"""Logic shared by the API routes and the background jobs."""
@@ -0,0 +1,158 @@
+"""
+Property analysis helpers shared by the saved-property routes and the job
+handlers: rebuilding a Deal from a saved row, the analysis_data snapshot,
+and location-data freshness checks.
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
+
+from src.models.deal import Deal, DealPipeline
+from src.models.financials import Financials, LoanTerms
+from src.models.property import Property, PropertyStatus, PropertyType
+
+# Per-provider TTLs for fields stored in location_data
+WALK_SCORE_TTL = timedelta(days=7)
+FLOOD_ZONE_TTL = timedelta(days=30)
+
+# Stored property_type strings (normalized) -> PropertyType
+TYPE_MAPPING: dict[str, PropertyType] = {
+    "single_family_home": PropertyType.SFH,
+    "single_family": PropertyType.SFH,
+    "condo": PropertyType.CONDO,
+    "townhouse": PropertyType.TOWNHOUSE,
+    "duplex": PropertyType.DUPLEX,
+    "triplex": PropertyType.TRIPLEX,
+    "fourplex": PropertyType.FOURPLEX,
+    "multi_family": PropertyType.MULTI_FAMILY,
+}
+
+
+@lru_cache(maxsize=256)
+def normalize_property_type(raw: Optional[str]) -> PropertyType:
+    """Map a stored property_type string to PropertyType (defaults to SFH)."""
+    return TYPE_MAPPING.get(
+        (raw or "").lower().replace("-", "_").replace(" ", "_"),
+        PropertyType.SFH
+    )
+
+
+async def skip_step() -> None:
+    """Placeholder coroutine for skipped steps in asyncio.gather."""
+    return None
+
+
+def location_field_fresh(location_data: dict, key: str, ttl: timedelta, now: datetime) -> bool:
+    """Check whether a `<key>_fetched_at` timestamp in location_data is within `ttl`."""
+    fetched_at = location_data.get(f"{key}_fetched_at")
+    if not fetched_at:
+        return False
+    try:
+        return now - datetime.fromisoformat(fetched_at) < ttl
+    except (TypeError, ValueError):
+        return False
+
+
+# Deal fields stored in analysis_data: what the UI, risk assessment and
+# Deal.model_validate read back. Skips sensitivity, notes and timestamps.
+DEAL_SNAPSHOT_FIELDS = {
+    "id", "property", "financials", "financial_metrics", "market",
+    "score", "pros", "cons", "red_flags",
+}
+
+
+def deal_snapshot(deal: Deal) -> dict:
+    """Dump the parts of an analyzed deal that are persisted in analysis_data."""
+    return deal.model_dump(include=DEAL_SNAPSHOT_FIELDS)
+
+
+def rebuild_and_analyze(
+    prop,
+    market=None,
+    estimated_rent: Optional[float] = None,
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    loan=None,
+    deal_id_prefix: str = "deal",
+):
+    """
+    Rebuild a Deal from a SavedPropertyDB row, analyze it, and copy the
+    scores and key metrics back onto the row.
+
+    Data fetching (rent, market, geocoding) stays with the caller since the
+    reanalyze route and the enrichment job fetch different things.
+
+    Args:
+        prop: SavedPropertyDB row
+        market: Market model for scoring (optional)
+        estimated_rent: Monthly rent estimate (optional)
+        latitude: Latitude (defaults to the stored value)
+        longitude: Longitude (defaults to the stored value)
+        loan: LoanTerms to use; defaults to the loan from the stored
+            analysis, falling back to 25% down at 7%
+        deal_id_prefix: Prefix for the generated deal ID
+
+    Returns:
+        Tuple of (analyzed Deal, rebuilt Property)
+    """
+
+    property_obj = Property(
+        id=prop.id,
+        address=prop.address,
+        city=prop.city,
+        state=prop.state,
+        zip_code=prop.zip_code,
+        list_price=prop.list_price or 0,
+        property_type=normalize_property_type(prop.property_type),
+        bedrooms=prop.bedrooms or 3,
+        bathrooms=prop.bathrooms or 2.0,
+        sqft=prop.sqft,
+        latitude=latitude if latitude is not None else prop.latitude,
+        longitude=longitude if longitude is not None else prop.longitude,
+        status=PropertyStatus.ACTIVE,
+        source=prop.source,
+        source_url=prop.source_url,
+        estimated_rent=estimated_rent,
+    )
+
+    deal = Deal(
+        id=f"{deal_id_prefix}_{prop.id}",
+        property=property_obj,
+        market=market,
+        pipeline_status=DealPipeline.ANALYZED,
+        first_seen=prop.created_at,
+    )
+
+    if loan is None:
+        # Use existing loan terms if in analysis_data, otherwise defaults
+        existing_financials = (prop.analysis_data or {}).get("financials") or {}
+        existing_loan = existing_financials.get("loan") or {}
+        loan = LoanTerms(
+            down_payment_pct=existing_loan.get("down_payment_pct", 0.25),
+            interest_rate=existing_loan.get("interest_rate", 0.07),
+        )
+
+    deal.financials = Financials(
+        property_id=property_obj.id,
+        purchase_price=prop.list_price or 0,
+        estimated_rent=estimated_rent or 0,
+        loan=loan,
+    )
+
+    # Analysis is pure arithmetic (tens of microseconds), so it runs inline;
+    # a thread hop via asyncio.to_thread would cost more than it saves
+    deal.analyze()
+
+    prop.overall_score = deal.score.overall_score if deal.score else None
+    prop.financial_score = deal.score.financial_score if deal.score else None
+    prop.market_score = deal.score.market_score if deal.score else None
+    prop.risk_score = deal.score.risk_score if deal.score else None
+    prop.liquidity_score = deal.score.liquidity_score if deal.score else None
+    prop.cash_flow = deal.financials.monthly_cash_flow if deal.financials else None
+    prop.cash_on_cash = (
+        deal.financial_metrics.cash_on_cash_return if deal.financial_metrics else None
+    )
+    prop.cap_rate = deal.financial_metrics.cap_rate if deal.financial_metrics else None
+
+    return deal, property_obj
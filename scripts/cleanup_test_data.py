@@ -30,49 +30,61 @@ def cleanup_test_data(dry_run: bool = False) -> dict:
     results = {"properties": 0, "jobs": 0}
 
     # Find test properties
-    test_properties = repo.session.query(SavedPropertyDB).filter(
-        (SavedPropertyDB.address.ilike("%test%")) |
-        (SavedPropertyDB.source == "test") |
-        (SavedPropertyDB.address.ilike("123 %") & SavedPropertyDB.city.ilike("%test%"))
-    ).all()
+    # is_test_data is computed by SQLite from these rules (see TEST_DATA_SQL)
+    # and covered by a partial index, which only matches "= 1" (not "IS 1")
+    property_filter = SavedPropertyDB.is_test_data == 1
+    # Preview only needs a few columns, so skip hydrating ORM objects
+    test_properties = repo.session.query(
+        SavedPropertyDB.id,
+        SavedPropertyDB.address,
+        SavedPropertyDB.city,
+        SavedPropertyDB.created_at,
+    ).filter(property_filter).all()
 
     if test_properties:
         print(f"\nFound {len(test_properties)} test properties:")
-        for prop in test_properties:
-            print(f"  - {prop.id[:20]}... | {prop.address}, {prop.city} | {prop.created_at}")
+        for prop_id, address, city, created_at in test_properties:
+            print(f"  - {prop_id[:20]}... | {address}, {city} | {created_at}")
 
         if not dry_run:
-            for prop in test_properties:
-                repo.session.delete(prop)
-            repo.session.commit()
-            results["properties"] = len(test_properties)
-            print(f"\nDeleted {len(test_properties)} test properties")
+            # One DELETE statement instead of a unit-of-work delete per row
+            deleted = repo.session.query(SavedPropertyDB).filter(property_filter).delete(
+                synchronize_session=False
+            )
+            results["properties"] = deleted
+            print(f"\nDeleted {deleted} test properties")
         else:
             print(f"\n[DRY RUN] Would delete {len(test_properties)} test properties")
     else:
         print("\nNo test properties found")
 
     # Find test jobs (jobs with test property IDs)
-    test_jobs = repo.session.query(JobDB).filter(
-        JobDB.payload.contains('"test"')
-    ).all()
+    # is_test is computed by SQLite from the payload (see TEST_JOB_SQL); as
+    # above, "= 1" is what the partial index matches
+    job_filter = JobDB.is_test == 1
+    test_jobs = repo.session.query(JobDB.id, JobDB.job_type, JobDB.status).filter(job_filter).all()
 
     if test_jobs:
         print(f"\nFound {len(test_jobs)} test jobs:")
-        for job in test_jobs:
-            print(f"  - {job.id[:20]}... | {job.job_type} | {job.status}")
+        for job_id, job_type, status in test_jobs:
+            print(f"  - {job_id[:20]}... | {job_type} | {status}")
 
         if not dry_run:
-            for job in test_jobs:
-                repo.session.delete(job)
-            repo.session.commit()
-            results["jobs"] = len(test_jobs)
-            print(f"\nDeleted {len(test_jobs)} test jobs")
+            deleted = repo.session.query(JobDB).filter(job_filter).delete(
+                synchronize_session=False
+            )
+            results["jobs"] = deleted
+            print(f"\nDeleted {deleted} test jobs")
         else:
             print(f"\n[DRY RUN] Would delete {len(test_jobs)} test jobs")
     else:
         print("\nNo test jobs found")
 
+    if not dry_run:
+        # Both deletes land in one transaction; the commit expires anything
+        # still held in the session, so no per-object sync is needed
+        repo.session.commit()
+
     repo.close()
     return results
 
@@ -1,11 +1,44 @@
 """Base agent interface."""
 
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
 
 
+def _setup_agent_logging() -> logging.Logger:
+    """
+    Route agent logs through a queue so stdout writes happen on a listener
+    thread instead of inside agent loops. Output format matches the old print().
+    """
+    formatter = logging.Formatter(
+        "[%(asctime)s.%(msecs)03d] [%(agent)s] [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%dT%H:%M:%S",
+    )
+    formatter.converter = time.gmtime  # UTC, as before
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(formatter)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stream)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger = logging.getLogger("agents")
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    return logger
+
+
+_agent_logger = _setup_agent_logging()
+
+
 @dataclass
 class AgentResult:
     """Result from an agent operation."""
@@ -25,6 +58,7 @@ class BaseAgent(ABC):
 
     def __init__(self, config: Optional[dict] = None):
         self.config = config or {}
+        self._logger = _agent_logger.getChild(self.agent_name)
 
     @abstractmethod
     async def run(self, *args, **kwargs) -> AgentResult:
@@ -33,5 +67,6 @@ class BaseAgent(ABC):
 
     def log(self, message: str, level: str = "info") -> None:
         """Log a message from this agent."""
-        timestamp = datetime.utcnow().isoformat()
-        print(f"[{timestamp}] [{self.agent_name}] [{level.upper()}] {message}")
+        self._logger.log(
+            getattr(logging, level.upper(), logging.INFO), message, extra={"agent": self.agent_name}
+        )
@@ -0,0 +1,151 @@
+"""
+Caches for due diligence results.
+
+- Structured findings: the structuring step is a second Claude call over the
+  research notes, so the same notes always produce the same findings for a
+  given model and prompt. Kept in a small in-memory LRU backed by JSON files
+  on disk, keyed by a hash of (model, prompt version, research text).
+- Full reports: keyed by a normalized address, so the same property saved
+  twice (e.g. from different listing sources) is researched once per TTL.
+- Scout ratings: the research depth picked for an address, under the same
+  key and TTL as its report, so a retried run skips the scout call.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+FINDINGS_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "due_diligence"
+REPORT_CACHE_DIR = FINDINGS_CACHE_DIR / "reports"
+SCOUT_CACHE_DIR = FINDINGS_CACHE_DIR / "scout"
+MEMORY_CACHE_SIZE = 256
+REPORT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Spelled-out forms mapped to USPS abbreviations, so "123 Main Street" and
+# "123 Main St." share a report
+_ADDRESS_ABBREVIATIONS = {
+    "street": "st", "avenue": "ave", "road": "rd", "drive": "dr", "lane": "ln",
+    "court": "ct", "boulevard": "blvd", "place": "pl", "terrace": "ter",
+    "circle": "cir", "parkway": "pkwy", "highway": "hwy", "apartment": "apt",
+    "suite": "ste", "north": "n", "south": "s", "east": "e", "west": "w",
+}
+
+# Encoded JSON, so every hit hands out a fresh dict. Callers run these
+# functions in worker threads, so the LRU is guarded by a lock
+_memory_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def findings_cache_key(model: str, prompt_version: int, research_text: str) -> str:
+    """Cache key for the structured findings of one piece of research text."""
+    return hashlib.sha256(f"{model}|v{prompt_version}|{research_text}".encode()).hexdigest()
+
+
+def get_cached_findings(key: str) -> Optional[dict]:
+    """Return cached structured findings, checking memory before disk."""
+    with _memory_lock:
+        raw = _memory_cache.get(key)
+        if raw is not None:
+            _memory_cache.move_to_end(key)
+    if raw is not None:
+        return orjson.loads(raw)
+
+    try:
+        raw = (FINDINGS_CACHE_DIR / f"{key}.json").read_bytes()
+        structured = orjson.loads(raw)
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+    _remember(key, raw)
+    return structured
+
+
+def cache_findings(key: str, structured: dict) -> None:
+    """Store structured findings in memory and on disk."""
+    try:
+        raw = orjson.dumps(structured)
+    except TypeError as e:
+        print(f"Warning: Could not cache due diligence findings: {e}")
+        return
+
+    _remember(key, raw)
+    try:
+        _write_atomic(FINDINGS_CACHE_DIR / f"{key}.json", raw)
+    except OSError as e:
+        print(f"Warning: Could not cache due diligence findings: {e}")
+
+
+def normalize_address(address: str, city: str, state: str, zip_code: str) -> str:
+    """Lowercase, drop punctuation and abbreviate street words."""
+    words = re.findall(r"[a-z0-9]+", f"{address} {city} {state} {zip_code[:5]}".lower())
+    return " ".join(_ADDRESS_ABBREVIATIONS.get(word, word) for word in words)
+
+
+def report_cache_key(address: str, city: str, state: str, zip_code: str) -> str:
+    """Cache key for a full report on one address."""
+    return hashlib.sha256(normalize_address(address, city, state, zip_code).encode()).hexdigest()
+
+
+def get_cached_report(key: str) -> Optional[dict]:
+    """Return a completed report for this address if one is within the TTL."""
+    path = REPORT_CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime >= REPORT_CACHE_TTL_SECONDS:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def cache_report(key: str, report: dict) -> None:
+    """Store a completed report for its address."""
+    try:
+        _write_atomic(REPORT_CACHE_DIR / f"{key}.json", orjson.dumps(report))
+    except (OSError, TypeError) as e:
+        print(f"Warning: Could not cache due diligence report: {e}")
+
+
+def get_cached_scout(key: str) -> Optional[int]:
+    """Return the scout rating for this address if one is within the TTL."""
+    path = SCOUT_CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime >= REPORT_CACHE_TTL_SECONDS:
+            return None
+        return orjson.loads(path.read_bytes())["rating"]
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        return None
+
+
+def cache_scout(key: str, rating: int) -> None:
+    """Store the scout rating for an address."""
+    try:
+        _write_atomic(SCOUT_CACHE_DIR / f"{key}.json", orjson.dumps({"rating": rating}))
+    except OSError as e:
+        print(f"Warning: Could not cache due diligence scout rating: {e}")
+
+
+def _remember(key: str, raw: bytes) -> None:
+    with _memory_lock:
+        _memory_cache[key] = raw
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _write_atomic(path: Path, raw: bytes) -> None:
+    """Write via a temp file unique to this process and thread, then rename into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -22,12 +22,16 @@ class DealAnalyzerAgent(BaseAgent):
     def __init__(self, config: Optional[dict] = None):
         super().__init__(config)
         self.ranking_config = RankingConfig(
-            min_cash_on_cash=config.get("min_coc", 0.06) if config else 0.06,
-            min_cap_rate=config.get("min_cap", 0.05) if config else 0.05,
-            strategy=InvestmentStrategy(config.get("strategy", "cash_flow")) if config else InvestmentStrategy.CASH_FLOW,
+            min_cash_on_cash=self.config.get("min_coc", 0.06),
+            min_cap_rate=self.config.get("min_cap", 0.05),
+            strategy=InvestmentStrategy(self.config.get("strategy", "cash_flow")),
         )
         self.ranking_engine = RankingEngine(self.ranking_config)
         self.sensitivity_analyzer = SensitivityAnalyzer()
+        # Defaults for deals analyzed without custom assumptions; each deal
+        # gets its own copy, since callers edit deal.financials.loan in place
+        self._default_loan = LoanTerms()
+        self._default_expenses = OperatingExpenses()
 
     async def run(
         self,
@@ -36,6 +40,7 @@ class DealAnalyzerAgent(BaseAgent):
         loan_terms: Optional[LoanTerms] = None,
         operating_expenses: Optional[OperatingExpenses] = None,
         run_sensitivity: bool = False,
+        pre_screen: bool = True,
     ) -> AgentResult:
         """
         Analyze a list of properties and return scored deals.
@@ -46,30 +51,39 @@ class DealAnalyzerAgent(BaseAgent):
             loan_terms: Custom loan assumptions
             operating_expenses: Custom expense assumptions
             run_sensitivity: Whether to run stress tests
+            pre_screen: Skip properties that cannot pass the ranking filters
 
         Returns:
             AgentResult with analyzed and ranked deals
         """
         start_time = time.time()
-        self.log(f"Analyzing {len(properties)} properties...")
+        total = len(properties)
+        self.log(f"Analyzing {total} properties...")
 
-        deals = []
-        errors = []
+        candidates = properties
+        min_cap = self.ranking_config.min_cap_rate
+        if pre_screen and min_cap > 0:
+            # NOI never exceeds gross rent, so a monthly rent-to-price ratio
+            # below min_cap / 12 can't reach the cap rate filter
+            candidates = await self.quick_screen(
+                properties,
+                min_rent_to_price=min_cap / 12,
+                max_price=self.ranking_config.max_price,
+                min_beds=0,
+            )
 
         market_metrics = MarketMetrics.from_market(market) if market else None
 
-        for prop in properties:
-            try:
-                deal = await self.analyze_property(
-                    prop,
-                    market=market,
-                    loan_terms=loan_terms,
-                    operating_expenses=operating_expenses,
-                    run_sensitivity=run_sensitivity,
-                )
-                deals.append(deal)
-            except Exception as e:
-                errors.append(f"Error analyzing {prop.id}: {str(e)}")
+        # Analysis is pure CPU work; run the batch off the event loop
+        deals, errors = await asyncio.to_thread(
+            self._analyze_batch,
+            candidates,
+            market,
+            market_metrics,
+            loan_terms,
+            operating_expenses,
+            run_sensitivity,
+        )
 
         # Rank all deals
         ranked_deals = self.ranking_engine.rank_deals(
@@ -85,16 +99,38 @@ class DealAnalyzerAgent(BaseAgent):
             success=len(errors) == 0 or len(ranked_deals) > 0,
             data={
                 "deals": ranked_deals,
-                "total_analyzed": len(properties),
+                "total_analyzed": total,
                 "passed_filters": len(ranked_deals),
-                "filtered_out": len(properties) - len(ranked_deals),
+                "filtered_out": total - len(ranked_deals),
+                "pre_screened_out": total - len(candidates),
             },
-            message=f"Analyzed {len(properties)} properties, {len(ranked_deals)} passed filters",
+            message=f"Analyzed {total} properties, {len(ranked_deals)} passed filters",
             timestamp=datetime.utcnow(),
             duration_ms=duration_ms,
             errors=errors,
         )
 
+    def _analyze_batch(
+        self,
+        properties: list[Property],
+        market: Optional[Market],
+        market_metrics: Optional[MarketMetrics],
+        loan_terms: Optional[LoanTerms],
+        operating_expenses: Optional[OperatingExpenses],
+        run_sensitivity: bool,
+    ) -> tuple[list[Deal], list[str]]:
+        """Analyze properties one after another, collecting per-property errors."""
+        deals = []
+        errors = []
+        for prop in properties:
+            try:
+                deals.append(self._analyze_property_sync(
+                    prop, market, market_metrics, loan_terms, operating_expenses, run_sensitivity
+                ))
+            except Exception as e:
+                errors.append(f"Error analyzing {prop.id}: {str(e)}")
+        return deals, errors
+
     async def analyze_property(
         self,
         property: Property,
@@ -102,29 +138,51 @@ class DealAnalyzerAgent(BaseAgent):
         loan_terms: Optional[LoanTerms] = None,
         operating_expenses: Optional[OperatingExpenses] = None,
         run_sensitivity: bool = False,
+        market_metrics: Optional[MarketMetrics] = None,
     ) -> Deal:
-        """Analyze a single property and create a Deal."""
+        """Analyze a single property and create a Deal.
+
+        market_metrics, if given, must be derived from market.
+        """
+        return self._analyze_property_sync(
+            property, market, market_metrics, loan_terms, operating_expenses, run_sensitivity
+        )
+
+    def _analyze_property_sync(
+        self,
+        property: Property,
+        market: Optional[Market],
+        market_metrics: Optional[MarketMetrics],
+        loan_terms: Optional[LoanTerms],
+        operating_expenses: Optional[OperatingExpenses],
+        run_sensitivity: bool,
+    ) -> Deal:
+        """Synchronous body of analyze_property."""
+        # Apply property-specific overrides on a copy so shared or
+        # caller-supplied expenses aren't changed for the next property
+        overrides = {}
+        if property.hoa_fee:
+            overrides["hoa_monthly"] = property.hoa_fee
+        if property.annual_taxes:
+            overrides["property_tax_rate"] = property.annual_taxes / property.list_price
+        expenses = (operating_expenses or self._default_expenses).model_copy(update=overrides)
+
         # Create financials
         financials = Financials(
             property_id=property.id,
             purchase_price=property.list_price,
             estimated_rent=property.estimated_rent or 0,
-            loan=loan_terms or LoanTerms(),
-            expenses=operating_expenses or OperatingExpenses(),
+            loan=(loan_terms or self._default_loan).model_copy(),
+            expenses=expenses,
         )
 
-        # Apply property-specific overrides
-        if property.hoa_fee:
-            financials.expenses.hoa_monthly = property.hoa_fee
-        if property.annual_taxes:
-            financials.expenses.property_tax_rate = property.annual_taxes / property.list_price
-
         # Create deal
         deal = Deal(
             id=f"deal_{property.id}",
             property=property,
             financials=financials,
             market=market,
+            market_metrics=market_metrics,
             pipeline_status=DealPipeline.NEW,
         )
 
@@ -153,27 +211,16 @@ class DealAnalyzerAgent(BaseAgent):
 
         Returns properties that pass basic screens.
         """
-        passed = []
-
-        for prop in properties:
-            # Price filter
-            if max_price and prop.list_price > max_price:
-                continue
-
-            # Bedroom filter
-            if prop.bedrooms < min_beds:
-                continue
-
-            # Rent-to-price ratio
-            if prop.estimated_rent:
-                ratio = prop.estimated_rent / prop.list_price
-                if ratio < min_rent_to_price:
-                    continue
-            else:
-                # No rent estimate, can't screen
-                continue
-
-            passed.append(prop)
+        # No max price means no price filter; properties without a rent
+        # estimate can't be screened and are dropped
+        price_cap = max_price or float("inf")
+        passed = [
+            prop for prop in properties
+            if prop.list_price <= price_cap
+            and prop.bedrooms >= min_beds
+            and prop.estimated_rent
+            and prop.estimated_rent / prop.list_price >= min_rent_to_price
+        ]
 
         self.log(f"Quick screen: {len(passed)}/{len(properties)} passed")
         return passed
@@ -182,31 +229,32 @@ class DealAnalyzerAgent(BaseAgent):
         """Generate a detailed explanation for a deal."""
         return self.ranking_engine.explain_score(deal)
 
+    @staticmethod
+    def _comparison_summary(deal: Deal) -> dict:
+        """One side of compare_deals."""
+        prop, score, fm = deal.property, deal.score, deal.financial_metrics
+        return {
+            "address": prop.full_address,
+            "price": prop.list_price,
+            "rent": prop.estimated_rent,
+            "score": score.overall_score if score else None,
+            "cash_flow": fm.monthly_cash_flow if fm else None,
+            "coc": fm.cash_on_cash_return if fm else None,
+            "cap_rate": fm.cap_rate if fm else None,
+        }
+
     def compare_deals(self, deal_a: Deal, deal_b: Deal) -> dict:
         """Compare two deals side by side."""
-        if not deal_a.financial_metrics:
+        if not (deal_a.score and deal_a.financial_metrics):
             deal_a.analyze()
-        if not deal_b.financial_metrics:
+        if not (deal_b.score and deal_b.financial_metrics):
             deal_b.analyze()
 
+        score_a, score_b = deal_a.score, deal_b.score
+        a_wins = bool(score_a and score_b and score_a.overall_score > score_b.overall_score)
+
         return {
-            "deal_a": {
-                "address": deal_a.property.full_address,
-                "price": deal_a.property.list_price,
-                "rent": deal_a.property.estimated_rent,
-                "score": deal_a.score.overall_score if deal_a.score else None,
-                "cash_flow": deal_a.financial_metrics.monthly_cash_flow if deal_a.financial_metrics else None,
-                "coc": deal_a.financial_metrics.cash_on_cash_return if deal_a.financial_metrics else None,
-                "cap_rate": deal_a.financial_metrics.cap_rate if deal_a.financial_metrics else None,
-            },
-            "deal_b": {
-                "address": deal_b.property.full_address,
-                "price": deal_b.property.list_price,
-                "rent": deal_b.property.estimated_rent,
-                "score": deal_b.score.overall_score if deal_b.score else None,
-                "cash_flow": deal_b.financial_metrics.monthly_cash_flow if deal_b.financial_metrics else None,
-                "coc": deal_b.financial_metrics.cash_on_cash_return if deal_b.financial_metrics else None,
-                "cap_rate": deal_b.financial_metrics.cap_rate if deal_b.financial_metrics else None,
-            },
-            "winner": deal_a.property.id if (deal_a.score and deal_b.score and deal_a.score.overall_score > deal_b.score.overall_score) else deal_b.property.id,
+            "deal_a": self._comparison_summary(deal_a),
+            "deal_b": self._comparison_summary(deal_b),
+            "winner": deal_a.property.id if a_wins else deal_b.property.id,
         }
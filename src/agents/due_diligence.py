@@ -7,10 +7,13 @@ identifying potential issues, red flags, and gathering useful information.
 
 import os
 import asyncio
-from dataclasses import dataclass, field, asdict
+import re
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Optional
-import json
+
+import orjson
 
 try:
     from anthropic import AsyncAnthropic
@@ -19,9 +22,231 @@ except ImportError:
     HAS_ANTHROPIC = False
 
 from src.agents.base import BaseAgent, AgentResult
+from src.agents.dd_cache import (
+    cache_findings,
+    cache_report,
+    cache_scout,
+    findings_cache_key,
+    get_cached_findings,
+    get_cached_report,
+    get_cached_scout,
+    report_cache_key,
+)
+
+RESEARCH_MODEL = "claude-sonnet-4-20250514"
+SCOUT_MODEL = "claude-3-5-haiku-20241022"
+
+# Bump when the structuring prompt changes, so cached findings are not reused
+FINDINGS_PROMPT_VERSION = 2
+
+# Research shorter than this has nothing worth structuring (e.g. every search
+# came back empty), so the structuring call is skipped
+MIN_RESEARCH_CHARS = 500
+STRUCTURE_MIN_TOKENS = 1000
+STRUCTURE_MAX_TOKENS = 4000
+
+# A reply wrapped in a markdown code fence, with or without a json tag
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.S | re.I)
+
+_FLAG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "severity": {"type": "string"},
+        "title": {"type": "string"},
+        "description": {"type": "string"},
+        "source": {"type": "string", "description": "Where this was found"},
+    },
+    "required": ["title", "description"],
+}
+_STRING_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+# Structured output for _parse_findings: Claude fills this tool's input
+# instead of writing JSON text that has to be cleaned up and parsed
+FINDINGS_TOOL = {
+    "name": "submit_findings",
+    "description": "Record the structured due diligence findings for the property.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "executive_summary": {
+                "type": "string",
+                "description": "2-3 paragraph summary of findings",
+            },
+            "red_flags": {
+                "type": "array",
+                "items": _FLAG_SCHEMA,
+                "description": "Severity critical, high or medium",
+            },
+            "yellow_flags": {
+                "type": "array",
+                "items": _FLAG_SCHEMA,
+                "description": "Severity medium or low",
+            },
+            "green_flags": {
+                "type": "array",
+                "items": _FLAG_SCHEMA,
+                "description": "Positive findings",
+            },
+            "recommended_actions": _STRING_LIST_SCHEMA,
+            "questions_for_seller": _STRING_LIST_SCHEMA,
+            "inspection_focus_areas": _STRING_LIST_SCHEMA,
+            "findings": {
+                "type": "object",
+                "properties": {
+                    "ownership_history": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "date": {"type": "string"},
+                                "owner": {"type": "string"},
+                                "sale_price": {"type": "string"},
+                            },
+                        },
+                    },
+                    "liens_found": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "type": {"type": "string"},
+                                "amount": {"type": "string"},
+                                "status": {"type": "string"},
+                            },
+                        },
+                    },
+                    "environmental_concerns": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "type": {"type": "string"},
+                                "description": {"type": "string"},
+                                "distance": {"type": "string"},
+                            },
+                        },
+                    },
+                    "listing_agent": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "phone": {"type": "string"},
+                            "email": {"type": "string"},
+                            "company": {"type": "string"},
+                        },
+                    },
+                    "neighborhood_trends": _STRING_LIST_SCHEMA,
+                    "development_plans": _STRING_LIST_SCHEMA,
+                },
+            },
+        },
+        "required": ["executive_summary"],
+    },
+}
+
+# Each section is researched by its own Claude call, all running concurrently
+RESEARCH_SECTIONS = (
+    ("Property History & Ownership", """- Search for property records, previous sales, ownership history
+- Look for any tax liens, judgments, or encumbrances
+- Find permit history and any unpermitted work
+- Check for any code violations"""),
+    ("Legal & Regulatory", """- Search for any lawsuits involving this address
+- Check zoning classification and any variances
+- Look for HOA information, rules, and any litigation
+- Research any easements or restrictions"""),
+    ("Environmental & Safety", """- Search for environmental hazards nearby (superfund sites, industrial contamination)
+- Look for flood history and current flood zone status
+- Research crime statistics for the neighborhood
+- Check for any natural disaster history (fires, earthquakes, hurricanes)"""),
+    ("Market & Neighborhood", """- Research recent comparable sales in the area
+- Look for upcoming development projects that could affect value
+- Search for neighborhood trends and news
+- Find information about school districts"""),
+    ("Professional Contacts", """- Find the listing agent's contact information and reviews
+- Look for recommended home inspectors in the area
+- Find local contractors with good reviews
+- Identify reputable title companies"""),
+    ("News & Media", """- Search for any news articles mentioning this address
+- Look for neighborhood news that could affect the property
+- Find community forum discussions about the area"""),
+)
+SECTION_MAX_SEARCHES = 3
+MAX_CONCURRENT_SECTIONS = 6
+# Long web-search turns can come back paused (stop_reason "pause_turn") and
+# are resumed by sending the partial reply back, at most this many times
+SECTION_MAX_CONTINUATIONS = 3
+
+# A quick scout call rates how much digging an address needs (1-5); the
+# rating sets each section's web search budget. SECTION_MAX_SEARCHES is used
+# when the scout can't give an answer
+SCOUT_MAX_SEARCHES = 3
+SCOUT_SECTION_SEARCHES = {1: 1, 2: 2, 3: 3, 4: 4, 5: 5}
+# A bare digit reply, an "x/5" or "x out of 5" rating, or a lone digit that
+# is not part of a larger number or the "/5" scale itself
+_SCOUT_BARE_RATING_RE = re.compile(r"^\s*([1-5])\s*$")
+_SCOUT_SCALE_RATING_RE = re.compile(r"(?<![\d.])\b([1-5])\s*(?:/|out of)\s*5\b", re.I)
+_SCOUT_LONE_RATING_RE = re.compile(
+    r"(?<![\d./])(?<!out of )\b([1-5])\b(?![\d.]|\s*(?:/|out of))", re.I
+)
+
+
+def _parse_scout_rating(reply: str) -> Optional[int]:
+    """Read a 1-5 rating from the scout's reply; None if there isn't one."""
+    for pattern in (_SCOUT_BARE_RATING_RE, _SCOUT_SCALE_RATING_RE, _SCOUT_LONE_RATING_RE):
+        matches = pattern.findall(reply)
+        if matches:
+            # The rating follows any search narration, so take the last one
+            return int(matches[-1])
+    return None
+
+# Prompt text is assembled once at import; calls only concatenate the
+# per-property parts
+_RESEARCH_PROMPT_HEAD = """You are a thorough real estate due diligence researcher acting as an expert combination of:
+- A seasoned real estate attorney
+- An experienced property inspector
+- A local market analyst
+- A title company researcher
+
+Your task is to research one area of due diligence on this property:
+
+"""
+_RESEARCH_PROMPT_TAIL = """
+
+For each finding, clearly state:
+- The source of the information
+- The relevance to the property
+- Whether it's a red flag (serious concern), yellow flag (needs investigation), or green flag (positive)
+
+Be thorough but organized. Focus on actionable intelligence that would affect a buying decision."""
+_SECTION_PROMPT_TAILS = {
+    name: (
+        "\n\nPlease research the following area thoroughly using web search:\n\n"
+        f"## {name.upper()}\n{focus}" + _RESEARCH_PROMPT_TAIL
+    )
+    for name, focus in RESEARCH_SECTIONS
+}
+
+_SCOUT_PROMPT_HEAD = (
+    "You are planning due diligence research on a property. Run a few quick web searches "
+    "and rate how much research it needs, from 1 (little public record, e.g. a quiet "
+    "small-town listing with no news) to 5 (a lot to dig through: news coverage, "
+    "litigation, permits, environmental issues, or a high value).\n\n"
+)
+_SCOUT_PROMPT_TAIL = """
+
+Reply with the rating digit only."""
+
+_STRUCTURE_PROMPT_HEAD = """Based on this due diligence research, extract and structure the findings.
+
+Research Notes:
+"""
+_STRUCTURE_PROMPT_TAIL = """
 
+Record the findings by calling the submit_findings tool.
+Only include sections where you found relevant information. Be precise and factual."""
 
-@dataclass
+
+@dataclass(slots=True)
 class DueDiligenceFindings:
     """Structured findings from due diligence research."""
 
@@ -57,7 +282,7 @@ class DueDiligenceFindings:
     community_sentiment: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DueDiligenceReport:
     """Complete due diligence report for a property."""
 
@@ -86,16 +311,30 @@ class DueDiligenceReport:
     search_queries_used: list[str] = field(default_factory=list)
     sources_consulted: list[str] = field(default_factory=list)
     raw_research_notes: str = ""
+    # False when structuring failed; readers show raw_research_notes instead
+    # of an executive summary
+    structured: bool = True
 
     # Error tracking
     errors: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON storage."""
-        result = asdict(self)
+        """
+        Convert to dictionary for JSON storage.
+
+        Unlike dataclasses.asdict, lists and dicts are shared with the report
+        rather than deep-copied (raw_research_notes and findings can be large);
+        reports aren't modified once converted.
+        """
+        result = {name: getattr(self, name) for name in _REPORT_FIELDS}
+        result["findings"] = {name: getattr(self.findings, name) for name in _FINDINGS_FIELDS}
         return result
 
 
+_FINDINGS_FIELDS = tuple(f.name for f in fields(DueDiligenceFindings))
+_REPORT_FIELDS = tuple(f.name for f in fields(DueDiligenceReport))
+
+
 class DueDiligenceAgent(BaseAgent):
     """
     AI agent that performs comprehensive due diligence research on a property.
@@ -110,12 +349,35 @@ class DueDiligenceAgent(BaseAgent):
 
     agent_name = "due_diligence"
 
-    def __init__(self, config: Optional[dict] = None):
+    def __init__(self, config: Optional[dict] = None, progress: Optional[asyncio.Queue] = None):
         super().__init__(config)
         self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        # Optional sink for (property_id, percent, message) progress events,
+        # drained by the caller so research never waits on status writes
+        self._progress = progress
+        # Caps concurrent Claude calls across everything this agent runs
+        self._section_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SECTIONS)
+        self._client: Optional["AsyncAnthropic"] = None
         if not self.api_key and HAS_ANTHROPIC:
             self.log("ANTHROPIC_API_KEY not set - due diligence will be limited", "warning")
 
+    def _get_client(self) -> "AsyncAnthropic":
+        """Anthropic client shared by every call this agent makes, so its connections are reused."""
+        if self._client is None:
+            self._client = AsyncAnthropic(api_key=self.api_key)
+        return self._client
+
+    def _emit_progress(self, property_id: str, percent: int, message: str) -> None:
+        """Queue a progress event if the caller asked for them."""
+        if self._progress is not None:
+            self._progress.put_nowait((property_id, percent, message))
+
+    async def aclose(self) -> None:
+        """Close the Anthropic client's connection pool."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
     async def run(
         self,
         property_address: str,
@@ -144,6 +406,7 @@ class DueDiligenceAgent(BaseAgent):
         Returns:
             AgentResult with DueDiligenceReport in data field
         """
+        start_ns = time.monotonic_ns()
         start_time = datetime.utcnow()
 
         report = DueDiligenceReport(
@@ -155,6 +418,22 @@ class DueDiligenceAgent(BaseAgent):
 
         self.log(f"Starting due diligence for {property_address}, {city}, {state}")
 
+        # Reuse a recent report on the same address (e.g. the same house
+        # saved from two listing sites) instead of re-running the research
+        report_key = report_cache_key(property_address, city, state, zip_code)
+        cached_report = await asyncio.to_thread(get_cached_report, report_key)
+        if cached_report is not None:
+            cached_report["property_id"] = property_id
+            self.log("Using cached due diligence report for this address")
+            return AgentResult(
+                success=True,
+                data=cached_report,
+                message=f"Due diligence loaded from cache. Found {len(cached_report.get('red_flags', []))} red flags.",
+                timestamp=datetime.utcnow(),
+                duration_ms=(time.monotonic_ns() - start_ns) // 1_000_000,
+                errors=cached_report.get("errors", []),
+            )
+
         if not HAS_ANTHROPIC:
             report.status = "failed"
             report.errors.append("anthropic package not installed. Run: pip install anthropic")
@@ -186,34 +465,44 @@ class DueDiligenceAgent(BaseAgent):
                 list_price, property_type, year_built
             )
 
-            # Run the research using Claude with web search
-            research_result = await self._run_research(property_context, report)
+            # Size the research to the property, then run it using Claude
+            # with web search
+            max_searches = await self._scout(property_context, report_key)
+            self._emit_progress(property_id, 10, "AI is researching property history...")
+            research_result = await self._run_research(property_context, report, max_searches)
 
             # Parse and structure the findings
+            self._emit_progress(property_id, 85, "Compiling research findings...")
             await self._parse_findings(research_result, report)
 
+            finished_at = datetime.utcnow()
             report.status = "completed"
-            report.completed_at = datetime.utcnow().isoformat()
+            report.completed_at = finished_at.isoformat()
 
-            duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
             self.log(f"Due diligence completed with {len(report.red_flags)} red flags")
 
+            data = report.to_dict()
+            if not report.errors:
+                await asyncio.to_thread(cache_report, report_key, data)
+
             return AgentResult(
                 success=True,
-                data=report.to_dict(),
+                data=data,
                 message=f"Due diligence completed. Found {len(report.red_flags)} red flags.",
-                timestamp=datetime.utcnow(),
+                timestamp=finished_at,
                 duration_ms=duration_ms,
                 errors=report.errors,
             )
 
         except Exception as e:
+            finished_at = datetime.utcnow()
             report.status = "failed"
             report.errors.append(str(e))
-            report.completed_at = datetime.utcnow().isoformat()
+            report.completed_at = finished_at.isoformat()
 
-            duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
             self.log(f"Due diligence failed: {e}", "error")
 
@@ -221,7 +510,7 @@ class DueDiligenceAgent(BaseAgent):
                 success=False,
                 data=report.to_dict(),
                 message=f"Due diligence failed: {e}",
-                timestamp=datetime.utcnow(),
+                timestamp=finished_at,
                 duration_ms=duration_ms,
                 errors=report.errors,
             )
@@ -253,154 +542,187 @@ class DueDiligenceAgent(BaseAgent):
 
         return "\n".join(lines)
 
-    async def _run_research(self, property_context: str, report: DueDiligenceReport) -> str:
-        """Run the main research using Claude with web search."""
-
-        client = AsyncAnthropic(api_key=self.api_key)
-
-        research_prompt = f"""You are a thorough real estate due diligence researcher acting as an expert combination of:
-- A seasoned real estate attorney
-- An experienced property inspector
-- A local market analyst
-- A title company researcher
-
-Your task is to perform comprehensive due diligence research on this property:
-
-{property_context}
-
-Please research the following areas thoroughly using web search:
-
-## 1. PROPERTY HISTORY & OWNERSHIP
-- Search for property records, previous sales, ownership history
-- Look for any tax liens, judgments, or encumbrances
-- Find permit history and any unpermitted work
-- Check for any code violations
-
-## 2. LEGAL & REGULATORY
-- Search for any lawsuits involving this address
-- Check zoning classification and any variances
-- Look for HOA information, rules, and any litigation
-- Research any easements or restrictions
-
-## 3. ENVIRONMENTAL & SAFETY
-- Search for environmental hazards nearby (superfund sites, industrial contamination)
-- Look for flood history and current flood zone status
-- Research crime statistics for the neighborhood
-- Check for any natural disaster history (fires, earthquakes, hurricanes)
-
-## 4. MARKET & NEIGHBORHOOD
-- Research recent comparable sales in the area
-- Look for upcoming development projects that could affect value
-- Search for neighborhood trends and news
-- Find information about school districts
-
-## 5. PROFESSIONAL CONTACTS
-- Find the listing agent's contact information and reviews
-- Look for recommended home inspectors in the area
-- Find local contractors with good reviews
-- Identify reputable title companies
-
-## 6. NEWS & MEDIA
-- Search for any news articles mentioning this address
-- Look for neighborhood news that could affect the property
-- Find community forum discussions about the area
-
-For each finding, clearly state:
-- The source of the information
-- The relevance to the property
-- Whether it's a red flag (serious concern), yellow flag (needs investigation), or green flag (positive)
-
-At the end, provide:
-1. An executive summary of your findings
-2. A list of specific red flags with severity ratings
-3. Recommended next steps for the buyer
-4. Questions to ask the seller
-5. Areas the home inspector should focus on
-
-Be thorough but organized. Focus on actionable intelligence that would affect a buying decision."""
+    async def _scout(self, property_context: str, report_key: str) -> int:
+        """Pick each section's web search budget from a quick, cheap rating of the property."""
+        rating = await asyncio.to_thread(get_cached_scout, report_key)
+        if rating is None:
+            scout_prompt = _SCOUT_PROMPT_HEAD + property_context + _SCOUT_PROMPT_TAIL
+            try:
+                async with self._section_semaphore:
+                    response = await asyncio.wait_for(
+                        self._get_client().messages.create(
+                            model=SCOUT_MODEL,
+                            max_tokens=1000,
+                            tools=[
+                                {
+                                    "type": "web_search_20250305",
+                                    "name": "web_search",
+                                    "max_uses": SCOUT_MAX_SEARCHES,
+                                }
+                            ],
+                            messages=[{"role": "user", "content": scout_prompt}],
+                        ),
+                        timeout=60.0,
+                    )
+            except Exception as e:
+                self.log(f"Scout call failed, using default search budget: {e}", "warning")
+                return SECTION_MAX_SEARCHES
+
+            reply = "".join(block.text for block in response.content if hasattr(block, "text"))
+            rating = _parse_scout_rating(reply)
+            if rating is None:
+                self.log(
+                    f"Scout gave no rating, using default search budget: {reply[:100]!r}",
+                    "warning",
+                )
+                return SECTION_MAX_SEARCHES
+            await asyncio.to_thread(cache_scout, report_key, rating)
+
+        self.log(f"Scout rated research depth {rating}/5")
+        return SCOUT_SECTION_SEARCHES.get(rating, SECTION_MAX_SEARCHES)
+
+    async def _run_research(
+        self,
+        property_context: str,
+        report: DueDiligenceReport,
+        max_searches: int = SECTION_MAX_SEARCHES,
+    ) -> str:
+        """Research every section concurrently and merge the notes."""
+
+        client = self._get_client()
+        done = 0
+
+        async def run_section(name: str, focus: str):
+            nonlocal done
+            try:
+                async with self._section_semaphore:
+                    return await self._research_section(client, property_context, name, focus, max_searches)
+            finally:
+                done += 1
+                self._emit_progress(
+                    report.property_id,
+                    10 + 70 * done // len(RESEARCH_SECTIONS),
+                    f"Researched {done} of {len(RESEARCH_SECTIONS)} sections",
+                )
+
+        results = await asyncio.gather(
+            *(run_section(name, focus) for name, focus in RESEARCH_SECTIONS),
+            return_exceptions=True,
+        )
 
-        # Use Claude with web search tool (async call with timeout)
-        try:
-            response = await asyncio.wait_for(
-                client.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=8000,
-                    tools=[
-                        {
-                            "type": "web_search_20250305",
-                            "name": "web_search",
-                            "max_uses": 15,  # Reduced from 20 to speed up
-                        }
-                    ],
-                    messages=[
-                        {"role": "user", "content": research_prompt}
-                    ]
-                ),
-                timeout=300.0,  # 5 minute timeout for web search phase
-            )
-        except asyncio.TimeoutError:
-            raise Exception("Research phase timed out after 5 minutes")
+        # A failed section is reported but doesn't sink the others. The same
+        # page (e.g. the county assessor) is often cited by several sections,
+        # so sources are deduplicated in first-seen order
+        sections = []
+        seen_sources = set(report.sources_consulted)
+        for (name, _), result in zip(RESEARCH_SECTIONS, results):
+            if isinstance(result, BaseException):
+                report.errors.append(f"{name} research failed: {result}")
+                continue
+            text, urls = result
+            sections.append(f"## {name}\n{text}")
+            for url in urls:
+                if url not in seen_sources:
+                    seen_sources.add(url)
+                    report.sources_consulted.append(url)
+
+        if not sections:
+            raise Exception("All research sections failed")
+
+        return "\n\n".join(sections)
+
+    async def _research_section(
+        self,
+        client: "AsyncAnthropic",
+        property_context: str,
+        name: str,
+        focus: str,
+        max_searches: int = SECTION_MAX_SEARCHES,
+    ) -> tuple[str, list[str]]:
+        """Research one section using Claude with web search. Returns (text, source urls)."""
+
+        research_prompt = _RESEARCH_PROMPT_HEAD + property_context + _SECTION_PROMPT_TAILS[name]
+
+        messages = [{"role": "user", "content": research_prompt}]
+
+        async def stream_response():
+            # Streaming keeps the connection active through long web-search
+            # turns; the final message carries the same content blocks
+            async with client.messages.stream(
+                model=RESEARCH_MODEL,
+                max_tokens=4000,
+                tools=[
+                    {
+                        "type": "web_search_20250305",
+                        "name": "web_search",
+                        "max_uses": max_searches,
+                    }
+                ],
+                messages=messages,
+            ) as stream:
+                return await stream.get_final_message()
 
         # Collect all text responses and track sources
         research_text = []
-        for block in response.content:
-            if hasattr(block, 'text'):
-                research_text.append(block.text)
-            # Track web search results for sources
-            if hasattr(block, 'type') and block.type == 'web_search_tool_result':
-                if hasattr(block, 'content'):
-                    for result in block.content:
-                        if hasattr(result, 'url'):
-                            report.sources_consulted.append(result.url)
-
-        return "\n".join(research_text)
+        urls = []
+        for _ in range(SECTION_MAX_CONTINUATIONS + 1):
+            # Use Claude with web search tool (async call with timeout)
+            try:
+                response = await asyncio.wait_for(
+                    stream_response(),
+                    timeout=300.0,  # 5 minute timeout per section
+                )
+            except asyncio.TimeoutError:
+                raise Exception("timed out after 5 minutes")
+
+            for block in response.content:
+                if hasattr(block, 'text'):
+                    research_text.append(block.text)
+                # Track web search results for sources
+                if hasattr(block, 'type') and block.type == 'web_search_tool_result':
+                    if hasattr(block, 'content'):
+                        for result in block.content:
+                            if hasattr(result, 'url'):
+                                urls.append(result.url)
+
+            if getattr(response, "stop_reason", None) != "pause_turn":
+                break
+            # The server paused mid-search; hand the turn back so it resumes
+            # where it left off instead of starting over
+            messages.append({"role": "assistant", "content": response.content})
+        else:
+            self.log(f"{name}: still paused after {SECTION_MAX_CONTINUATIONS} continuations", "warning")
+
+        return "\n".join(research_text), urls
 
     async def _parse_findings(self, research_text: str, report: DueDiligenceReport) -> None:
         """Parse the research text into structured findings."""
 
         report.raw_research_notes = research_text
 
-        # Use Claude to structure the findings
-        client = AsyncAnthropic(api_key=self.api_key)
+        if len(research_text) < MIN_RESEARCH_CHARS:
+            report.executive_summary = research_text
+            return
 
-        structure_prompt = f"""Based on this due diligence research, extract and structure the findings into JSON format.
+        # Identical notes always structure the same way, so skip the call on a hit
+        cache_key = findings_cache_key(RESEARCH_MODEL, FINDINGS_PROMPT_VERSION, research_text)
+        cached = await asyncio.to_thread(get_cached_findings, cache_key)
+        if cached is not None:
+            self._apply_structured_findings(cached, report)
+            return
 
-Research Notes:
-{research_text}
-
-Please return a JSON object with this structure:
-{{
-    "executive_summary": "2-3 paragraph summary of findings",
-    "red_flags": [
-        {{"severity": "critical|high|medium", "title": "Short title", "description": "Details", "source": "Where this was found"}}
-    ],
-    "yellow_flags": [
-        {{"severity": "medium|low", "title": "Short title", "description": "Details", "source": "Where this was found"}}
-    ],
-    "green_flags": [
-        {{"title": "Short title", "description": "Positive finding details"}}
-    ],
-    "recommended_actions": ["Action 1", "Action 2"],
-    "questions_for_seller": ["Question 1", "Question 2"],
-    "inspection_focus_areas": ["Area 1", "Area 2"],
-    "findings": {{
-        "ownership_history": [{{"date": "", "owner": "", "sale_price": ""}}],
-        "liens_found": [{{"type": "", "amount": "", "status": ""}}],
-        "environmental_concerns": [{{"type": "", "description": "", "distance": ""}}],
-        "listing_agent": {{"name": "", "phone": "", "email": "", "company": ""}},
-        "neighborhood_trends": ["Trend 1", "Trend 2"],
-        "development_plans": ["Plan 1", "Plan 2"]
-    }}
-}}
-
-Only include sections where you found relevant information. Be precise and factual.
-Return ONLY valid JSON, no markdown code blocks or other formatting."""
+        # Use Claude to structure the findings
+        client = self._get_client()
+
+        structure_prompt = _STRUCTURE_PROMPT_HEAD + research_text + _STRUCTURE_PROMPT_TAIL
 
         try:
             response = await asyncio.wait_for(
                 client.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=4000,
+                    model=RESEARCH_MODEL,
+                    max_tokens=min(STRUCTURE_MAX_TOKENS, max(STRUCTURE_MIN_TOKENS, len(research_text) // 3)),
+                    tools=[FINDINGS_TOOL],
+                    tool_choice={"type": "tool", "name": FINDINGS_TOOL["name"]},
                     messages=[
                         {"role": "user", "content": structure_prompt}
                     ]
@@ -409,49 +731,55 @@ Return ONLY valid JSON, no markdown code blocks or other formatting."""
             )
         except asyncio.TimeoutError:
             report.errors.append("Parsing phase timed out")
-            report.executive_summary = research_text[:2000] if len(research_text) > 2000 else research_text
+            report.structured = False
             return
 
-        # Parse the JSON response
+        # The tool input arrives already decoded against the schema
+        structured = None
         response_text = ""
         for block in response.content:
+            if getattr(block, "type", None) == "tool_use" and block.name == FINDINGS_TOOL["name"]:
+                structured = block.input
+                break
             if hasattr(block, 'text'):
                 response_text += block.text
 
+        if isinstance(structured, dict):
+            self._apply_structured_findings(structured, report)
+            await asyncio.to_thread(cache_findings, cache_key, structured)
+            return
+
+        # Fall back to JSON in a text reply
         try:
-            # Clean up potential markdown code blocks
-            clean_text = response_text.strip()
-            if clean_text.startswith("```"):
-                clean_text = clean_text.split("```")[1]
-                if clean_text.startswith("json"):
-                    clean_text = clean_text[4:]
-            if clean_text.endswith("```"):
-                clean_text = clean_text[:-3]
-
-            structured = json.loads(clean_text.strip())
-
-            # Update report with structured findings
-            report.executive_summary = structured.get("executive_summary", "")
-            report.red_flags = structured.get("red_flags", [])
-            report.yellow_flags = structured.get("yellow_flags", [])
-            report.green_flags = structured.get("green_flags", [])
-            report.recommended_actions = structured.get("recommended_actions", [])
-            report.questions_for_seller = structured.get("questions_for_seller", [])
-            report.inspection_focus_areas = structured.get("inspection_focus_areas", [])
-
-            # Update findings structure
-            findings_data = structured.get("findings", {})
-            report.findings.ownership_history = findings_data.get("ownership_history", [])
-            report.findings.liens_found = findings_data.get("liens_found", [])
-            report.findings.environmental_concerns = findings_data.get("environmental_concerns", [])
-            report.findings.listing_agent = findings_data.get("listing_agent")
-            report.findings.neighborhood_trends = findings_data.get("neighborhood_trends", [])
-            report.findings.development_plans = findings_data.get("development_plans", [])
-
-        except json.JSONDecodeError as e:
+            match = _FENCE_RE.match(response_text)
+            clean_text = match.group(1) if match else response_text.strip()
+            structured = orjson.loads(clean_text)
+        except orjson.JSONDecodeError as e:
             report.errors.append(f"Failed to parse structured findings: {e}")
-            # Keep raw research notes as fallback
-            report.executive_summary = research_text[:2000] if len(research_text) > 2000 else research_text
+            report.structured = False
+            return
+
+        self._apply_structured_findings(structured, report)
+        await asyncio.to_thread(cache_findings, cache_key, structured)
+
+    def _apply_structured_findings(self, structured: dict, report: DueDiligenceReport) -> None:
+        """Copy structured findings JSON onto the report."""
+        report.executive_summary = structured.get("executive_summary", "")
+        report.red_flags = structured.get("red_flags", [])
+        report.yellow_flags = structured.get("yellow_flags", [])
+        report.green_flags = structured.get("green_flags", [])
+        report.recommended_actions = structured.get("recommended_actions", [])
+        report.questions_for_seller = structured.get("questions_for_seller", [])
+        report.inspection_focus_areas = structured.get("inspection_focus_areas", [])
+
+        # Update findings structure
+        findings_data = structured.get("findings", {})
+        report.findings.ownership_history = findings_data.get("ownership_history", [])
+        report.findings.liens_found = findings_data.get("liens_found", [])
+        report.findings.environmental_concerns = findings_data.get("environmental_concerns", [])
+        report.findings.listing_agent = findings_data.get("listing_agent")
+        report.findings.neighborhood_trends = findings_data.get("neighborhood_trends", [])
+        report.findings.development_plans = findings_data.get("development_plans", [])
 
 
 # Convenience function for running due diligence
@@ -469,12 +797,41 @@ async def run_due_diligence(
     Returns a DueDiligenceReport with findings.
     """
     agent = DueDiligenceAgent()
-    result = await agent.run(
-        property_address=property_address,
-        city=city,
-        state=state,
-        zip_code=zip_code,
-        property_id=property_id,
-        **kwargs
-    )
+    try:
+        result = await agent.run(
+            property_address=property_address,
+            city=city,
+            state=state,
+            zip_code=zip_code,
+            property_id=property_id,
+            **kwargs
+        )
+    finally:
+        await agent.aclose()
     return result.data
+
+
+async def run_due_diligence_batch(properties: list[dict], concurrency: int = 5) -> list:
+    """
+    Run due diligence on several properties at once.
+
+    Each item holds the keyword arguments for run_due_diligence. One agent
+    (and so one Anthropic client and section limit) is shared by the whole
+    batch. Returns report dicts in input order, or the exception for an
+    item that raised.
+    """
+    agent = DueDiligenceAgent()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(item: dict) -> dict:
+        async with semaphore:
+            result = await agent.run(**item)
+            return result.data
+
+    try:
+        return await asyncio.gather(
+            *(run_one(item) for item in properties),
+            return_exceptions=True,
+        )
+    finally:
+        await agent.aclose()
@@ -1,8 +1,11 @@
 """Market research agent for analyzing metro areas."""
 
+import heapq
 import time
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import NamedTuple, Optional
 
 from src.agents.base import BaseAgent, AgentResult
 from src.models.market import Market, MarketMetrics, MarketTrend
@@ -244,12 +247,76 @@ SAMPLE_MARKETS: dict[str, dict] = {
     },
 }
 
+_ALL_MARKET_IDS: tuple[str, ...] = tuple(SAMPLE_MARKETS)
+
+
+class RankedMarket(NamedTuple):
+    """A market with its metrics and position in a ranking."""
+
+    market: Market
+    metrics: MarketMetrics
+    overall_score: float
+    cash_flow_score: float
+    growth_score: float
+    rank: int = 0
+
+
+@lru_cache(maxsize=None)
+def _build_market(market_id: str) -> Optional[Market]:
+    """Build the Market for a sample market ID, once per process."""
+    data = SAMPLE_MARKETS.get(market_id)
+    if not data:
+        return None
+
+    return Market(
+        id=market_id,
+        name=data["name"],
+        metro=data["metro"],
+        state=data["state"],
+        region=data.get("region"),
+        population=data.get("population"),
+        population_growth_1yr=data.get("population_growth_1yr"),
+        population_growth_5yr=data.get("population_growth_5yr"),
+        unemployment_rate=data.get("unemployment_rate"),
+        job_growth_1yr=data.get("job_growth_1yr"),
+        major_employers=data.get("major_employers", []),
+        median_household_income=data.get("median_household_income"),
+        income_growth_1yr=data.get("income_growth_1yr"),
+        median_home_price=data.get("median_home_price"),
+        median_price_per_sqft=data.get("median_price_per_sqft"),
+        price_change_1yr=data.get("price_change_1yr"),
+        price_change_5yr=data.get("price_change_5yr"),
+        median_rent=data.get("median_rent"),
+        rent_change_1yr=data.get("rent_change_1yr"),
+        avg_rent_to_price=data.get("avg_rent_to_price"),
+        months_of_inventory=data.get("months_of_inventory"),
+        days_on_market_avg=data.get("days_on_market_avg"),
+        price_trend=data.get("price_trend", MarketTrend.STABLE),
+        rent_trend=data.get("rent_trend", MarketTrend.STABLE),
+        demand_trend=data.get("demand_trend", MarketTrend.STABLE),
+        landlord_friendly=data.get("landlord_friendly", True),
+        property_tax_rate=data.get("property_tax_rate"),
+        insurance_risk=data.get("insurance_risk"),
+    )
+
 
 class MarketResearchAgent(BaseAgent):
     """Agent for researching and analyzing real estate markets."""
 
     agent_name = "market_research"
 
+    def __init__(self, config: Optional[dict] = None):
+        super().__init__(config)
+        # Market data is static per id, so each market is scored once
+        self._metrics_cache: dict[str, MarketMetrics] = {}
+
+    def _metrics(self, market: Market) -> MarketMetrics:
+        """Score a market, reusing an earlier result for the same id."""
+        metrics = self._metrics_cache.get(market.id)
+        if metrics is None:
+            metrics = self._metrics_cache[market.id] = MarketMetrics.from_market(market)
+        return metrics
+
     async def run(
         self,
         market_ids: Optional[list[str]] = None,
@@ -276,7 +343,7 @@ class MarketResearchAgent(BaseAgent):
         errors = []
 
         # Get markets to analyze
-        target_ids = market_ids or list(SAMPLE_MARKETS.keys())
+        target_ids = market_ids or _ALL_MARKET_IDS
 
         for market_id in target_ids:
             try:
@@ -318,70 +385,34 @@ class MarketResearchAgent(BaseAgent):
 
     async def get_market(self, market_id: str) -> Optional[Market]:
         """Get market data by ID."""
-        data = SAMPLE_MARKETS.get(market_id)
-        if not data:
-            return None
-
-        return Market(
-            id=market_id,
-            name=data["name"],
-            metro=data["metro"],
-            state=data["state"],
-            region=data.get("region"),
-            population=data.get("population"),
-            population_growth_1yr=data.get("population_growth_1yr"),
-            population_growth_5yr=data.get("population_growth_5yr"),
-            unemployment_rate=data.get("unemployment_rate"),
-            job_growth_1yr=data.get("job_growth_1yr"),
-            major_employers=data.get("major_employers", []),
-            median_household_income=data.get("median_household_income"),
-            income_growth_1yr=data.get("income_growth_1yr"),
-            median_home_price=data.get("median_home_price"),
-            median_price_per_sqft=data.get("median_price_per_sqft"),
-            price_change_1yr=data.get("price_change_1yr"),
-            price_change_5yr=data.get("price_change_5yr"),
-            median_rent=data.get("median_rent"),
-            rent_change_1yr=data.get("rent_change_1yr"),
-            avg_rent_to_price=data.get("avg_rent_to_price"),
-            months_of_inventory=data.get("months_of_inventory"),
-            days_on_market_avg=data.get("days_on_market_avg"),
-            price_trend=data.get("price_trend", MarketTrend.STABLE),
-            rent_trend=data.get("rent_trend", MarketTrend.STABLE),
-            demand_trend=data.get("demand_trend", MarketTrend.STABLE),
-            landlord_friendly=data.get("landlord_friendly", True),
-            property_tax_rate=data.get("property_tax_rate"),
-            insurance_risk=data.get("insurance_risk"),
-        )
+        return _build_market(market_id)
 
-    def _rank_markets(self, markets: list[Market]) -> list[dict]:
+    def _rank_markets(self, markets: list[Market]) -> list[RankedMarket]:
         """Rank markets by investment potential."""
-        results = []
-
-        for market in markets:
-            metrics = MarketMetrics.from_market(market)
-
-            results.append({
-                "market": market,
-                "metrics": metrics,
-                "overall_score": metrics.overall_score,
-                "cash_flow_score": metrics.cash_flow_score,
-                "growth_score": metrics.growth_score,
-            })
-
-        # Sort by overall score descending
-        results.sort(key=lambda x: x["overall_score"], reverse=True)
-
-        # Add rankings
-        for i, result in enumerate(results):
-            result["rank"] = i + 1
-
-        return results
+        all_metrics = [self._metrics(market) for market in markets]
+
+        # Order by overall score descending; sorted() is stable, so tied
+        # markets keep their input order
+        scores = [metrics.overall_score for metrics in all_metrics]
+        order = sorted(range(len(markets)), key=scores.__getitem__, reverse=True)
+
+        return [
+            RankedMarket(
+                market=markets[i],
+                metrics=all_metrics[i],
+                overall_score=all_metrics[i].overall_score,
+                cash_flow_score=all_metrics[i].cash_flow_score,
+                growth_score=all_metrics[i].growth_score,
+                rank=rank,
+            )
+            for rank, i in enumerate(order, start=1)
+        ]
 
     async def get_top_markets(
         self,
         n: int = 5,
         strategy: str = "cash_flow",
-    ) -> list[dict]:
+    ) -> list[RankedMarket]:
         """Get top N markets for a given strategy."""
         result = await self.run()
 
@@ -390,19 +421,20 @@ class MarketResearchAgent(BaseAgent):
 
         markets = result.data["markets"]
 
-        # Sort by strategy-specific score
+        # Select by strategy-specific score; nlargest matches a stable
+        # descending sort without ordering the markets past n
         if strategy == "cash_flow":
-            markets.sort(key=lambda x: x["cash_flow_score"], reverse=True)
-        elif strategy == "growth":
-            markets.sort(key=lambda x: x["growth_score"], reverse=True)
+            return heapq.nlargest(n, markets, key=attrgetter("cash_flow_score"))
+        if strategy == "growth":
+            return heapq.nlargest(n, markets, key=attrgetter("growth_score"))
         # Default: overall score (already sorted)
 
         return markets[:n]
 
     def compare_markets(self, market_a: Market, market_b: Market) -> dict:
         """Compare two markets side by side."""
-        metrics_a = MarketMetrics.from_market(market_a)
-        metrics_b = MarketMetrics.from_market(market_b)
+        metrics_a = self._metrics(market_a)
+        metrics_b = self._metrics(market_b)
 
         return {
             "market_a": {
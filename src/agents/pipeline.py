@@ -78,57 +78,76 @@ class PipelineAgent(BaseAgent):
         if not market_result.success:
             errors.extend(market_result.errors)
 
-        markets = [m["market"] for m in market_result.data["markets"][:5]]
+        markets = [m.market for m in market_result.data["markets"][:5]]
         self.log(f"Selected {len(markets)} markets: {[m.name for m in markets]}")
 
-        # Step 2: Scrape properties from each market
+        # Step 2: Scrape properties from each market (concurrently). Each
+        # market keeps its own batch so later steps never re-match
+        # properties to markets
         self.log("Step 2: Scraping properties...")
-        all_properties = []
+        scraped_by_market = []
+        properties_scraped = 0
 
-        for market in markets:
-            try:
-                result = await self.scraper.search(
+        search_results = await asyncio.gather(
+            *(
+                self.scraper.search(
                     city=market.name,
                     state=market.state,
                     max_price=max_price,
                     min_beds=min_beds,
                     limit=properties_per_market,
                 )
-                all_properties.extend(result.properties)
-                self.log(f"  {market.name}: {len(result.properties)} properties")
-            except Exception as e:
-                errors.append(f"Scraping {market.name} failed: {str(e)}")
+                for market in markets
+            ),
+            return_exceptions=True,
+        )
+        for market, result in zip(markets, search_results):
+            if isinstance(result, Exception):
+                errors.append(f"Scraping {market.name} failed: {str(result)}")
+                continue
+            scraped_by_market.append((market, result.properties))
+            properties_scraped += len(result.properties)
+            self.log(f"  {market.name}: {len(result.properties)} properties")
 
-        self.log(f"Total properties scraped: {len(all_properties)}")
+        self.log(f"Total properties scraped: {properties_scraped}")
 
         # Step 3: Quick screen
         self.log("Step 3: Quick screening...")
-        screened = await self.deal_agent.quick_screen(
-            all_properties,
-            max_price=max_price,
-            min_beds=min_beds,
-        )
-        self.log(f"Properties passing quick screen: {len(screened)}")
+        market_batches = []
+        properties_screened = 0
+        for market, properties in scraped_by_market:
+            market_props = await self.deal_agent.quick_screen(
+                properties,
+                max_price=max_price,
+                min_beds=min_beds,
+            )
+            if market_props:
+                market_batches.append((market, market_props))
+                properties_screened += len(market_props)
+        self.log(f"Properties passing quick screen: {properties_screened}")
 
-        # Step 4: Full analysis
+        # Step 4: Full analysis, one concurrent run per market
         self.log("Step 4: Analyzing deals...")
 
-        # Group properties by market for analysis
-        all_deals = []
-        for market in markets:
-            market_props = [p for p in screened if p.city == market.name and p.state == market.state]
-            if not market_props:
-                continue
-
-            result = await self.deal_agent.run(
-                properties=market_props,
-                market=market,
-                loan_terms=loan_terms,
-                operating_expenses=operating_expenses,
-                run_sensitivity=run_sensitivity,
-            )
+        analysis_results = await asyncio.gather(
+            *(
+                self.deal_agent.run(
+                    properties=market_props,
+                    market=market,
+                    loan_terms=loan_terms,
+                    operating_expenses=operating_expenses,
+                    run_sensitivity=run_sensitivity,
+                )
+                for market, market_props in market_batches
+            ),
+            return_exceptions=True,
+        )
 
-            if result.success:
+        all_deals = []
+        for (market, _), result in zip(market_batches, analysis_results):
+            if isinstance(result, Exception):
+                errors.append(f"Analyzing {market.name} failed: {str(result)}")
+            elif result.success:
                 all_deals.extend(result.data["deals"])
             else:
                 errors.extend(result.errors)
@@ -137,11 +156,14 @@ class PipelineAgent(BaseAgent):
 
         # Step 5: Final ranking across all markets
         self.log("Step 5: Final ranking...")
-        all_deals.sort(
-            key=lambda d: d.score.strategy_scores.get(strategy.value, d.score.overall_score)
-            if d.score else 0,
-            reverse=True,
-        )
+        # Compute each deal's strategy score once and sort on those keys
+        strategy_key = strategy.value
+        keys = [
+            d.score.strategy_scores.get(strategy_key, d.score.overall_score) if d.score else 0
+            for d in all_deals
+        ]
+        order = sorted(range(len(all_deals)), key=keys.__getitem__, reverse=True)
+        all_deals = [all_deals[i] for i in order]
 
         # Update ranks
         for i, deal in enumerate(all_deals):
@@ -159,8 +181,8 @@ class PipelineAgent(BaseAgent):
                 "deals": top_deals,
                 "all_deals": all_deals,
                 "markets_analyzed": len(markets),
-                "properties_scraped": len(all_properties),
-                "properties_screened": len(screened),
+                "properties_scraped": properties_scraped,
+                "properties_screened": properties_screened,
                 "deals_analyzed": len(all_deals),
             },
             message=f"Found {len(top_deals)} top deals from {len(markets)} markets",
@@ -177,7 +199,7 @@ class PipelineAgent(BaseAgent):
             deal.property = property
 
         # Re-run analysis
-        deal.analyze()
+        deal.analyze(force=True)
         return deal
 
     async def monitor_markets(
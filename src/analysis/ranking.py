@@ -83,6 +83,15 @@ class RankingEngine:
     def filter_deals(self, deals: list[Deal]) -> list[Deal]:
         """Filter deals based on configuration thresholds."""
         filtered = []
+        # Read thresholds once per batch rather than per deal
+        config = self.config
+        min_cash_flow = config.min_cash_flow if config.exclude_negative_cash_flow else None
+        min_coc = config.min_cash_on_cash
+        min_cap = config.min_cap_rate
+        require_1pct_rule = config.require_1pct_rule
+        exclude_high_risk = config.exclude_high_risk
+        max_price = config.max_price
+        min_price = config.min_price
 
         for deal in deals:
             if not deal.financial_metrics:
@@ -93,26 +102,27 @@ class RankingEngine:
                 continue
 
             # Apply filters
-            if self.config.exclude_negative_cash_flow and fm.monthly_cash_flow < self.config.min_cash_flow:
+            if min_cash_flow is not None and fm.monthly_cash_flow < min_cash_flow:
                 continue
 
-            if fm.cash_on_cash_return < self.config.min_cash_on_cash:
+            if fm.cash_on_cash_return < min_coc:
                 continue
 
-            if fm.cap_rate < self.config.min_cap_rate:
+            if fm.cap_rate < min_cap:
                 continue
 
-            if self.config.require_1pct_rule and fm.rent_to_price_ratio < 1.0:
+            if require_1pct_rule and fm.rent_to_price_ratio < 1.0:
                 continue
 
-            if self.config.exclude_high_risk:
+            if exclude_high_risk:
                 if fm.debt_service_coverage_ratio and fm.debt_service_coverage_ratio < 1.0:
                     continue
 
-            if self.config.max_price and deal.property.list_price > self.config.max_price:
+            list_price = deal.property.list_price
+            if max_price and list_price > max_price:
                 continue
 
-            if self.config.min_price and deal.property.list_price < self.config.min_price:
+            if min_price and list_price < min_price:
                 continue
 
             filtered.append(deal)
@@ -167,9 +167,9 @@ def markets(
 
     # Sort by strategy
     if strategy == "cash_flow":
-        markets.sort(key=lambda x: x["cash_flow_score"], reverse=True)
+        markets.sort(key=lambda x: x.cash_flow_score, reverse=True)
     elif strategy == "growth":
-        markets.sort(key=lambda x: x["growth_score"], reverse=True)
+        markets.sort(key=lambda x: x.growth_score, reverse=True)
 
     # Create table
     table = Table(title=f"Top {min(top_n, len(markets))} Investment Markets")
@@ -184,8 +184,8 @@ def markets(
     table.add_column("Rent/Price", justify="right")
 
     for i, m in enumerate(markets[:top_n]):
-        market = m["market"]
-        metrics = m["metrics"]
+        market = m.market
+        metrics = m.metrics
         table.add_row(
             str(i + 1),
             market.name,
@@ -0,0 +1,92 @@
+"""
+Persistent caching helpers for data source lookups.
+
+Location data (Walk Score, FEMA flood zones) is effectively static at ~100m
+resolution, so lookups are cached in the SQLite search cache keyed by
+provider and rounded coordinates. Nearby coordinates collapse into a single
+cache entry and repeat lookups skip the external HTTP round-trip entirely.
+"""
+
+import functools
+import inspect
+from typing import Any, Callable, Optional
+
+
+def geo_cache_params(latitude: float, longitude: float, precision: int = 3) -> dict:
+    """Build cache params from coordinates rounded to `precision` decimals."""
+    return {
+        "lat": f"{latitude:.{precision}f}",
+        "lon": f"{longitude:.{precision}f}",
+    }
+
+
+def geo_cached(
+    provider: str,
+    endpoint: str,
+    ttl_hours: int,
+    from_dict: Callable[[dict], Any],
+    precision: int = 3,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+):
+    """
+    Cache an async coordinate lookup in the persistent repository cache.
+
+    The wrapped coroutine must accept `latitude` and `longitude` arguments
+    and return an object with a `to_dict()` method (or None).
+
+    Args:
+        provider: Provider name used in the cache key (e.g., "walkscore")
+        endpoint: Endpoint name used in the cache key (e.g., "scores")
+        ttl_hours: Time to live for cached entries
+        from_dict: Rebuilds the result object from its cached dict
+        precision: Decimal places to round coordinates to (3 = ~100m)
+        should_cache: Optional predicate; results failing it are not cached
+            (e.g., fallback results returned when the API is unavailable)
+
+    Usage:
+        @geo_cached("fema_flood", "flood_zone", ttl_hours=720,
+                    from_dict=FloodZoneResult.from_dict)
+        async def get_flood_zone(self, latitude, longitude): ...
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            latitude = bound.arguments.get("latitude")
+            longitude = bound.arguments.get("longitude")
+
+            if latitude is None or longitude is None:
+                return await func(*args, **kwargs)
+
+            params = geo_cache_params(latitude, longitude, precision)
+
+            # Check persistent cache first
+            try:
+                from src.db import get_repository
+                repo = get_repository()
+                cached = repo.cache.get(provider, endpoint, params)
+                if cached:
+                    return from_dict(cached)
+            except Exception:
+                pass  # Cache not available
+
+            result = await func(*args, **kwargs)
+
+            if result is None or (should_cache and not should_cache(result)):
+                return result
+
+            try:
+                from src.db import get_repository
+                repo = get_repository()
+                repo.cache.set(provider, endpoint, params, result.to_dict(), ttl_hours=ttl_hours)
+            except Exception:
+                pass  # Cache not available
+
+            return result
+
+        return wrapper
+
+    return decorator
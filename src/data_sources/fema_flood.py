@@ -12,6 +12,8 @@ from datetime import datetime
 from typing import Optional
 import httpx
 
+from src.data_sources.cache import geo_cached
+
 FEMA_NFHL_BASE_URL = "https://hazards.fema.gov/arcgis/rest/services/public/NFHL/MapServer"
 FLOOD_HAZARD_ZONES_LAYER = 28
 
@@ -161,6 +163,14 @@ class FloodZoneResult:
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "FloodZoneResult":
+        """Rebuild from a dictionary produced by to_dict()."""
+        values = dict(data)
+        if values.get("last_updated"):
+            values["last_updated"] = datetime.fromisoformat(values["last_updated"])
+        return cls(**values)
+
 
 class FEMAFloodClient:
     """
@@ -183,14 +193,16 @@ class FEMAFloodClient:
         print(f"Requires Insurance: {result.requires_insurance}")
     """
 
-    def __init__(self):
-        self._client = httpx.AsyncClient(timeout=30.0)
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(timeout=30.0)
         self._cache: dict[str, tuple[datetime, FloodZoneResult]] = {}
         self._cache_ttl = 2592000  # 30 days (flood zones rarely change)
 
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client (a shared client is left open for its owner)."""
+        if self._owns_client:
+            await self._client.aclose()
 
     def _get_cache_key(self, latitude: float, longitude: float) -> str:
         """Generate cache key from coordinates (rounded for nearby hits)."""
@@ -219,6 +231,13 @@ class FEMAFloodClient:
             "annual_chance": "unknown",
         }
 
+    @geo_cached(
+        "fema_flood",
+        "flood_zone",
+        ttl_hours=720,  # 30 days
+        from_dict=FloodZoneResult.from_dict,
+        should_cache=lambda r: r.flood_zone is not None,
+    )
     async def get_flood_zone(
         self,
         latitude: float,
@@ -12,7 +12,7 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class GeocodingResult:
     """Result from geocoding an address."""
     latitude: float
@@ -10,6 +10,7 @@ Data sources:
 - HUD FMR (rent data coverage)
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Optional
 
@@ -124,6 +125,38 @@ US_METROS: list[MetroInfo] = [
 ]
 
 
+# Lowercased search fields, computed once: (city, metro_name, haystack, metro).
+# The haystack joins city/state/metro name/id with a separator that can't
+# appear in a query, so one substring test covers all four fields.
+_SEARCH_INDEX: tuple[tuple[str, str, str, MetroInfo], ...] = tuple(
+    (
+        metro.city.lower(),
+        metro.metro_name.lower(),
+        "\0".join((metro.city, metro.state, metro.metro_name, metro.id)).lower(),
+        metro,
+    )
+    for metro in US_METROS
+)
+
+# (city_lower, index) sorted, so city-prefix matches are one contiguous run
+_CITY_PREFIX_INDEX: tuple[tuple[str, int], ...] = tuple(
+    sorted((entry[0], index) for index, entry in enumerate(_SEARCH_INDEX))
+)
+
+_METROS_BY_ID: dict[str, MetroInfo] = {metro.id: metro for metro in US_METROS}
+
+
+def _city_prefix_matches(query_lower: str) -> list[int]:
+    """Indexes into _SEARCH_INDEX of metros whose city starts with the query."""
+    start = bisect_left(_CITY_PREFIX_INDEX, (query_lower,))
+    matches = []
+    for city_lower, index in _CITY_PREFIX_INDEX[start:]:
+        if not city_lower.startswith(query_lower):
+            break
+        matches.append(index)
+    return matches
+
+
 def search_metros(query: str, limit: int = 10) -> list[MetroInfo]:
     """
     Search metros by name (instant, no API call).
@@ -139,33 +172,37 @@ def search_metros(query: str, limit: int = 10) -> list[MetroInfo]:
         return []
 
     query_lower = query.lower().strip()
+    if "\0" in query_lower:
+        return []
 
-    matches = []
-    for metro in US_METROS:
-        # Match against city, state, metro name, or id
-        if (query_lower in metro.city.lower() or
-            query_lower in metro.state.lower() or
-            query_lower in metro.metro_name.lower() or
-            query_lower in metro.id.lower()):
-            matches.append(metro)
+    # City-prefix matches outrank everything else, so when there are enough
+    # of them the top results come from that run alone
+    prefix_matches = _city_prefix_matches(query_lower)
+    if len(prefix_matches) >= limit:
+        matches = sorted(
+            (not _SEARCH_INDEX[index][1].startswith(query_lower), _SEARCH_INDEX[index][0], index)
+            for index in prefix_matches
+        )
+        return [_SEARCH_INDEX[index][3] for *_, index in matches[:limit]]
 
     # Sort by relevance (starts with query first, then alphabetically)
-    matches.sort(key=lambda m: (
-        not m.city.lower().startswith(query_lower),
-        not m.metro_name.lower().startswith(query_lower),
-        m.city.lower()
-    ))
+    matches = sorted(
+        (
+            not city_lower.startswith(query_lower),
+            not metro_name_lower.startswith(query_lower),
+            city_lower,
+            index,
+        )
+        for index, (city_lower, metro_name_lower, haystack, _) in enumerate(_SEARCH_INDEX)
+        if query_lower in haystack
+    )
 
-    return matches[:limit]
+    return [_SEARCH_INDEX[index][3] for *_, index in matches[:limit]]
 
 
 def get_metro_by_id(metro_id: str) -> Optional[MetroInfo]:
     """Get metro info by ID."""
-    metro_id_lower = metro_id.lower()
-    for metro in US_METROS:
-        if metro.id == metro_id_lower:
-            return metro
-    return None
+    return _METROS_BY_ID.get(metro_id.lower())
 
 
 def get_supported_metros() -> list[MetroInfo]:
@@ -9,6 +9,7 @@ This provider wraps Realtor.com data and provides reliable property search.
 
 import os
 import json
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -61,6 +62,12 @@ def normalize_property_type(raw_type: str) -> str:
     return PROPERTY_TYPE_MAP.get(normalized, "other")
 
 
+# Size suffixes on CDN photo filenames, e.g. "-w480_h360" or "-m1024x768"
+_PHOTO_SIZE_RE = re.compile(r'-[wm]?\d+[x_]?h?\d*w?(?=\.)')
+# Single-letter size suffixes: -s, -m, -l, -o
+_PHOTO_LETTER_SIZE_RE = re.compile(r'-[smlo](?=\.jpg|\.png|\.webp)', re.IGNORECASE)
+
+
 # Usage tracking file
 USAGE_FILE = Path(__file__).parent.parent.parent.parent / ".api_usage_listings.json"
 
@@ -303,12 +310,9 @@ class USRealEstateListingsProvider(BaseProvider):
             base_url = base_url.split("?")[0]
             # Remove size suffixes to get base image ID
             # e.g., "...abc123-w480_h360.jpg" and "...abc123-w1024_h768.jpg" -> same base
-            import re
-            # Remove common size patterns from the filename
-            normalized = re.sub(r'-[wm]?\d+[x_]?h?\d*w?(?=\.)', '', base_url)
+            normalized = _PHOTO_SIZE_RE.sub('', base_url)
             # Also remove -s, -m, -l, -o size suffixes
-            normalized = re.sub(r'-[smlo](?=\.jpg|\.png|\.webp)', '', normalized, flags=re.IGNORECASE)
-            return normalized
+            return _PHOTO_LETTER_SIZE_RE.sub('', normalized)
 
         def normalize_photo_url(url: str) -> str:
             """Normalize photo URL to use https."""
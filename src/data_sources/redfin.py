@@ -14,10 +14,14 @@ Data includes:
 - Price drops
 """
 
+import asyncio
 import csv
 import io
+import os
+import time
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 import httpx
 
@@ -32,6 +36,9 @@ DATA_TYPES = {
     "county": "county_market_tracker.tsv000.gz",
 }
 
+# Downloaded files are kept here so restarts and other workers can reuse them
+DISK_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "redfin"
+
 
 @dataclass
 class RedfinMarketData:
@@ -93,33 +100,54 @@ class RedfinDataCenter:
     def __init__(self, cache_ttl: int = 3600):
         self.cache_ttl = cache_ttl
         self._cache: dict[str, tuple[datetime, list]] = {}
+        # Serializes cold-cache downloads so concurrent lookups share one fetch
+        self._fetch_lock = asyncio.Lock()
         self._client = httpx.AsyncClient(timeout=60.0)
 
     async def close(self):
         """Close the HTTP client."""
         await self._client.aclose()
 
+    def _get_cached(self, cache_key: str) -> Optional[list[dict]]:
+        """Return cached rows if still within the TTL."""
+        if cache_key in self._cache:
+            cached_time, cached_data = self._cache[cache_key]
+            if (datetime.utcnow() - cached_time).total_seconds() < self.cache_ttl:
+                return cached_data
+        return None
+
     async def _fetch_data(self, data_type: str = "metro") -> list[dict]:
         """Fetch and parse Redfin data."""
         cache_key = f"redfin_{data_type}"
 
-        # Check cache
-        if cache_key in self._cache:
-            cached_time, cached_data = self._cache[cache_key]
-            if (datetime.utcnow() - cached_time).seconds < self.cache_ttl:
-                return cached_data
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        async with self._fetch_lock:
+            # Another caller may have filled the cache while we waited
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+            return await self._download(data_type, cache_key)
 
-        # Fetch data
+    async def _download(self, data_type: str, cache_key: str) -> list[dict]:
+        """Download, parse and cache a Redfin data file."""
         filename = DATA_TYPES.get(data_type, DATA_TYPES["metro"])
         url = f"{REDFIN_BASE_URL}/{filename}"
+        disk_path = DISK_CACHE_DIR / filename
 
         try:
-            response = await self._client.get(url)
-            response.raise_for_status()
+            raw = await asyncio.to_thread(self._read_disk_cache, disk_path)
+            if raw is None:
+                response = await self._client.get(url)
+                response.raise_for_status()
+                raw = response.content
+                await asyncio.to_thread(self._write_disk_cache, disk_path, raw)
 
             # Decompress if gzipped
             import gzip
-            content = gzip.decompress(response.content).decode("utf-8")
+            content = gzip.decompress(raw).decode("utf-8")
 
             # Parse TSV
             reader = csv.DictReader(io.StringIO(content), delimiter="\t")
@@ -134,6 +162,25 @@ class RedfinDataCenter:
             print(f"Error fetching Redfin data: {e}")
             return []
 
+    def _read_disk_cache(self, path: Path) -> Optional[bytes]:
+        """Return a previously downloaded file if it is within the TTL."""
+        try:
+            if time.time() - path.stat().st_mtime < self.cache_ttl:
+                return path.read_bytes()
+        except OSError:
+            pass
+        return None
+
+    def _write_disk_cache(self, path: Path, raw: bytes) -> None:
+        """Save a downloaded file, replacing any older copy atomically."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(raw)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not cache Redfin data: {e}")
+
     def _parse_row(self, row: dict) -> Optional[RedfinMarketData]:
         """Parse a row from the TSV data."""
         try:
@@ -10,6 +10,7 @@ Supported sites:
 - Realtor.com (realtor.com)
 """
 
+import hashlib
 import re
 from dataclasses import dataclass
 from datetime import datetime
@@ -147,8 +148,8 @@ class ParsedProperty:
             PropertyStatus.ACTIVE
         )
 
-        # Generate ID from URL
-        prop_id = f"{self.source}_{hash(self.url) % 1000000:06d}"
+        # Generate a stable ID from the URL
+        prop_id = f"{self.source}_{hashlib.blake2b(self.url.encode(), digest_size=8).hexdigest()}"
 
         return Property(
             id=prop_id,
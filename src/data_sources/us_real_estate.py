@@ -228,17 +228,20 @@ class USRealEstateClient:
         api_key: Optional[str] = None,
         api_host: Optional[str] = None,
         monthly_limit: int = 300,
+        client: Optional[httpx.AsyncClient] = None,
     ):
         self.api_key = api_key or os.environ.get("RAPIDAPI_KEY", "")
         self.api_host = api_host or os.environ.get("RAPIDAPI_HOST", "us-real-estate.p.rapidapi.com")
         self.monthly_limit = monthly_limit
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(timeout=30.0)
         self._cache: dict[str, tuple[datetime, any]] = {}
         self._usage = self._load_usage()
 
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client (a shared client is left open for its owner)."""
+        if self._owns_client:
+            await self._client.aclose()
 
     @property
     def has_api_key(self) -> bool:
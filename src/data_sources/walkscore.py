@@ -13,6 +13,8 @@ from datetime import datetime
 from typing import Optional
 import httpx
 
+from src.data_sources.cache import geo_cached
+
 WALKSCORE_BASE_URL = "https://api.walkscore.com"
 
 
@@ -53,6 +55,14 @@ class WalkScoreResult:
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "WalkScoreResult":
+        """Rebuild from a dictionary produced by to_dict()."""
+        values = dict(data)
+        if values.get("last_updated"):
+            values["last_updated"] = datetime.fromisoformat(values["last_updated"])
+        return cls(**values)
+
 
 # Score descriptions based on Walk Score methodology
 WALK_SCORE_DESCRIPTIONS = {
@@ -108,21 +118,29 @@ class WalkScoreClient:
         print(f"Bike Score: {result.bike_score}")
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize Walk Score client.
 
         Args:
             api_key: Walk Score API key. If not provided, uses WALKSCORE_API_KEY env var.
+            client: Shared HTTP client to reuse. If not provided, one is created
+                and closed by close().
         """
         self.api_key = api_key or os.environ.get("WALKSCORE_API_KEY", "")
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(timeout=30.0)
         self._cache: dict[str, tuple[datetime, WalkScoreResult]] = {}
         self._cache_ttl = 604800  # 7 days (Walk Scores rarely change)
 
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client (a shared client is left open for its owner)."""
+        if self._owns_client:
+            await self._client.aclose()
 
     @property
     def has_api_key(self) -> bool:
@@ -134,6 +152,13 @@ class WalkScoreClient:
         # Round to 4 decimal places (~11 meter precision)
         return f"{round(latitude, 4)}_{round(longitude, 4)}"
 
+    @geo_cached(
+        "walkscore",
+        "scores",
+        ttl_hours=168,  # 7 days
+        from_dict=WalkScoreResult.from_dict,
+        should_cache=lambda r: r.walk_score is not None,
+    )
     async def get_scores(
         self,
         address: str,
@@ -1,13 +1,14 @@
 """SQLAlchemy ORM models for SQLite persistence."""
 
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 import uuid
-import json
 
+import orjson
 from sqlalchemy import (
-    Column, String, Boolean, Float, Integer, DateTime, Text, JSON,
-    create_engine, event
+    Column, String, Boolean, Float, Integer, DateTime, Text, JSON, Index,
+    Computed, create_engine, event, text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -53,6 +54,13 @@ class MarketDB(Base):
         return f"<Market {self.name}, {self.state}>"
 
 
+# What scripts/cleanup_test_data.py treats as test data, as a SQL expression
+TEST_DATA_SQL = (
+    "lower(address) LIKE '%test%' OR source = 'test' "
+    "OR (lower(address) LIKE '123 %' AND lower(city) LIKE '%test%')"
+)
+
+
 class SavedPropertyDB(Base):
     """
     Saved/analyzed property with full analysis data.
@@ -63,6 +71,12 @@ class SavedPropertyDB(Base):
     - Tier 3 (Enriched): Persisted properties with all data + user customizations
     """
     __tablename__ = 'saved_properties'
+    __table_args__ = (
+        # Matches get_saved_properties: filter by status/favorite, newest first
+        Index('ix_saved_properties_status_fav_created', 'pipeline_status', 'is_favorite', 'created_at'),
+        # Partial index: only test rows are indexed
+        Index('ix_saved_properties_is_test_data', 'is_test_data', sqlite_where=text('is_test_data = 1')),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
 
@@ -122,6 +136,9 @@ class SavedPropertyDB(Base):
     tags = Column(JSON)  # User-defined tags for organization
     is_favorite = Column(Boolean, default=False)
 
+    # Derived by SQLite from address/source/city; never written directly
+    is_test_data = Column(Boolean, Computed(TEST_DATA_SQL, persisted=False))
+
     # Analysis timestamps
     last_analyzed = Column(DateTime)
     location_data_fetched = Column(DateTime)  # When location data was last refreshed
@@ -133,6 +150,11 @@ class SavedPropertyDB(Base):
     def __repr__(self):
         return f"<SavedProperty {self.address}, {self.city}>"
 
+    @property
+    def full_address(self) -> str:
+        """Return full formatted address."""
+        return f"{self.address}, {self.city}, {self.state} {self.zip_code or ''}".rstrip()
+
     def needs_location_refresh(self, max_age_days: int = 30) -> bool:
         """Check if location data needs refreshing."""
         if not self.location_data_fetched:
@@ -205,9 +227,16 @@ class ApiCallLogDB(Base):
         return f"<ApiCallLog {self.provider}:{self.endpoint}>"
 
 
+# Jobs whose payload references a "test" value (e.g. a test property ID)
+TEST_JOB_SQL = """payload LIKE '%"test"%'"""
+
+
 class JobDB(Base):
     """Background job queue for async tasks."""
     __tablename__ = 'jobs'
+    __table_args__ = (
+        Index('ix_jobs_is_test', 'is_test', sqlite_where=text('is_test = 1')),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
 
@@ -232,6 +261,9 @@ class JobDB(Base):
     attempts = Column(Integer, default=0)
     max_attempts = Column(Integer, default=3)
 
+    # Derived by SQLite from payload; never written directly
+    is_test = Column(Boolean, Computed(TEST_JOB_SQL, persisted=False))
+
     def __repr__(self):
         return f"<Job {self.job_type} ({self.status})>"
 
@@ -640,6 +672,20 @@ def get_database_path() -> str:
     return str(db_path)
 
 
+def _json_default(value):
+    """Fallback for types orjson doesn't serialize natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _json_serializer(value) -> str:
+    """Serialize JSON columns with orjson (handles datetimes, enums, dataclasses)."""
+    return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def get_engine(db_path: Optional[str] = None):
     """Get SQLAlchemy engine."""
     if db_path is None:
@@ -648,7 +694,9 @@ def get_engine(db_path: Optional[str] = None):
     engine = create_engine(
         f"sqlite:///{db_path}",
         echo=False,
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
     )
 
     # Enable foreign keys for SQLite
@@ -698,6 +746,42 @@ def _run_migrations(engine):
                 connection.commit()
                 print("Migration: Added due_diligence_report column to saved_properties")
 
+            # Migration 3: Virtual is_test_data column for test-data cleanup
+            if 'is_test_data' not in columns:
+                connection.execute(text(
+                    "ALTER TABLE saved_properties ADD COLUMN is_test_data BOOLEAN "
+                    f"GENERATED ALWAYS AS ({TEST_DATA_SQL}) VIRTUAL"
+                ))
+                connection.commit()
+                print("Migration: Added is_test_data column to saved_properties")
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_saved_properties_is_test_data "
+                "ON saved_properties (is_test_data) WHERE is_test_data = 1"
+            ))
+            connection.commit()
+
+            # Migration 4: Index for filtered saved-property listings
+            # (create_all only creates indexes along with new tables)
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_saved_properties_status_fav_created "
+                "ON saved_properties (pipeline_status, is_favorite, created_at)"
+            ))
+            connection.commit()
+
+        # Migration 5: Virtual is_test column on jobs for test-data cleanup
+        if 'jobs' in inspector.get_table_names():
+            job_columns = [col['name'] for col in inspector.get_columns('jobs')]
+            if 'is_test' not in job_columns:
+                connection.execute(text(
+                    f"ALTER TABLE jobs ADD COLUMN is_test BOOLEAN GENERATED ALWAYS AS ({TEST_JOB_SQL}) VIRTUAL"
+                ))
+                connection.commit()
+                print("Migration: Added is_test column to jobs")
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_jobs_is_test ON jobs (is_test) WHERE is_test = 1"
+            ))
+            connection.commit()
+
     except Exception as e:
         print(f"Migration warning: {e}")
     finally:
@@ -2,9 +2,8 @@
 
 from datetime import datetime, timedelta
 from typing import Optional, List
-import json
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy.orm.attributes import flag_modified
 
 from src.db.repository import DealRepository
@@ -18,6 +17,33 @@ from src.models.property import Property
 from src.models.market import Market
 
 
+# Columns needed for saved-property list views; skips the large JSON blobs
+SAVED_PROPERTY_LIST_COLUMNS = (
+    SavedPropertyDB.id,
+    SavedPropertyDB.address,
+    SavedPropertyDB.city,
+    SavedPropertyDB.state,
+    SavedPropertyDB.zip_code,
+    SavedPropertyDB.list_price,
+    SavedPropertyDB.estimated_rent,
+    SavedPropertyDB.bedrooms,
+    SavedPropertyDB.bathrooms,
+    SavedPropertyDB.sqft,
+    SavedPropertyDB.property_type,
+    SavedPropertyDB.source,
+    SavedPropertyDB.source_url,
+    SavedPropertyDB.overall_score,
+    SavedPropertyDB.cash_flow,
+    SavedPropertyDB.cash_on_cash,
+    SavedPropertyDB.cap_rate,
+    SavedPropertyDB.pipeline_status,
+    SavedPropertyDB.is_favorite,
+    SavedPropertyDB.notes,
+    SavedPropertyDB.created_at,
+    SavedPropertyDB.updated_at,
+)
+
+
 class SQLiteRepository(DealRepository):
     """SQLite-backed repository for persistent storage."""
 
@@ -76,7 +102,7 @@ class SQLiteRepository(DealRepository):
             existing.list_price = deal.property.list_price
             existing.estimated_rent = deal.property.estimated_rent
             existing.pipeline_status = deal.pipeline_status.value
-            existing.analysis_data = deal.model_dump(mode='json')
+            existing.analysis_data = deal.model_dump()
             existing.overall_score = deal.score.overall_score if deal.score else None
             existing.cash_flow = cash_flow
             existing.cash_on_cash = cash_on_cash
@@ -100,7 +126,7 @@ class SQLiteRepository(DealRepository):
                 year_built=deal.property.year_built,
                 source=deal.property.source,
                 source_url=deal.property.source_url,
-                analysis_data=deal.model_dump(mode='json'),
+                analysis_data=deal.model_dump(),
                 overall_score=deal.score.overall_score if deal.score else None,
                 cash_flow=cash_flow,
                 cash_on_cash=cash_on_cash,
@@ -244,7 +270,7 @@ class SQLiteRepository(DealRepository):
             market_db.name = market.name
             market_db.state = market.state
             market_db.metro = market.metro
-            market_db.market_data = market.model_dump(mode='json')
+            market_db.market_data = market.model_dump()
             market_db.overall_score = metrics.overall_score
             market_db.cash_flow_score = metrics.cash_flow_score
             market_db.growth_score = metrics.growth_score
@@ -256,7 +282,7 @@ class SQLiteRepository(DealRepository):
                 state=market.state,
                 metro=market.metro,
                 region=market.region,
-                market_data=market.model_dump(mode='json'),
+                market_data=market.model_dump(),
                 overall_score=metrics.overall_score,
                 cash_flow_score=metrics.cash_flow_score,
                 growth_score=metrics.growth_score,
@@ -394,10 +420,18 @@ class SQLiteRepository(DealRepository):
         status: Optional[str] = None,
         is_favorite: Optional[bool] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        list_view: bool = False,
     ) -> List[SavedPropertyDB]:
-        """Get saved properties with filters."""
+        """
+        Get saved properties with filters.
+
+        With list_view=True only SAVED_PROPERTY_LIST_COLUMNS are loaded;
+        other columns load lazily if accessed.
+        """
         query = self.session.query(SavedPropertyDB)
+        if list_view:
+            query = query.options(load_only(*SAVED_PROPERTY_LIST_COLUMNS))
 
         if status:
             query = query.filter_by(pipeline_status=status)
@@ -456,6 +490,30 @@ class SQLiteRepository(DealRepository):
             self.session.commit()
         return prop
 
+    def update_saved_property(
+        self,
+        property_id: str,
+        pipeline_status: Optional[str] = None,
+        is_favorite: Optional[bool] = None,
+        note: Optional[str] = None,
+    ) -> Optional[SavedPropertyDB]:
+        """Apply status, favorite and note changes to a property in one commit."""
+        prop = self.session.query(SavedPropertyDB).filter_by(id=property_id).first()
+        if not prop:
+            return None
+
+        now = datetime.utcnow()
+        if pipeline_status is not None:
+            prop.pipeline_status = pipeline_status
+        if is_favorite is not None:
+            prop.is_favorite = is_favorite
+        if note:
+            timestamp = now.strftime("%Y-%m-%d %H:%M")
+            prop.notes = f"{prop.notes or ''}\n[{timestamp}] {note}".strip()
+        prop.updated_at = now
+        self.session.commit()
+        return prop
+
     # ==================== Jobs ====================
 
     def enqueue_job(
@@ -595,22 +653,25 @@ class SQLiteRepository(DealRepository):
         from datetime import timezone
         cutoff = datetime.now(timezone.utc) - timedelta(minutes=timeout_minutes)
 
-        stuck_jobs = (
+        # The worker calls this every poll; one UPDATE, no rows loaded
+        failed = (
             self.session.query(JobDB)
             .filter(
                 JobDB.status == 'running',
                 JobDB.started_at < cutoff
             )
-            .all()
+            .update(
+                {
+                    JobDB.status: 'failed',
+                    JobDB.error: f"Job timed out after {timeout_minutes} minutes",
+                    JobDB.completed_at: datetime.now(timezone.utc),
+                },
+                synchronize_session='fetch',
+            )
         )
 
-        for job in stuck_jobs:
-            job.status = 'failed'
-            job.error = f"Job timed out after {timeout_minutes} minutes"
-            job.completed_at = datetime.now(timezone.utc)
-
         self.session.commit()
-        return len(stuck_jobs)
+        return failed
 
     def get_job_stats(self) -> dict:
         """Get job queue statistics."""
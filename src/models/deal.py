@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from src.models.property import Property
 from src.models.financials import Financials, FinancialMetrics
@@ -207,8 +207,16 @@ class Deal(BaseModel):
     last_analyzed: Optional[datetime] = None
     status_updated: datetime = Field(default_factory=datetime.utcnow)
 
-    def analyze(self) -> "Deal":
-        """Run financial analysis and scoring."""
+    _analyzed: bool = PrivateAttr(default=False)
+
+    def analyze(self, force: bool = False) -> "Deal":
+        """Run financial analysis and scoring.
+
+        Repeat calls are no-ops; pass force=True after changing inputs.
+        """
+        if self._analyzed and not force:
+            return self
+
         if not self.financials:
             # Create financials from property data
             self.financials = Financials(
@@ -230,7 +238,9 @@ class Deal(BaseModel):
 
         # Calculate market metrics if market data available
         if self.market:
-            self.market_metrics = MarketMetrics.from_market(self.market)
+            # Batch callers pass in metrics already derived from the same market
+            if self.market_metrics is None or force:
+                self.market_metrics = MarketMetrics.from_market(self.market)
 
             # Calculate deal score
             self.score = DealScore.calculate(
@@ -244,6 +254,7 @@ class Deal(BaseModel):
 
         self.last_analyzed = datetime.utcnow()
         self.pipeline_status = DealPipeline.ANALYZED
+        self._analyzed = True
 
         return self
 
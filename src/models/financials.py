@@ -1,5 +1,6 @@
 """Financial modeling data structures."""
 
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import BaseModel, Field, computed_field
@@ -65,67 +66,148 @@ class Financials(BaseModel):
 
     def calculate(self) -> "Financials":
         """Calculate all financial metrics."""
-        # Initial investment
-        self.down_payment = self.purchase_price * self.loan.down_payment_pct
-        self.loan_amount = self.purchase_price - self.down_payment
-        self.closing_costs = self.purchase_price * self.loan.closing_cost_pct
-        self.total_cash_needed = self.down_payment + self.closing_costs
-
-        # Monthly mortgage payment (P&I)
-        if self.loan_amount > 0:
-            monthly_rate = self.loan.interest_rate / 12
-            n_payments = self.loan.loan_term_years * 12
-            if monthly_rate > 0:
-                self.monthly_mortgage = self.loan_amount * (
-                    monthly_rate * (1 + monthly_rate) ** n_payments
-                ) / ((1 + monthly_rate) ** n_payments - 1)
-            else:
-                self.monthly_mortgage = self.loan_amount / n_payments
-        else:
-            self.monthly_mortgage = 0
-
-        # Monthly operating expenses
-        self.monthly_taxes = (self.purchase_price * self.expenses.property_tax_rate) / 12
-        if self.expenses.insurance_annual:
-            self.monthly_insurance = self.expenses.insurance_annual / 12
-        else:
-            self.monthly_insurance = (self.purchase_price * self.expenses.insurance_rate) / 12
-        self.monthly_maintenance = (self.purchase_price * self.expenses.maintenance_rate) / 12
-        self.monthly_capex = (self.purchase_price * self.expenses.capex_rate) / 12
-        self.monthly_vacancy_reserve = self.estimated_rent * self.expenses.vacancy_rate
-        self.monthly_property_management = self.estimated_rent * self.expenses.property_management_rate
-
-        # Total expenses
-        self.total_monthly_expenses = (
-            self.monthly_mortgage
-            + self.monthly_taxes
-            + self.monthly_insurance
-            + self.expenses.hoa_monthly
-            + self.monthly_maintenance
-            + self.monthly_capex
-            + self.monthly_vacancy_reserve
-            + self.monthly_property_management
-            + self.expenses.utilities_monthly
+        loan = self.loan
+        expenses = self.expenses
+        values = _calculate_core(
+            self.purchase_price,
+            self.estimated_rent,
+            loan.down_payment_pct,
+            loan.interest_rate,
+            loan.loan_term_years,
+            loan.closing_cost_pct,
+            expenses.property_tax_rate,
+            expenses.insurance_annual,
+            expenses.insurance_rate,
+            expenses.hoa_monthly,
+            expenses.maintenance_rate,
+            expenses.property_management_rate,
+            expenses.vacancy_rate,
+            expenses.capex_rate,
+            expenses.utilities_monthly,
         )
+        for name, value in zip(_CALCULATED_FIELDS, values):
+            setattr(self, name, value)
+        return self
 
-        # NOI (before debt service)
-        annual_gross_rent = self.estimated_rent * 12
-        annual_vacancy = annual_gross_rent * self.expenses.vacancy_rate
-        annual_operating_expenses = (
-            (self.monthly_taxes * 12)
-            + (self.monthly_insurance * 12)
-            + (self.expenses.hoa_monthly * 12)
-            + (self.monthly_maintenance * 12)
-            + (self.monthly_property_management * 12)
-            + (self.expenses.utilities_monthly * 12)
-        )
-        self.net_operating_income = annual_gross_rent - annual_vacancy - annual_operating_expenses
 
-        # Cash flow
-        self.monthly_cash_flow = self.estimated_rent - self.total_monthly_expenses
-        self.annual_cash_flow = self.monthly_cash_flow * 12
+# Output order of _calculate_core
+_CALCULATED_FIELDS = (
+    "down_payment",
+    "loan_amount",
+    "closing_costs",
+    "total_cash_needed",
+    "monthly_mortgage",
+    "monthly_taxes",
+    "monthly_insurance",
+    "monthly_maintenance",
+    "monthly_capex",
+    "monthly_vacancy_reserve",
+    "monthly_property_management",
+    "total_monthly_expenses",
+    "net_operating_income",
+    "monthly_cash_flow",
+    "annual_cash_flow",
+)
+
+
+@lru_cache(maxsize=4096)
+def _calculate_core(
+    price: float,
+    rent: float,
+    down_payment_pct: float,
+    interest_rate: float,
+    loan_term_years: int,
+    closing_cost_pct: float,
+    property_tax_rate: float,
+    insurance_annual: Optional[float],
+    insurance_rate: float,
+    hoa_monthly: float,
+    maintenance_rate: float,
+    property_management_rate: float,
+    vacancy_rate: float,
+    capex_rate: float,
+    utilities_monthly: float,
+) -> tuple:
+    """
+    Pure math behind Financials.calculate, memoized on its inputs.
+
+    Re-scoring the same listing (other markets, reanalysis) reuses the result.
+    Returns values in _CALCULATED_FIELDS order.
+    """
+    # Initial investment
+    down_payment = price * down_payment_pct
+    loan_amount = price - down_payment
+    closing_costs = price * closing_cost_pct
+
+    # Monthly mortgage payment (P&I)
+    if loan_amount > 0:
+        monthly_rate = interest_rate / 12
+        n_payments = loan_term_years * 12
+        if monthly_rate > 0:
+            growth = (1 + monthly_rate) ** n_payments
+            monthly_mortgage = loan_amount * (monthly_rate * growth) / (growth - 1)
+        else:
+            monthly_mortgage = loan_amount / n_payments
+    else:
+        monthly_mortgage = 0
+
+    # Monthly operating expenses
+    monthly_taxes = (price * property_tax_rate) / 12
+    if insurance_annual:
+        monthly_insurance = insurance_annual / 12
+    else:
+        monthly_insurance = (price * insurance_rate) / 12
+    monthly_maintenance = (price * maintenance_rate) / 12
+    monthly_capex = (price * capex_rate) / 12
+    monthly_vacancy_reserve = rent * vacancy_rate
+    monthly_property_management = rent * property_management_rate
+
+    # Total expenses
+    total_monthly_expenses = (
+        monthly_mortgage
+        + monthly_taxes
+        + monthly_insurance
+        + hoa_monthly
+        + monthly_maintenance
+        + monthly_capex
+        + monthly_vacancy_reserve
+        + monthly_property_management
+        + utilities_monthly
+    )
+
+    # NOI (before debt service)
+    annual_gross_rent = rent * 12
+    annual_vacancy = annual_gross_rent * vacancy_rate
+    annual_operating_expenses = (
+        (monthly_taxes * 12)
+        + (monthly_insurance * 12)
+        + (hoa_monthly * 12)
+        + (monthly_maintenance * 12)
+        + (monthly_property_management * 12)
+        + (utilities_monthly * 12)
+    )
+    net_operating_income = annual_gross_rent - annual_vacancy - annual_operating_expenses
 
-        return self
+    # Cash flow
+    monthly_cash_flow = rent - total_monthly_expenses
+
+    return (
+        down_payment,
+        loan_amount,
+        closing_costs,
+        down_payment + closing_costs,
+        monthly_mortgage,
+        monthly_taxes,
+        monthly_insurance,
+        monthly_maintenance,
+        monthly_capex,
+        monthly_vacancy_reserve,
+        monthly_property_management,
+        total_monthly_expenses,
+        net_operating_income,
+        monthly_cash_flow,
+        monthly_cash_flow * 12,
+    )
 
 
 class FinancialMetrics(BaseModel):
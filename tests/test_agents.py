@@ -48,7 +48,7 @@ class TestMarketResearchAgent:
 
         assert len(top) == 3
         # Should be sorted by cash flow score
-        assert top[0]["cash_flow_score"] >= top[1]["cash_flow_score"]
+        assert top[0].cash_flow_score >= top[1].cash_flow_score
 
 
 class TestDealAnalyzerAgent:
@@ -91,6 +91,34 @@ class TestDealAnalyzerAgent:
         assert result.success
         assert result.data["total_analyzed"] == 2
 
+    @pytest.mark.asyncio
+    async def test_deals_do_not_share_default_assumptions(self):
+        """Test that editing one deal's loan terms leaves other deals alone."""
+        properties = [
+            Property(
+                id=f"test_{i}",
+                address=f"{i} Test St",
+                city="Indianapolis",
+                state="IN",
+                zip_code="46201",
+                list_price=200000,
+                estimated_rent=1800,
+                bedrooms=3,
+                bathrooms=2,
+                source="test",
+            )
+            for i in range(2)
+        ]
+
+        agent = DealAnalyzerAgent()
+        first = await agent.analyze_property(properties[0])
+        first.financials.loan.interest_rate = 0.12
+        first.financials.expenses.vacancy_rate = 0.2
+        second = await agent.analyze_property(properties[1])
+
+        assert second.financials.loan.interest_rate != 0.12
+        assert second.financials.expenses.vacancy_rate != 0.2
+
     @pytest.mark.asyncio
     async def test_quick_screen(self):
         """Test quick screening of properties."""
@@ -128,6 +156,38 @@ class TestDealAnalyzerAgent:
         assert len(passed) == 1
         assert passed[0].id == "good_deal"
 
+    @pytest.mark.asyncio
+    async def test_pre_screen_keeps_ranked_deals(self):
+        """Pre-screening only skips properties the ranking filters would drop."""
+        properties = [
+            Property(
+                id=f"screen_{i}",
+                address=f"{i} Screen St",
+                city="Cleveland",
+                state="OH",
+                zip_code="44102",
+                list_price=price,
+                estimated_rent=rent,
+                bedrooms=2,
+                bathrooms=1,
+                source="test",
+            )
+            for i, (price, rent) in enumerate([
+                (100000, 1200),
+                (120000, 1300),
+                (300000, 1000),  # Far too little rent to reach the cap rate floor
+                (150000, None),
+            ])
+        ]
+
+        agent = DealAnalyzerAgent()
+        screened = await agent.run(properties)
+        full = await agent.run(properties, pre_screen=False)
+
+        assert [d.id for d in screened.data["deals"]] == [d.id for d in full.data["deals"]]
+        assert screened.data["pre_screened_out"] == 2
+        assert screened.data["total_analyzed"] == 4
+
 
 class TestMockScraper:
     """Tests for MockScraper."""
@@ -184,3 +244,95 @@ class TestPipelineAgent:
         assert result.data is not None
         assert result.data["markets_analyzed"] >= 1
         assert result.data["properties_scraped"] > 0
+
+
+class TestDueDiligenceFindingsCache:
+    """Tests for the structured findings cache."""
+
+    def test_round_trip_memory_and_disk(self, tmp_path, monkeypatch):
+        """Test findings survive both the memory and disk layers."""
+        from src.agents import dd_cache
+
+        monkeypatch.setattr(dd_cache, "FINDINGS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(dd_cache, "_memory_cache", type(dd_cache._memory_cache)())
+
+        key = dd_cache.findings_cache_key("model", 1, "research notes")
+        assert key != dd_cache.findings_cache_key("model", 2, "research notes")
+        assert dd_cache.get_cached_findings(key) is None
+
+        structured = {"executive_summary": "ok", "red_flags": [{"title": "Lien"}]}
+        dd_cache.cache_findings(key, structured)
+
+        hit = dd_cache.get_cached_findings(key)
+        assert hit == structured
+        hit["red_flags"].clear()  # Callers get their own copy
+        assert dd_cache.get_cached_findings(key) == structured
+
+        dd_cache._memory_cache.clear()
+        assert dd_cache.get_cached_findings(key) == structured
+
+    def test_report_key_ignores_address_formatting(self, tmp_path, monkeypatch):
+        """Test that spelling variants of one address share a cached report."""
+        from src.agents import dd_cache
+
+        monkeypatch.setattr(dd_cache, "REPORT_CACHE_DIR", tmp_path)
+
+        key = dd_cache.report_cache_key("123 North Main Street", "Austin", "TX", "78701-1234")
+        assert key == dd_cache.report_cache_key("123 N. Main St", "austin", "tx", "78701")
+        assert key != dd_cache.report_cache_key("125 N Main St", "Austin", "TX", "78701")
+
+        dd_cache.cache_report(key, {"status": "completed"})
+        assert dd_cache.get_cached_report(key) == {"status": "completed"}
+
+        monkeypatch.setattr(dd_cache, "REPORT_CACHE_TTL_SECONDS", 0)
+        assert dd_cache.get_cached_report(key) is None
+
+
+class TestDueDiligenceScout:
+    """Tests for reading the scout's research-depth rating."""
+
+    @pytest.mark.parametrize("reply, rating", [
+        ("3", 3),
+        ("  4\n", 4),
+        ("Rating: 3/5", 3),
+        ("I would rate this 2 out of 5.", 2),
+        ("Rated 1 / 5 overall", 1),
+        ("Searched 2020 county records for 1234 Main St.\n2", 2),
+        ("No rating available", None),
+        ("2.5", None),
+    ])
+    def test_parse_scout_rating(self, reply, rating):
+        """Test that the scale in "x/5" replies is not read as the rating."""
+        from src.agents.due_diligence import _parse_scout_rating
+
+        assert _parse_scout_rating(reply) == rating
+
+
+class TestDueDiligenceParseFindings:
+    """Tests for structuring research notes into findings."""
+
+    @pytest.mark.asyncio
+    async def test_unparseable_reply_marks_report_unstructured(self, tmp_path, monkeypatch):
+        """Test that a failed structuring call leaves the raw notes for readers."""
+        from types import SimpleNamespace
+
+        from src.agents import dd_cache
+        from src.agents.due_diligence import DueDiligenceAgent, DueDiligenceReport
+
+        monkeypatch.setattr(dd_cache, "FINDINGS_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(dd_cache, "_memory_cache", type(dd_cache._memory_cache)())
+
+        async def create(**kwargs):
+            return SimpleNamespace(content=[SimpleNamespace(type="text", text="not json")])
+
+        agent = DueDiligenceAgent()
+        agent._client = SimpleNamespace(messages=SimpleNamespace(create=create))
+        report = DueDiligenceReport(property_id="p1", property_address="1 Main St")
+        notes = "Searched county records. " * 40
+
+        await agent._parse_findings(notes, report)
+
+        assert report.structured is False
+        assert report.executive_summary == ""
+        assert report.raw_research_notes == notes
+        assert report.to_dict()["structured"] is False
@@ -573,3 +573,99 @@ class TestRecommendationGeneration:
 
         # Should have positive recommendations
         assert any("excellent" in r.lower() or "strong" in r.lower() for r in recommendations)
+
+
+class TestLocationFieldFreshness:
+    """Tests for per-provider location data TTL checks."""
+
+    def test_fresh_and_stale_fields(self):
+        """Test fields inside and outside their TTL."""
+        from datetime import timedelta
+        from api.services.property_analysis import location_field_fresh, WALK_SCORE_TTL
+
+        now = datetime(2024, 6, 1)
+        location_data = {
+            "walk_score_fetched_at": (now - timedelta(days=1)).isoformat(),
+            "flood_zone_fetched_at": (now - timedelta(days=8)).isoformat(),
+        }
+
+        assert location_field_fresh(location_data, "walk_score", WALK_SCORE_TTL, now)
+        assert not location_field_fresh(location_data, "flood_zone", WALK_SCORE_TTL, now)
+
+    def test_missing_or_invalid_timestamp(self):
+        """Test that missing or malformed timestamps count as stale."""
+        from api.services.property_analysis import location_field_fresh, FLOOD_ZONE_TTL
+
+        now = datetime(2024, 6, 1)
+
+        assert not location_field_fresh({}, "flood_zone", FLOOD_ZONE_TTL, now)
+        assert not location_field_fresh(
+            {"flood_zone_fetched_at": "not-a-date"}, "flood_zone", FLOOD_ZONE_TTL, now
+        )
+
+
+class TestSavedPropertyListItem:
+    """Tests for list-view saved property serialization."""
+
+    def test_list_item_matches_response_model(self):
+        """Test that list items carry every SavedPropertyResponse field."""
+        from api.routes.saved import SavedPropertyResponse, saved_property_list_item
+        from src.db.models import SavedPropertyDB
+
+        now = datetime(2024, 6, 1)
+        prop = SavedPropertyDB(
+            id="prop_1",
+            address="123 Main St",
+            city="Phoenix",
+            state="AZ",
+            list_price=250000,
+            overall_score=72.5,
+            created_at=now,
+            updated_at=now,
+        )
+
+        item = saved_property_list_item(prop)
+
+        assert set(item) == set(SavedPropertyResponse.model_fields)
+        assert item["pipeline_status"] == "analyzed"
+        assert item["is_favorite"] is False
+        assert SavedPropertyResponse(**item).overall_score == 72.5
+
+
+class TestSavedPropertyETag:
+    """Tests for conditional GETs on saved properties."""
+
+    def test_unchanged_property_returns_304(self, api_client):
+        """Test that a matching If-None-Match skips the body."""
+        from src.db.models import SavedPropertyDB
+
+        now = datetime(2024, 6, 1)
+        prop = SavedPropertyDB(
+            id="prop_1",
+            address="123 Main St",
+            city="Phoenix",
+            state="AZ",
+            list_price=250000,
+            created_at=now,
+            updated_at=now,
+        )
+        mock_repo = MagicMock()
+        mock_repo.get_saved_property.return_value = prop
+
+        with patch("api.routes.saved.get_repository", return_value=mock_repo):
+            response = api_client.get("/api/saved/properties/prop_1")
+            assert response.status_code == 200
+            etag = response.headers["ETag"]
+
+            cached = api_client.get(
+                "/api/saved/properties/prop_1", headers={"If-None-Match": etag}
+            )
+            assert cached.status_code == 304
+            assert cached.content == b""
+
+            prop.updated_at = datetime(2024, 6, 2)
+            changed = api_client.get(
+                "/api/saved/properties/prop_1", headers={"If-None-Match": etag}
+            )
+            assert changed.status_code == 200
+            assert changed.headers["ETag"] != etag
@@ -267,3 +267,66 @@ class TestDataAggregator:
             assert rent > 0
         finally:
             await aggregator.close()
+
+
+class TestGeoCached:
+    """Tests for the geo_cached decorator."""
+
+    @pytest.mark.asyncio
+    async def test_nearby_coordinates_hit_cache(self):
+        """Test coordinates within rounding precision reuse the cached result."""
+        from src.data_sources.cache import geo_cached
+        from src.data_sources.fema_flood import FloodZoneResult
+
+        calls = []
+
+        class FakeFloodClient:
+            @geo_cached(
+                "test_geo_cached",
+                "flood_zone",
+                ttl_hours=1,
+                from_dict=FloodZoneResult.from_dict,
+            )
+            async def get_flood_zone(self, latitude, longitude):
+                calls.append((latitude, longitude))
+                return FloodZoneResult(
+                    latitude=latitude,
+                    longitude=longitude,
+                    flood_zone="AE",
+                    risk_level="high",
+                    last_updated=datetime.utcnow(),
+                )
+
+        client = FakeFloodClient()
+        first = await client.get_flood_zone(33.44841, -112.07401)
+        second = await client.get_flood_zone(latitude=33.44839, longitude=-112.07398)
+
+        assert len(calls) == 1
+        assert second.flood_zone == first.flood_zone
+        assert isinstance(second.last_updated, datetime)
+
+    @pytest.mark.asyncio
+    async def test_rejected_results_not_cached(self):
+        """Test results failing should_cache are fetched again."""
+        from src.data_sources.cache import geo_cached
+        from src.data_sources.fema_flood import FloodZoneResult
+
+        calls = []
+
+        class FakeFloodClient:
+            @geo_cached(
+                "test_geo_cached_fallback",
+                "flood_zone",
+                ttl_hours=1,
+                from_dict=FloodZoneResult.from_dict,
+                should_cache=lambda r: r.flood_zone is not None,
+            )
+            async def get_flood_zone(self, latitude, longitude):
+                calls.append((latitude, longitude))
+                return FloodZoneResult(latitude=latitude, longitude=longitude)
+
+        client = FakeFloodClient()
+        await client.get_flood_zone(40.0, -75.0)
+        await client.get_flood_zone(40.0, -75.0)
+
+        assert len(calls) == 2
@@ -213,3 +213,30 @@ class TestDeal:
 
         # Should have pros/cons generated
         assert len(deal.pros) > 0 or len(deal.cons) > 0
+
+    def test_deal_analyze_is_idempotent_unless_forced(self):
+        """Repeat analyze() calls are skipped unless force=True."""
+        prop = Property(
+            id="deal_test_002",
+            address="200 Investment Way",
+            city="Indianapolis",
+            state="IN",
+            zip_code="46201",
+            list_price=180000,
+            estimated_rent=1600,
+            bedrooms=3,
+            bathrooms=2,
+            sqft=1400,
+            source="test",
+        )
+
+        deal = Deal(id="deal_002", property=prop)
+        deal.analyze()
+        first_cash_flow = deal.financial_metrics.monthly_cash_flow
+
+        deal.financials.estimated_rent = 2000
+        deal.analyze()
+        assert deal.financial_metrics.monthly_cash_flow == first_cash_flow
+
+        deal.analyze(force=True)
+        assert deal.financial_metrics.monthly_cash_flow > first_cash_flow
@@ -323,6 +323,24 @@ class TestSavedPropertiesRepository:
         assert "Test note 1" in updated.notes
         assert "Test note 2" in updated.notes
 
+    @pytest.mark.asyncio
+    async def test_update_saved_property(self, repository: SQLiteRepository, sample_deal: Deal):
+        """Test applying status, favorite and note changes together."""
+        sample_deal.is_favorite = False
+        await repository.save_deal(sample_deal)
+
+        updated = repository.update_saved_property(
+            sample_deal.id,
+            pipeline_status="shortlisted",
+            is_favorite=True,
+            note="Call the agent",
+        )
+        assert updated.pipeline_status == "shortlisted"
+        assert updated.is_favorite is True
+        assert "Call the agent" in updated.notes
+
+        assert repository.update_saved_property("missing_id", is_favorite=True) is None
+
 
 class TestJobRepository:
     """Tests for Job queue operations."""
@@ -433,7 +433,7 @@ export default function SavedPropertyDetailPage({
     if (!savedProperty) return;
     try {
       setLocationLoading(true);
-      const updated = await api.refreshPropertyLocationData(savedProperty.id);
+      const updated = await api.refreshPropertyLocationData(savedProperty.id, true);
       setSavedProperty(updated);
     } catch (err) {
       console.error("Failed to refresh location data:", err);
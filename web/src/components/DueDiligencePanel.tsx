@@ -331,6 +331,11 @@ export function DueDiligencePanel({
   const redFlagCount = report.red_flags?.length || 0;
   const yellowFlagCount = report.yellow_flags?.length || 0;
   const greenFlagCount = report.green_flags?.length || 0;
+  // Reports whose findings could not be structured only carry the raw notes
+  const executiveSummary =
+    report.structured === false
+      ? report.raw_research_notes?.slice(0, 2000)
+      : report.executive_summary;
 
   return (
     <div className="card">
@@ -363,7 +368,7 @@ export function DueDiligencePanel({
 
       <div className="space-y-4">
         {/* Executive Summary */}
-        {report.executive_summary && (
+        {executiveSummary && (
           <div>
             {renderSectionHeader(
               "summary",
@@ -373,7 +378,7 @@ export function DueDiligencePanel({
             {expandedSections.has("summary") && (
               <div className="mt-3 p-4 bg-gray-50 rounded-lg">
                 <p className="text-gray-700 whitespace-pre-wrap">
-                  {report.executive_summary}
+                  {executiveSummary}
                 </p>
               </div>
             )}
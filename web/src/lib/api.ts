@@ -823,8 +823,9 @@ class ApiClient {
   }
 
   // Property enrichment - Re-analyze and refresh location data
-  async refreshPropertyLocationData(propertyId: string): Promise<SavedProperty> {
-    return this.fetch(`/api/saved/properties/${propertyId}/refresh-location`, {
+  async refreshPropertyLocationData(propertyId: string, force = false): Promise<SavedProperty> {
+    const query = force ? "?force=true" : "";
+    return this.fetch(`/api/saved/properties/${propertyId}/refresh-location${query}`, {
       method: "POST",
     });
   }
@@ -2114,6 +2115,8 @@ export interface DueDiligenceReportData {
   inspection_focus_areas?: string[];
   findings?: DueDiligenceFindings;
   sources_consulted?: string[];
+  raw_research_notes?: string;
+  structured?: boolean;
   errors?: string[];
 }
 